@@ -75,6 +75,7 @@ from .types import (  # noqa: E402
     List,
     Null,
     Operation,
+    Param,
     QuotedSymbol,
     String,
     Symbol,
@@ -85,10 +86,18 @@ from .types import (  # noqa: E402
     Vector,
 )
 from .utils import (  # noqa: E402
+    EvalEvent,
+    HyperLogLog,
+    QuantileSketch,
+    add_eval_hook,
+    enable_slow_query_log,
     eval_obj,
     eval_str,
     python_to_ray,
     ray_to_python,
+    remove_eval_hook,
+    restore_env,
+    snapshot_env,
 )
 
 try:
@@ -112,11 +121,15 @@ __all__ = [
     "Column",
     "Date",
     "Dict",
+    "EvalEvent",
     "Expression",
     "Fn",
+    "HyperLogLog",
     "List",
     "Null",
     "Operation",
+    "Param",
+    "QuantileSketch",
     "QuotedSymbol",
     "RayforceArityError",
     "RayforceConversionError",
@@ -148,10 +161,15 @@ __all__ = [
     "Time",
     "Timestamp",
     "Vector",
+    "add_eval_hook",
     "core_version",
+    "enable_slow_query_log",
     "eval_obj",
     "eval_str",
     "python_to_ray",
     "ray_to_python",
+    "remove_eval_hook",
+    "restore_env",
+    "snapshot_env",
     "version",
 ]
@@ -62,7 +62,7 @@ def read_timestamp(obj: RayObject) -> Any: ...
 def read_guid(obj: RayObject) -> Any: ...
 def table_keys(table: RayObject) -> RayObject: ...
 def table_values(table: RayObject) -> RayObject: ...
-def repr_table(table: RayObject) -> str: ...
+def repr_table(table: RayObject, full: bool = ...) -> str: ...
 def dict_keys(dict_: RayObject) -> RayObject: ...
 def dict_values(dict_: RayObject) -> RayObject: ...
 def dict_get(dict_: RayObject, key: RayObject) -> RayObject: ...
@@ -86,11 +86,22 @@ def insert(table: RayObject, data: RayObject) -> RayObject: ...
 def upsert(table: RayObject, keys: RayObject, data: RayObject) -> RayObject: ...
 def read_csv(schema: RayObject | None, path: RayObject) -> RayObject: ...
 def write_csv(table: RayObject, path: RayObject) -> RayObject: ...
+def format_csv(
+    table: RayObject,
+    offset: int,
+    length: int,
+    separator: str,
+    quote: str,
+    null_value: str,
+    header: bool,
+) -> bytes: ...
 def set_splayed(dir_: RayObject, table: RayObject, sym_path: RayObject | None) -> RayObject: ...
 def get_splayed(dir_: RayObject, sym_path: RayObject | None) -> RayObject: ...
 def get_parted(root: RayObject, name: RayObject) -> RayObject: ...
 def ser_obj(obj: RayObject) -> RayObject: ...
 def de_obj(obj: RayObject) -> RayObject: ...
+def dump_obj(obj: RayObject, path: str) -> int: ...
+def load_obj(path: str) -> RayObject: ...
 def read_u8_vector(obj: RayObject) -> bytes: ...
 def read_vector_raw(obj: RayObject) -> bytes: ...
 def vec_is_null(vec: RayObject, idx: int) -> bool: ...
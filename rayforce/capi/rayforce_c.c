@@ -213,6 +213,9 @@ static PyMethodDef rayforce_methods[] = {
      "Read CSV file into table — (schema | None, path)"},
     {"write_csv", raypy_write_csv, METH_VARARGS,
      "Write table to CSV file — (table, path)"},
+    {"format_csv", raypy_format_csv, METH_VARARGS,
+     "Format table rows as CSV bytes — (table, offset, length, sep, quote, "
+     "null_repr, header)"},
     {"set_splayed", raypy_set_splayed, METH_VARARGS,
      "Save table to a splayed directory — (dir_str, table, sym_path | None)"},
     {"get_splayed", raypy_get_splayed, METH_VARARGS,
@@ -225,6 +228,10 @@ static PyMethodDef rayforce_methods[] = {
      "Serialize RayObject to binary format"},
     {"de_obj", raypy_de_obj, METH_VARARGS,
      "Deserialize binary format to RayObject"},
+    {"dump_obj", raypy_dump_obj, METH_VARARGS,
+     "Serialize RayObject straight to a file — (obj, path)"},
+    {"load_obj", raypy_load_obj, METH_VARARGS,
+     "Load a RayObject written by dump_obj — (path)"},
     {"read_u8_vector", raypy_read_u8_vector, METH_VARARGS,
      "Read U8 vector as bytes"},
     {"read_vector_raw", raypy_read_vector_raw, METH_VARARGS,
@@ -212,11 +212,14 @@ PyObject *raypy_insert(PyObject *self, PyObject *args);
 PyObject *raypy_upsert(PyObject *self, PyObject *args);
 PyObject *raypy_read_csv(PyObject *self, PyObject *args);
 PyObject *raypy_write_csv(PyObject *self, PyObject *args);
+PyObject *raypy_format_csv(PyObject *self, PyObject *args);
 PyObject *raypy_set_splayed(PyObject *self, PyObject *args);
 PyObject *raypy_get_splayed(PyObject *self, PyObject *args);
 PyObject *raypy_get_parted(PyObject *self, PyObject *args);
 PyObject *raypy_ser_obj(PyObject *self, PyObject *args);
 PyObject *raypy_de_obj(PyObject *self, PyObject *args);
+PyObject *raypy_dump_obj(PyObject *self, PyObject *args);
+PyObject *raypy_load_obj(PyObject *self, PyObject *args);
 PyObject *raypy_read_u8_vector(PyObject *self, PyObject *args);
 PyObject *raypy_read_vector_raw(PyObject *self, PyObject *args);
 PyObject *raypy_vec_is_null(PyObject *self, PyObject *args);
@@ -0,0 +1,317 @@
+#include "rayforce_c.h"
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+/* Growable byte buffer for one formatted CSV chunk. */
+typedef struct {
+  char *data;
+  size_t len;
+  size_t cap;
+} csv_buf_t;
+
+static int csv_buf_reserve(csv_buf_t *b, size_t extra) {
+  if (b->len + extra <= b->cap)
+    return 0;
+  size_t cap = b->cap == 0 ? 4096 : b->cap;
+  while (cap < b->len + extra)
+    cap *= 2;
+  char *data = realloc(b->data, cap);
+  if (data == NULL) {
+    PyErr_NoMemory();
+    return -1;
+  }
+  b->data = data;
+  b->cap = cap;
+  return 0;
+}
+
+static int csv_buf_put(csv_buf_t *b, const char *p, size_t n) {
+  if (csv_buf_reserve(b, n) < 0)
+    return -1;
+  memcpy(b->data + b->len, p, n);
+  b->len += n;
+  return 0;
+}
+
+static int csv_buf_putc(csv_buf_t *b, char c) { return csv_buf_put(b, &c, 1); }
+
+typedef struct {
+  char sep;
+  char quote;
+  const char *null_repr;
+  size_t null_len;
+} csv_opts_t;
+
+/* Emit a text field, quoting it (RFC 4180 style, quote char doubled) only when
+ * it contains the separator, the quote char or a line break. */
+static int csv_put_text(csv_buf_t *b, const char *p, size_t n,
+                        const csv_opts_t *o) {
+  int needs_quote = 0;
+  for (size_t i = 0; i < n; i++) {
+    char c = p[i];
+    if (c == o->sep || c == o->quote || c == '\n' || c == '\r') {
+      needs_quote = 1;
+      break;
+    }
+  }
+  if (!needs_quote)
+    return csv_buf_put(b, p, n);
+
+  if (csv_buf_putc(b, o->quote) < 0)
+    return -1;
+  for (size_t i = 0; i < n; i++) {
+    if (p[i] == o->quote && csv_buf_putc(b, o->quote) < 0)
+      return -1;
+    if (csv_buf_putc(b, p[i]) < 0)
+      return -1;
+  }
+  return csv_buf_putc(b, o->quote);
+}
+
+/* Days since 2000-01-01 -> proleptic Gregorian y/m/d (Hinnant's
+ * civil_from_days, shifted from the 1970 epoch). */
+static void civil_from_days(int64_t days, int64_t *y, unsigned *m,
+                            unsigned *d) {
+  int64_t z = days + 10957 + 719468;
+  int64_t era = (z >= 0 ? z : z - 146096) / 146097;
+  unsigned doe = (unsigned)(z - era * 146097);
+  unsigned yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+  unsigned doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+  unsigned mp = (5 * doy + 2) / 153;
+  *d = doy - (153 * mp + 2) / 5 + 1;
+  *m = mp < 10 ? mp + 3 : mp - 9;
+  *y = (int64_t)yoe + era * 400 + (*m <= 2);
+}
+
+static int csv_put_date(csv_buf_t *b, int64_t days) {
+  int64_t y;
+  unsigned m, d;
+  char tmp[32];
+  civil_from_days(days, &y, &m, &d);
+  int n = snprintf(tmp, sizeof(tmp), "%04lld-%02u-%02u", (long long)y, m, d);
+  return csv_buf_put(b, tmp, (size_t)n);
+}
+
+static int csv_put_time(csv_buf_t *b, int32_t ms) {
+  char tmp[32];
+  const char *sign = ms < 0 ? "-" : "";
+  int64_t v = ms < 0 ? -(int64_t)ms : ms;
+  int n = snprintf(tmp, sizeof(tmp), "%s%02lld:%02lld:%02lld.%03lld", sign,
+                   (long long)(v / 3600000), (long long)(v / 60000 % 60),
+                   (long long)(v / 1000 % 60), (long long)(v % 1000));
+  return csv_buf_put(b, tmp, (size_t)n);
+}
+
+static int csv_put_timestamp(csv_buf_t *b, int64_t ns) {
+  const int64_t ns_per_day = 86400LL * 1000000000LL;
+  int64_t days = ns / ns_per_day;
+  int64_t rem = ns % ns_per_day;
+  if (rem < 0) {
+    rem += ns_per_day;
+    days -= 1;
+  }
+  if (csv_put_date(b, days) < 0)
+    return -1;
+
+  char tmp[48];
+  int64_t secs = rem / 1000000000LL;
+  int64_t frac = rem % 1000000000LL;
+  int n = snprintf(tmp, sizeof(tmp), " %02lld:%02lld:%02lld",
+                   (long long)(secs / 3600), (long long)(secs / 60 % 60),
+                   (long long)(secs % 60));
+  if (frac != 0)
+    n += snprintf(tmp + n, sizeof(tmp) - (size_t)n, ".%09lld", (long long)frac);
+  return csv_buf_put(b, tmp, (size_t)n);
+}
+
+/* Shortest of %.15g / %.17g that round-trips the double. */
+static int csv_put_f64(csv_buf_t *b, double v) {
+  char tmp[40];
+  int n = snprintf(tmp, sizeof(tmp), "%.15g", v);
+  if (strtod(tmp, NULL) != v)
+    n = snprintf(tmp, sizeof(tmp), "%.17g", v);
+  return csv_buf_put(b, tmp, (size_t)n);
+}
+
+static int csv_put_guid(csv_buf_t *b, const uint8_t *g) {
+  static const char hex[] = "0123456789abcdef";
+  char tmp[36];
+  size_t n = 0;
+  for (int i = 0; i < 16; i++) {
+    if (i == 4 || i == 6 || i == 8 || i == 10)
+      tmp[n++] = '-';
+    tmp[n++] = hex[g[i] >> 4];
+    tmp[n++] = hex[g[i] & 0x0f];
+  }
+  return csv_buf_put(b, tmp, n);
+}
+
+/* Variable-width cells (SYM / STR / GUID) go through collection_elem, the
+ * same accessor raypy_at_idx uses, so sym-width and string-pool layouts stay
+ * the core's business. */
+static int csv_put_boxed(csv_buf_t *b, ray_t *col, int64_t row,
+                         const csv_opts_t *o) {
+  int allocated = 0;
+  ray_t *elem = collection_elem(col, row, &allocated);
+  if (elem == NULL || RAY_IS_ERR(elem)) {
+    if (elem && allocated)
+      ray_release(elem);
+    PyErr_SetString(PyExc_RuntimeError, "csv: failed to read cell");
+    return -1;
+  }
+
+  int rc = 0;
+  if (elem->type == -RAY_SYM) {
+    ray_t *s = ray_sym_str(elem->i64);
+    if (s != NULL)
+      rc = csv_put_text(b, ray_str_ptr(s), ray_str_len(s), o);
+  } else if (elem->type == -RAY_STR) {
+    rc = csv_put_text(b, ray_str_ptr(elem), ray_str_len(elem), o);
+  } else if (elem->type == -RAY_GUID && elem->obj != NULL) {
+    rc = csv_put_guid(b, (const uint8_t *)ray_data(elem->obj));
+  } else {
+    PyErr_Format(PyExc_TypeError, "csv: unsupported cell type %d",
+                 (int)elem->type);
+    rc = -1;
+  }
+  if (allocated)
+    ray_release(elem);
+  return rc;
+}
+
+static int csv_put_cell(csv_buf_t *b, ray_t *col, int64_t row,
+                        const csv_opts_t *o) {
+  if (ray_vec_is_null(col, row))
+    return csv_buf_put(b, o->null_repr, o->null_len);
+
+  const void *base = ray_data(col);
+  char tmp[32];
+  int n;
+  switch (col->type) {
+  case RAY_BOOL:
+    return ((const uint8_t *)base)[row] ? csv_buf_put(b, "true", 4)
+                                        : csv_buf_put(b, "false", 5);
+  case RAY_U8:
+    n = snprintf(tmp, sizeof(tmp), "%u", (unsigned)((const uint8_t *)base)[row]);
+    return csv_buf_put(b, tmp, (size_t)n);
+  case RAY_I16:
+    n = snprintf(tmp, sizeof(tmp), "%d", ((const int16_t *)base)[row]);
+    return csv_buf_put(b, tmp, (size_t)n);
+  case RAY_I32:
+    n = snprintf(tmp, sizeof(tmp), "%d", ((const int32_t *)base)[row]);
+    return csv_buf_put(b, tmp, (size_t)n);
+  case RAY_I64:
+    n = snprintf(tmp, sizeof(tmp), "%lld",
+                 (long long)((const int64_t *)base)[row]);
+    return csv_buf_put(b, tmp, (size_t)n);
+  case RAY_F32:
+    n = snprintf(tmp, sizeof(tmp), "%.9g", (double)((const float *)base)[row]);
+    return csv_buf_put(b, tmp, (size_t)n);
+  case RAY_F64:
+    return csv_put_f64(b, ((const double *)base)[row]);
+  case RAY_DATE:
+    return csv_put_date(b, ((const int32_t *)base)[row]);
+  case RAY_TIME:
+    return csv_put_time(b, ((const int32_t *)base)[row]);
+  case RAY_TIMESTAMP:
+    return csv_put_timestamp(b, ((const int64_t *)base)[row]);
+  case RAY_SYM:
+  case RAY_STR:
+  case RAY_GUID:
+    return csv_put_boxed(b, col, row, o);
+  default:
+    PyErr_Format(PyExc_TypeError, "csv: unsupported column type %d",
+                 (int)col->type);
+    return -1;
+  }
+}
+
+/* format_csv(table, offset, length, sep, quote, null_repr, header) -> bytes
+ *
+ * Render rows [offset, offset + length) of `table` as CSV. Python drives the
+ * chunk loop and streams each chunk into the (optionally compressed) sink, so
+ * the whole file never sits in memory and every cell is formatted once. */
+PyObject *raypy_format_csv(PyObject *self, PyObject *args) {
+  (void)self;
+  CHECK_MAIN_THREAD();
+
+  RayObject *table_obj;
+  Py_ssize_t offset, length;
+  const char *sep, *quote, *null_repr;
+  Py_ssize_t sep_len, quote_len, null_len;
+  int header;
+
+  if (!PyArg_ParseTuple(args, "O!nns#s#s#p", &RayObjectType, &table_obj,
+                        &offset, &length, &sep, &sep_len, &quote, &quote_len,
+                        &null_repr, &null_len, &header))
+    return NULL;
+
+  ray_t *tbl = table_obj->obj;
+  if (tbl == NULL || tbl->type != RAY_TABLE) {
+    PyErr_SetString(PyExc_RuntimeError, "csv: object is not a table");
+    return NULL;
+  }
+  if (sep_len != 1 || quote_len != 1) {
+    PyErr_SetString(PyExc_ValueError,
+                    "csv: separator and quote must be single characters");
+    return NULL;
+  }
+
+  int64_t nrows = ray_table_nrows(tbl);
+  if (offset < 0 || length < 0 || offset > nrows || length > nrows - offset) {
+    PyErr_Format(PyExc_IndexError,
+                 "csv: rows [%zd, %zd) out of bounds (len %lld)", offset,
+                 offset + length, (long long)nrows);
+    return NULL;
+  }
+
+  csv_opts_t opts = {sep[0], quote[0], null_repr, (size_t)null_len};
+  int64_t ncols = ray_table_ncols(tbl);
+  csv_buf_t buf = {NULL, 0, 0};
+
+  ray_t **cols = malloc((size_t)(ncols > 0 ? ncols : 1) * sizeof(ray_t *));
+  if (cols == NULL)
+    return PyErr_NoMemory();
+  for (int64_t c = 0; c < ncols; c++) {
+    cols[c] = ray_table_get_col_idx(tbl, c);
+    if (cols[c] == NULL) {
+      PyErr_SetString(PyExc_RuntimeError, "csv: table column missing");
+      goto fail;
+    }
+  }
+
+  if (header) {
+    for (int64_t c = 0; c < ncols; c++) {
+      if (c > 0 && csv_buf_putc(&buf, opts.sep) < 0)
+        goto fail;
+      ray_t *s = ray_sym_str(ray_table_col_name(tbl, c));
+      if (s != NULL && csv_put_text(&buf, ray_str_ptr(s), ray_str_len(s),
+                                    &opts) < 0)
+        goto fail;
+    }
+    if (csv_buf_putc(&buf, '\n') < 0)
+      goto fail;
+  }
+
+  for (int64_t r = offset; r < offset + length; r++) {
+    for (int64_t c = 0; c < ncols; c++) {
+      if (c > 0 && csv_buf_putc(&buf, opts.sep) < 0)
+        goto fail;
+      if (csv_put_cell(&buf, cols[c], r, &opts) < 0)
+        goto fail;
+    }
+    if (csv_buf_putc(&buf, '\n') < 0)
+      goto fail;
+  }
+
+  PyObject *result = PyBytes_FromStringAndSize(buf.data, (Py_ssize_t)buf.len);
+  free(cols);
+  free(buf.data);
+  return result;
+
+fail:
+  free(cols);
+  free(buf.data);
+  return NULL;
+}
@@ -0,0 +1,161 @@
+#include "rayforce_c.h"
+#include <errno.h>
+#include <fcntl.h>
+#include <sys/stat.h>
+
+/* Scope: snapshots use the core's IPC serialization as is. The core has no
+ * incremental serializer (ray_ser fills one buffer) and ray_de only decodes
+ * from a core-owned vector into fresh allocations, so a streaming writer and
+ * a zero-copy mapped restore both need support in the core that it does not
+ * offer. What is done here is avoiding the Python-side copies: the encoded
+ * buffer goes straight to the file, and the file straight into the buffer
+ * the decoder reads. Mapped, per-column restores are what splayed tables
+ * (set_splayed / from_splayed) are for. */
+
+/* dump_obj(obj, path) -> int
+ *
+ * Serialize `obj` with the IPC wire format and write the encoded buffer
+ * straight to `path` (no intermediate Python bytes object). The core
+ * serializes into one buffer, so the whole encoding is held in memory while
+ * it is written. The file is fsynced before returning; the caller is
+ * responsible for atomic replace. */
+PyObject *raypy_dump_obj(PyObject *self, PyObject *args) {
+  (void)self;
+  CHECK_MAIN_THREAD();
+
+  RayObject *obj;
+  const char *path;
+  if (!PyArg_ParseTuple(args, "O!s", &RayObjectType, &obj, &path))
+    return NULL;
+
+  ray_t *serialized = ray_ser(obj->obj);
+  if (serialized == NULL || serialized == RAY_NULL_OBJ) {
+    PyErr_SetString(PyExc_RuntimeError, "snapshot: failed to serialize object");
+    return NULL;
+  }
+  if (RAY_IS_ERR(serialized)) {
+    PyErr_Format(PyExc_RuntimeError, "snapshot: serialization error: %s",
+                 ray_err_code(serialized));
+    ray_release(serialized);
+    return NULL;
+  }
+
+  const char *data = (const char *)ray_data(serialized);
+  size_t remaining = (size_t)serialized->len;
+  int saved_errno = 0;
+
+  int fd = open(path, O_WRONLY | O_CREAT | O_TRUNC, 0644);
+  if (fd < 0) {
+    ray_release(serialized);
+    return PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+  }
+
+  Py_BEGIN_ALLOW_THREADS;
+  while (remaining > 0) {
+    ssize_t n = write(fd, data, remaining);
+    if (n < 0) {
+      if (errno == EINTR)
+        continue;
+      saved_errno = errno;
+      break;
+    }
+    data += n;
+    remaining -= (size_t)n;
+  }
+  if (saved_errno == 0 && fsync(fd) != 0)
+    saved_errno = errno;
+  Py_END_ALLOW_THREADS;
+
+  int64_t written = serialized->len;
+  ray_release(serialized);
+  if (close(fd) != 0 && saved_errno == 0)
+    saved_errno = errno;
+  if (saved_errno != 0) {
+    errno = saved_errno;
+    return PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+  }
+  return PyLong_FromLongLong((long long)written);
+}
+
+/* Read `size` bytes of `fd` into `dst`. Returns 0 or an errno value.
+ * Called without the GIL. */
+static int snapshot_read(int fd, char *dst, size_t size) {
+  while (size > 0) {
+    ssize_t n = read(fd, dst, size);
+    if (n < 0) {
+      if (errno == EINTR)
+        continue;
+      return errno;
+    }
+    if (n == 0)
+      return EIO; /* truncated underneath us */
+    dst += n;
+    size -= (size_t)n;
+  }
+  return 0;
+}
+
+/* load_obj(path) -> RayObject
+ *
+ * Read a file written by dump_obj directly into a core-owned U8 buffer and
+ * deserialize it. The decoder only takes a core vector and the decoded
+ * columns are core allocations: the wire format is not laid out for in-place
+ * use, so mapping the file would add a copy rather than save one. */
+PyObject *raypy_load_obj(PyObject *self, PyObject *args) {
+  (void)self;
+  CHECK_MAIN_THREAD();
+
+  const char *path;
+  if (!PyArg_ParseTuple(args, "s", &path))
+    return NULL;
+
+  int fd = open(path, O_RDONLY);
+  if (fd < 0)
+    return PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+
+  struct stat st;
+  if (fstat(fd, &st) != 0) {
+    int saved_errno = errno;
+    close(fd);
+    errno = saved_errno;
+    return PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+  }
+
+  size_t size = (size_t)st.st_size;
+  ray_t *buf = ray_vec_new(RAY_U8, (int64_t)size);
+  if (buf == NULL || RAY_IS_ERR(buf)) {
+    if (buf)
+      ray_release(buf);
+    close(fd);
+    PyErr_SetString(PyExc_MemoryError, "snapshot: failed to allocate buffer");
+    return NULL;
+  }
+
+  int rc;
+  char *dst = (char *)ray_data(buf);
+  Py_BEGIN_ALLOW_THREADS;
+  rc = snapshot_read(fd, dst, size);
+  Py_END_ALLOW_THREADS;
+  close(fd);
+  if (rc != 0) {
+    ray_release(buf);
+    errno = rc;
+    return PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+  }
+  buf->len = (int64_t)size;
+
+  ray_t *obj = ray_de(buf);
+  ray_release(buf);
+  if (obj == NULL || obj == RAY_NULL_OBJ) {
+    PyErr_Format(PyExc_RuntimeError, "snapshot: failed to deserialize '%s'",
+                 path);
+    return NULL;
+  }
+  if (RAY_IS_ERR(obj)) {
+    PyErr_Format(PyExc_RuntimeError, "snapshot: deserialization error: %s",
+                 ray_err_code(obj));
+    ray_release(obj);
+    return NULL;
+  }
+  return raypy_wrap_ray_object(obj);
+}
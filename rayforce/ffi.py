@@ -189,8 +189,8 @@ class FFI:
 
     @staticmethod
     @errors.error_handler
-    def repr_table(table: r.RayObject) -> str:
-        return r.repr_table(table)
+    def repr_table(table: r.RayObject, *, full: bool = True) -> str:
+        return r.repr_table(table, full)
 
     @staticmethod
     @errors.error_handler
@@ -232,6 +232,20 @@ class FFI:
     def write_csv(table: r.RayObject, path: r.RayObject) -> r.RayObject:
         return r.write_csv(table, path)
 
+    @staticmethod
+    @errors.error_handler
+    def format_csv(
+        table: r.RayObject,
+        offset: int,
+        length: int,
+        *,
+        separator: str,
+        quote: str,
+        null_value: str,
+        header: bool,
+    ) -> bytes:
+        return r.format_csv(table, offset, length, separator, quote, null_value, header)
+
     @staticmethod
     @errors.error_handler
     def set_splayed(
@@ -311,6 +325,18 @@ class FFI:
         """Deserialize binary format with IPC header to RayObject."""
         return r.de_obj(obj)
 
+    @staticmethod
+    @errors.error_handler
+    def dump_obj(obj: r.RayObject, path: str) -> int:
+        """Serialize RayObject straight to a file; returns bytes written."""
+        return r.dump_obj(obj, path)
+
+    @staticmethod
+    @errors.error_handler
+    def load_obj(path: str) -> r.RayObject:
+        """Load a RayObject written by `dump_obj`."""
+        return r.load_obj(path)
+
     @staticmethod
     @errors.error_handler
     def read_u8_vector(obj: r.RayObject) -> bytes:
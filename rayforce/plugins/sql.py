@@ -395,13 +395,9 @@ class SQLCompiler:
             query = query.by(*_by)
 
         if _order := parsed.order_by:
-            directions = {is_desc for _, is_desc in _order}
-            if len(directions) > 1:
-                raise NotImplementedError(
-                    "ORDER BY with mixed ASC/DESC directions is not supported"
-                )
-            desc = directions.pop()
-            query = query.order_by(*[col for col, _ in _order], desc=desc)
+            query = query.order_by(
+                *[(col, "desc" if is_desc else "asc") for col, is_desc in _order]
+            )
 
         return self._finalize_select(query)
 
@@ -18,7 +18,7 @@ from .scalars import (
     Time,
     Timestamp,
 )
-from .table import Column, Expression, Table, TableColumnInterval
+from .table import Column, Expression, Param, Table, TableColumnInterval
 
 __all__ = [
     "B8",
@@ -37,6 +37,7 @@ __all__ = [
     "List",
     "Null",
     "Operation",
+    "Param",
     "QuotedSymbol",
     "String",
     "Symbol",
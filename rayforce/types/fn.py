@@ -42,8 +42,11 @@ class Fn(RayObject):
         # named-reference branch triggers and β-reduces it.
         name = getattr(self, "_bound_name", None)
         if name is None:
+            from rayforce.types.table import _forget_reference_schemas
+
             name = f"__pyfn_{next(_fn_bind_counter):x}"
             FFI.binary_set(FFI.init_symbol(name), self.ptr)
+            _forget_reference_schemas(name)
             self._bound_name = name
         return name
 
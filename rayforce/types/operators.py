@@ -174,6 +174,7 @@ class Operation(enum.StrEnum):
     SET = "set"
     LET = "let"
     ENV = "env"
+    DEL = "del"
 
     # Data Structures
     DICT = "dict"
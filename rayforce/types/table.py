@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+import contextlib
+from dataclasses import dataclass, field
 import datetime as dt
+import enum
 from functools import wraps
+import json
+import operator
 import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
 import typing as t
 
 import numpy as np
 
+if sys.platform != "win32":
+    import fcntl
+
 from rayforce import _rayforce_c as r
 from rayforce import errors, utils
 from rayforce.ffi import FFI
@@ -19,13 +33,18 @@ from rayforce.types import (
     QuotedSymbol,
     String,
     Symbol,
+    Time,
+    Timestamp,
     Vector,
 )
 from rayforce.types.base import RayObject
+from rayforce.types.containers.vector import _apply_null_mask
 from rayforce.types.operators import Operation
 from rayforce.types.registry import TypeRegistry
 from rayforce.types.scalars.temporal.date import Date
-from rayforce.types.scalars.temporal.timestamp import tz_offset_nanos
+from rayforce.types.scalars.temporal.timestamp import DATETIME_EPOCH, tz_offset_nanos
+from rayforce.utils import compression as compression_utils
+from rayforce.utils.sketch import HyperLogLog, QuantileSketch
 
 if t.TYPE_CHECKING:
     from rayforce.types.fn import Fn
@@ -36,6 +55,108 @@ if t.TYPE_CHECKING:
 # global-env lookup). A name-reference atom must therefore have 0x20 cleared.
 _ATTR_NAME_REF = 0x00
 
+# Rows formatted per native call when streaming CSV output; bounds the size of
+# each in-flight text chunk independently of the table length.
+_CSV_CHUNK_ROWS = 65_536
+
+# Raw storage dtype of the column types `to_parted` can partition on. Null is
+# the dtype's minimum value for all of them.
+_PART_KEY_DTYPES: dict[int, t.Any] = {
+    r.TYPE_DATE: np.int32,
+    r.TYPE_I16: np.int16,
+    r.TYPE_I32: np.int32,
+    r.TYPE_I64: np.int64,
+}
+_PART_DATE_EPOCH = dt.date(2000, 1, 1)
+# Any midnight works as the base for mapping time-of-day offsets to times.
+_MIDNIGHT = dt.datetime(2000, 1, 1, tzinfo=dt.UTC)
+# Name and type code of the partition column, written by `to_parted` at the
+# root of the layout. Directory names alone only tell dates from integers.
+_PART_META_FILE = ".partition"
+
+# Per-directory column statistics (zone maps) written next to `.d`.
+_STATS_FILE = ".stats"
+# Column types that get min/max in the zone map, with their raw storage dtype.
+# Null is stored as the dtype's minimum (NaN for floats).
+_STATS_DTYPES: dict[int, t.Any] = {
+    r.TYPE_I16: np.int16,
+    r.TYPE_I32: np.int32,
+    r.TYPE_I64: np.int64,
+    r.TYPE_F32: np.float32,
+    r.TYPE_F64: np.float64,
+    r.TYPE_DATE: np.int32,
+    r.TYPE_TIME: np.int32,
+    r.TYPE_TIMESTAMP: np.int64,
+}
+
+
+# On-disk layout of a splayed column file: 16 reserved bytes, the object
+# header (type, attributes, symbol domain, length) and the raw items. For a
+# symbol column the attributes byte selects the width of its symfile indices.
+# The core exposes no call to grow a column file in place, so
+# `append_splayed` writes this layout itself; it checks every file against it
+# before touching any, and refuses to append to one that does not match.
+_COLUMN_HEADER = struct.Struct("<2xBBIq")
+_COLUMN_HEADER_OFFSET = 16
+_COLUMN_DATA_OFFSET = 32
+_COLUMN_ITEM_SIZES: dict[int, int] = {
+    r.TYPE_B8: 1,
+    r.TYPE_U8: 1,
+    r.TYPE_I16: 2,
+    r.TYPE_I32: 4,
+    r.TYPE_I64: 8,
+    r.TYPE_F32: 4,
+    r.TYPE_F64: 8,
+    r.TYPE_DATE: 4,
+    r.TYPE_TIME: 4,
+    r.TYPE_TIMESTAMP: 8,
+    r.TYPE_GUID: 16,
+}
+_SYMBOL_INDEX_DTYPES: tuple[type[np.unsignedinteger[t.Any]], ...] = (
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+)
+# Symfile: magic, symbol count, then length-prefixed UTF-8 records starting
+# with the empty (null) symbol.
+_SYMFILE_MAGIC = b"STRL"
+_SYMFILE_RECORDS_OFFSET = 12
+# Inflated bytes of a compressed CSV parsed at a time by `Table.from_csv`.
+_CSV_CHUNK_BYTES = 64 << 20
+# Undo journal of an in-progress `append_splayed`, and the suffixes of the
+# files it stages next to the columns it replaces wholesale.
+_APPEND_JOURNAL = ".append"
+# Held exclusively by `append_splayed` and shared by loads of the directory.
+_APPEND_LOCK = ".append.lk"
+_APPEND_TMP_SUFFIX = ".append-tmp"
+_APPEND_OLD_SUFFIX = ".append-old"
+
+# Column types `Table.describe` summarises (U8 has no null sentinel).
+_DESCRIBE_DTYPES: dict[int, t.Any] = {**_STATS_DTYPES, r.TYPE_U8: np.uint8}
+
+# What the engine pads unmatched left-join rows with in columns that have no null.
+_JOIN_FILLS: dict[int, t.Any] = {
+    r.TYPE_SYMBOL: "",
+    r.TYPE_B8: False,
+    r.TYPE_U8: 0,
+}
+
+
+def _describe_value(value: t.Any, type_code: int, *, spread: bool = False) -> t.Any:
+    """Map a statistic over raw storage values back to the column's domain.
+    `spread` marks dispersion measures, which become timedeltas."""
+    if type_code == r.TYPE_DATE:
+        days = dt.timedelta(days=value)
+        return days if spread else _PART_DATE_EPOCH + days
+    if type_code == r.TYPE_TIME:
+        millis = dt.timedelta(milliseconds=value)
+        return millis if spread else (_MIDNIGHT + millis).time()
+    if type_code == r.TYPE_TIMESTAMP:
+        nanos = dt.timedelta(microseconds=value / 1000)
+        return nanos if spread else DATETIME_EPOCH + nanos
+    return float(value) if isinstance(value, np.floating) else value
+
 
 def _is_date_dir(name: str) -> bool:
     if len(name) != 10 or name[4] != "." or name[7] != ".":
@@ -76,13 +197,647 @@ def _collect_part_dirs(root: str) -> list[str]:
     return out
 
 
-def _infer_part_column(part_dirs: list[str]) -> tuple[str, list[t.Any], type]:
+def _infer_part_column(root: str, part_dirs: list[str]) -> tuple[str, list[t.Any], type]:
+    try:
+        with open(os.path.join(root, _PART_META_FILE)) as fh:
+            meta = json.load(fh)
+    except (OSError, ValueError):
+        meta = None
+    values: list[t.Any]
+    ray_type: type | None
     if all(_is_date_dir(d) for d in part_dirs):
         values = [dt.date(int(d[:4]), int(d[5:7]), int(d[8:])) for d in part_dirs]
-        return "date", values, Date
-    if all(_is_int_dir(d) for d in part_dirs):
-        return "part", [int(d) for d in part_dirs], I64
-    return "part", list(part_dirs), Symbol
+        name, ray_type = "date", Date
+    elif all(_is_int_dir(d) for d in part_dirs):
+        values, name, ray_type = [int(d) for d in part_dirs], "part", I64
+    else:
+        return "part", list(part_dirs), Symbol
+    if meta is not None:
+        name, ray_type = meta["column"], TypeRegistry.get(-meta["type"])
+        if ray_type is None:
+            raise errors.RayforceValueError(
+                f"Unknown partition column type in {_PART_META_FILE}: {meta['type']}"
+            )
+    return name, values, ray_type
+
+
+def _splayed_column_files(path: str, symlink: str | None) -> list[str]:
+    """Column files of a splayed directory: everything except the `.d` schema
+    and a symfile that happens to live inside the directory."""
+    sym_real = os.path.realpath(symlink) if symlink is not None else None
+    out = []
+    for entry in sorted(os.listdir(path)):
+        full = os.path.join(path, entry)
+        if entry.startswith(".") or not os.path.isfile(full):
+            continue
+        if sym_real is not None and os.path.realpath(full) == sym_real:
+            continue
+        out.append(full)
+    return out
+
+
+def _has_compressed_columns(path: str) -> bool:
+    if not os.path.isdir(path):
+        return False
+    return any(compression_utils.codec_for_suffix(entry) for entry in os.listdir(path))
+
+
+def _record_ends(data: bytes) -> t.Any:
+    """Offsets just past each newline of CSV `data` that ends a record: one
+    preceded by an even number of quote characters, so not inside a quoted
+    field (an escaped quote is doubled and keeps the count even)."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    outside = np.cumsum(raw == ord('"')) % 2 == 0
+    return np.flatnonzero((raw == ord("\n")) & outside) + 1
+
+
+def _csv_chunks(stream: t.BinaryIO, size: int) -> Iterator[bytes]:
+    """The CSV read from `stream` in pieces of whole records, about `size`
+    bytes each, every piece starting with the header."""
+    header: bytes | None = None
+    pending = b""
+    emitted = False
+    while block := stream.read(size):
+        pending += block
+        ends = _record_ends(pending)
+        if header is None:
+            if not len(ends):
+                continue
+            header, pending, ends = pending[: ends[0]], pending[ends[0] :], ends[1:] - ends[0]
+        if len(ends):
+            yield header + pending[: ends[-1]]
+            pending, emitted = pending[ends[-1] :], True
+    if pending or not emitted:
+        yield (header or b"") + pending
+
+
+def _project_columns(table: r.RayObject, columns: list[str]) -> r.RayObject:
+    """Rebuild `table` from a subset of its columns, for layouts the core only
+    loads whole. Column vectors are shared, not copied."""
+    names = [_col_name(c) for c in utils.ray_to_python(FFI.get_table_keys(table))]
+    if unknown := [c for c in columns if c not in names]:
+        raise errors.RayforceConversionError(f"Columns not found: {', '.join(unknown)}")
+    values = utils.ray_to_python(FFI.get_table_values(table))
+    return FFI.init_table(
+        columns=Vector(items=columns, ray_type=Symbol).ptr,
+        values=List([values[names.index(c)] for c in columns]).ptr,
+    )
+
+
+def _stage_projection(
+    path: str,
+    scratch: str,
+    symfile: str | None,
+    columns: list[str] | None = None,
+    journal: dict[str, t.Any] | None = None,
+) -> None:
+    """Lay out in `scratch` a splayed directory holding `columns` of `path`,
+    or all of them: links to the column files (or inflated copies of
+    compressed ones) and a `.d` naming them. The other column files are
+    never opened. With the `journal` of an append that did not complete,
+    each column is staged as it was before that append."""
+    files: dict[str, str] = {}
+    for full in _splayed_column_files(path, symfile):
+        entry = os.path.basename(full)
+        if compression_utils.codec_for_suffix(entry) is not None:
+            entry = os.path.splitext(entry)[0]
+        files[entry] = full
+    if columns is None:
+        columns = list(files)
+        os.symlink(os.path.abspath(os.path.join(path, ".d")), os.path.join(scratch, ".d"))
+    else:
+        if unknown := [c for c in columns if c not in files]:
+            raise errors.RayforceConversionError(f"Columns not found: {', '.join(unknown)}")
+        # The core only reads the names from `.d`; each column's type comes
+        # from its own file header.
+        placeholder = FFI.init_table(
+            columns=Vector(items=columns, ray_type=Symbol).ptr,
+            values=List([Vector(items=[], ray_type=I64) for _ in columns]).ptr,
+        )
+        FFI.set_splayed(FFI.init_string(f"{scratch}/"), placeholder, None)
+        for name in columns:
+            os.remove(os.path.join(scratch, name))
+    for name in columns:
+        source, target = files[name], os.path.join(scratch, name)
+        codec = compression_utils.codec_for_suffix(source)
+        if journal is not None:
+            entry = os.path.basename(source)
+            backup = os.path.join(path, f".{entry}{_APPEND_OLD_SUFFIX}")
+            if entry in journal["replaced"] and os.path.exists(backup):
+                source = backup
+            elif (tail := journal["tails"].get(entry)) is not None:
+                _stage_column_head(source, target, tail)
+                continue
+        if codec is None:
+            os.symlink(os.path.abspath(source), target)
+        else:
+            compression_utils.decompress_file(source, target, codec)
+    if symfile is None and os.path.exists(local_sym := os.path.join(path, ".sym")):
+        os.symlink(os.path.abspath(local_sym), os.path.join(scratch, ".sym"))
+
+
+def _stage_column_head(source: str, staged: str, tail: dict[str, t.Any]) -> None:
+    """Copy of the column file `source` cut back to the size and header an
+    append journal recorded for it."""
+    with open(source, "rb") as src, open(staged, "wb") as dst:
+        dst.write(src.read(_COLUMN_HEADER_OFFSET) + bytes.fromhex(tail["header"]))
+        src.seek(_COLUMN_DATA_OFFSET)
+        dst.write(src.read(tail["size"] - _COLUMN_DATA_OFFSET))
+
+
+def _get_splayed(path: str, symfile: str | None, columns: list[str] | None = None) -> r.RayObject:
+    """The splayed table at `path` as of its last completed append. The caller
+    holds the directory's append lock."""
+    sym_ptr = FFI.init_string(symfile) if symfile is not None else None
+    journal = _read_append_journal(path)
+    if columns is None and journal is None and not _has_compressed_columns(path):
+        return FFI.get_splayed(FFI.init_string(path), sym_ptr)
+    # A scratch directory with its own `.d`: projected columns, compressed
+    # ones inflated and the others linked, and the columns an interrupted
+    # append touched as they were before it. The core maps the files on
+    # load, and those mappings stay valid after the scratch dir is removed.
+    with tempfile.TemporaryDirectory(prefix="rayforce-splayed-") as scratch:
+        _stage_projection(path, scratch, symfile, columns, journal)
+        return FFI.get_splayed(FFI.init_string(f"{scratch}/"), sym_ptr)
+
+
+def _load_partition(
+    splayed: str,
+    sym_path: str | None,
+    *,
+    part_col_name: str,
+    part_value: t.Any,
+    part_ray_type: type,
+    columns: list[str] | None = None,
+) -> Table:
+    """Load one splayed partition and prepend its (constant) partition column.
+    With `columns`, only those columns (and the partition column, if listed)
+    are kept."""
+    data_cols = None if columns is None else [c for c in columns if c != part_col_name]
+    if data_cols == []:
+        # Projected onto the partition column alone: the row count comes from
+        # a column file header (or an interrupted append's journal), no
+        # column data is loaded.
+        with _file_lock(os.path.join(splayed, _APPEND_LOCK), shared=True):
+            if (journal := _read_append_journal(splayed)) is not None:
+                rows = journal["rows"]
+            else:
+                [first, *_] = _splayed_column_files(splayed, sym_path)
+                rows = _read_column_header(first)[3]
+        col_names, col_values = [], []
+    else:
+        part_tbl = Table.from_splayed(splayed, sym_path, columns=data_cols)
+        part_ptr = part_tbl.evaled_ptr
+        rows = FFI.get_obj_length(part_ptr)
+        col_names = [_col_name(c) for c in part_tbl.columns()]
+        col_values = list(utils.ray_to_python(FFI.get_table_values(part_ptr)))
+    if columns is None or part_col_name in columns:
+        # `take` cycles its source, so a one-element vector yields the constant
+        # partition column natively without materialising a Python list.
+        part_col = utils.eval_obj(
+            List(
+                [
+                    Operation.TAKE,
+                    Vector(items=[part_value], ray_type=part_ray_type),
+                    rows,
+                ]
+            )
+        )
+        col_names = [part_col_name, *col_names]
+        col_values = [part_col, *col_values]
+    return Table(
+        FFI.init_table(
+            columns=Vector(items=col_names, ray_type=Symbol).ptr,
+            values=List(col_values).ptr,
+        )
+    )
+
+
+def _concat_tables(tables: list[_TableProtocol]) -> Table:
+    """N-way row concat. Each output column is built by a single `raze` over
+    the matching input columns, so it is sized and filled once instead of
+    being re-copied for every input as a pairwise `concat` fold would."""
+    ptrs = [tbl.evaled_ptr for tbl in tables]
+    names = [[_col_name(c) for c in utils.ray_to_python(FFI.get_table_keys(p))] for p in ptrs]
+    for other in names[1:]:
+        if other != names[0]:
+            raise errors.RayforceValueError(
+                f"Cannot concat tables with different columns: {names[0]} vs {other}"
+            )
+
+    values = [utils.ray_to_python(FFI.get_table_values(p)) for p in ptrs]
+    columns = []
+    for i, name in enumerate(names[0]):
+        parts = [v[i] for v in values]
+        types = {FFI.get_obj_type(part.ptr) for part in parts}
+        if len(types) > 1:
+            raise errors.RayforceTypeError(f"Cannot concat column '{name}' of mixed types")
+        # Quoted, the parts reach `raze` as one list however many there are;
+        # a `list` call would be capped by the evaluator's argument limit.
+        columns.append(utils.eval_obj(List([Operation.RAZE, List([Operation.QUOTE, List(parts)])])))
+
+    return Table(
+        FFI.init_table(
+            columns=Vector(items=names[0], ray_type=Symbol).ptr,
+            values=List(columns).ptr,
+        )
+    )
+
+
+def _column_stats(table: r.RayObject) -> dict[str, t.Any]:
+    """Zone map of a table: row count plus, per column, min/max and null
+    count over the raw storage values (days, ms and ns since the 2000 epoch
+    for temporal columns), and the distinct count for symbol columns."""
+    names = [_col_name(c) for c in utils.ray_to_python(FFI.get_table_keys(table))]
+    values = utils.ray_to_python(FFI.get_table_values(table))
+    columns: dict[str, dict[str, t.Any]] = {}
+    for name, vec in zip(names, values, strict=True):
+        type_code = FFI.get_obj_type(vec.ptr)
+        entry: dict[str, t.Any] = {"type": type_code}
+        if (dtype := _STATS_DTYPES.get(type_code)) is not None:
+            raw = np.frombuffer(FFI.read_vector_raw(vec.ptr), dtype=dtype)
+            nulls = np.isnan(raw) if raw.dtype.kind == "f" else raw == np.iinfo(dtype).min
+            present = raw[~nulls]
+            entry["nulls"] = int(nulls.sum())
+            entry["min"] = present.min().item() if len(present) else None
+            entry["max"] = present.max().item() if len(present) else None
+        elif type_code == r.TYPE_SYMBOL:
+            entry["distinct"] = _unwrap_value(
+                utils.eval_obj(List([Operation.COUNT, List([Operation.DISTINCT, vec])]))
+            )
+        columns[name] = entry
+    return {"rows": FFI.get_obj_length(table), "columns": columns}
+
+
+def _write_stats(path: str, table: r.RayObject) -> None:
+    with open(os.path.join(path, _STATS_FILE), "w") as fh:
+        json.dump(_column_stats(table), fh)
+
+
+def _read_stats(path: str) -> dict[str, t.Any] | None:
+    """The zone map of a splayed directory, or None when there is none or it
+    does not describe the column files: a write that skipped the stats
+    leaves a row count that no longer matches them."""
+    try:
+        with open(os.path.join(path, _STATS_FILE)) as fh:
+            stats = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    for entry in sorted(os.listdir(path)):
+        stem = entry
+        if compression_utils.codec_for_suffix(entry) is not None:
+            stem = os.path.splitext(entry)[0]
+        if stem in stats["columns"]:
+            rows = _read_column_header(os.path.join(path, entry))[3]
+            return stats if rows == stats["rows"] else None
+    return None
+
+
+def _drop_stats(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join(path, _STATS_FILE))
+
+
+def _fsync_dir(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: str) -> None:
+    with open(path, "rb") as fh:
+        os.fsync(fh.fileno())
+
+
+def _open_lock_file(path: str, *, shared: bool) -> int | None:
+    try:
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        if not shared:
+            raise
+    # A reader of a directory it cannot write to: no append can run there.
+    try:
+        return os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+@contextlib.contextmanager
+def _file_lock(path: str, *, shared: bool = False) -> Iterator[None]:
+    """Hold a `flock` on `path` for the duration of the block. The core takes
+    the same kind of lock on `<symfile>.lk` while it writes a symfile."""
+    fd = _open_lock_file(path, shared=shared) if sys.platform != "win32" else None
+    if fd is None:
+        yield
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _read_append_journal(path: str) -> dict[str, t.Any] | None:
+    try:
+        with open(os.path.join(path, _APPEND_JOURNAL)) as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+
+
+def _read_column_header(path: str) -> tuple[int, int, int, int]:
+    """Type, attributes, symbol domain and length of a splayed column file."""
+    codec = compression_utils.codec_for_suffix(path)
+    with compression_utils.open_compressed(path, "rb", codec) as fh:
+        head = fh.read(_COLUMN_DATA_OFFSET)
+    return _COLUMN_HEADER.unpack_from(head, _COLUMN_HEADER_OFFSET)
+
+
+def _read_symfile(path: str) -> list[str]:
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if data[: len(_SYMFILE_MAGIC)] != _SYMFILE_MAGIC:
+        raise errors.RayforceValueError(f"Not a symfile: {path}")
+    (count,) = struct.unpack_from("<I", data, len(_SYMFILE_MAGIC))
+    symbols, pos = [], _SYMFILE_RECORDS_OFFSET
+    for _ in range(count):
+        (size,) = struct.unpack_from("<I", data, pos)
+        symbols.append(data[pos + 4 : pos + 4 + size].decode())
+        pos += 4 + size
+    return symbols
+
+
+def _symbol_width(domain: int) -> int:
+    """Attributes byte of a symbol column indexing a symfile of `domain` entries."""
+    return next(
+        width
+        for width, dtype in enumerate(_SYMBOL_INDEX_DTYPES)
+        if domain - 1 <= np.iinfo(dtype).max
+    )
+
+
+def _stage_column(
+    source: str, staged: str, header: bytes, items: bytes, widen: t.Any = None
+) -> None:
+    """Write `source` with a new `header` and `items` appended to `staged`,
+    through the codec of `source`. With `widen`, the existing symbol indices
+    are re-encoded from its first dtype to its second."""
+    codec = compression_utils.codec_for_suffix(source)
+    with (
+        compression_utils.open_compressed(source, "rb", codec) as src,
+        compression_utils.open_compressed(staged, "wb", codec) as dst,
+    ):
+        dst.write(src.read(_COLUMN_HEADER_OFFSET) + header)
+        src.read(_COLUMN_DATA_OFFSET - _COLUMN_HEADER_OFFSET)
+        if widen is None:
+            compression_utils.copy_stream(src, dst)
+        else:
+            dst.write(np.frombuffer(src.read(), dtype=widen[0]).astype(widen[1]).tobytes())
+        dst.write(items)
+    _fsync_file(staged)
+
+
+def _merge_stats(old: dict[str, t.Any], new: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Zone map of two row ranges from theirs. Symbol distinct counts do not
+    combine without the symbols themselves and are dropped."""
+    columns: dict[str, dict[str, t.Any]] = {}
+    for name, entry in new["columns"].items():
+        prev = old["columns"].get(name, {})
+        merged = {"type": entry["type"]}
+        if "nulls" in entry and "nulls" in prev:
+            merged["nulls"] = prev["nulls"] + entry["nulls"]
+            for key, pick in (("min", min), ("max", max)):
+                bounds = [v for v in (prev[key], entry[key]) if v is not None]
+                merged[key] = pick(bounds) if bounds else None
+        columns[name] = merged
+    return {"rows": old["rows"] + new["rows"], "columns": columns}
+
+
+def _recover_splayed_append(path: str) -> None:
+    """Roll back an `append_splayed` interrupted by a crash, as recorded in
+    its journal, then sweep the files it staged. Only a writer runs this,
+    holding the directory's append lock and the symfile's lock.
+
+    Symbols the append had already committed to the symfile stay: other
+    tables enumerated against the same symfile may use them by now. Only
+    records written past a count that was never bumped are cut off."""
+    journal_path = os.path.join(path, _APPEND_JOURNAL)
+    if os.path.isfile(journal_path):
+        with open(journal_path) as fh:
+            journal = json.load(fh)
+        for entry, tail in journal["tails"].items():
+            with open(os.path.join(path, entry), "r+b") as fh:
+                fh.truncate(tail["size"])
+                fh.seek(_COLUMN_HEADER_OFFSET)
+                fh.write(bytes.fromhex(tail["header"]))
+                os.fsync(fh.fileno())
+        for entry in journal["replaced"]:
+            backup = os.path.join(path, f".{entry}{_APPEND_OLD_SUFFIX}")
+            if os.path.exists(backup):
+                os.replace(backup, os.path.join(path, entry))
+        if (sym := journal["symfile"]) is not None:
+            with open(sym["path"], "r+b") as fh:
+                fh.seek(len(_SYMFILE_MAGIC))
+                if struct.unpack("<I", fh.read(4)) == (sym["count"],):
+                    fh.truncate(sym["size"])
+                    os.fsync(fh.fileno())
+        if journal["stats"] is not None:
+            with open(os.path.join(path, _STATS_FILE), "w") as fh:
+                json.dump(journal["stats"], fh)
+        _fsync_dir(path)
+        os.remove(journal_path)
+        _fsync_dir(path)
+    for entry in os.listdir(path):
+        if entry.endswith((_APPEND_TMP_SUFFIX, _APPEND_OLD_SUFFIX)):
+            full = os.path.join(path, entry)
+            if os.path.isdir(full):
+                shutil.rmtree(full)
+            else:
+                os.remove(full)
+
+
+def _append_splayed(path: str, symfile: str | None, table: r.RayObject) -> None:
+    """Append the rows of `table` to the splayed directory `path` in place.
+
+    Fixed-width and symbol columns grow at the tail: the new items are
+    written and fsynced past the end of each file, and only then are the
+    lengths in the headers bumped. Symbols not yet in the symfile are
+    appended to it the same way. Columns that cannot grow in place
+    (compressed, strings, or symbol indices that outgrow their width) are
+    rewritten into a staged copy and renamed over the original. An undo
+    journal, fsynced before the first write and removed after the last,
+    lets `_recover_splayed_append` roll back an append a crash interrupted.
+    """
+    names = [_col_name(c) for c in utils.ray_to_python(FFI.get_table_keys(table))]
+    vecs = dict(zip(names, utils.ray_to_python(FFI.get_table_values(table)), strict=True))
+    files: dict[str, str] = {}
+    for full in _splayed_column_files(path, symfile):
+        entry = os.path.basename(full)
+        if compression_utils.codec_for_suffix(entry) is not None:
+            entry = os.path.splitext(entry)[0]
+        files[entry] = full
+    if sorted(files) != sorted(names):
+        raise errors.RayforceValueError(
+            f"Cannot append columns {names} to a splayed table of {sorted(files)}"
+        )
+    headers = {name: _read_column_header(files[name]) for name in names}
+    for name in names:
+        type_code, attrs, _, length = headers[name]
+        if FFI.get_obj_type(vecs[name].ptr) != type_code:
+            raise errors.RayforceTypeError(f"Cannot append to column '{name}' of another type")
+        if type_code == r.TYPE_SYMBOL:
+            item_size = np.dtype(_SYMBOL_INDEX_DTYPES[attrs]).itemsize
+        elif (item_size := _COLUMN_ITEM_SIZES.get(type_code, 0)) == 0:
+            continue
+        if compression_utils.codec_for_suffix(files[name]) is None and (
+            os.path.getsize(files[name]) != _COLUMN_DATA_OFFSET + length * item_size
+        ):
+            raise errors.RayforceValueError(
+                f"Cannot append to column '{name}': {files[name]} is not laid out as expected"
+            )
+
+    sym_path = symfile if symfile is not None else os.path.join(path, ".sym")
+    symbols: list[str] = []
+    added: list[str] = []
+    codes: dict[str, np.ndarray] = {}
+    if any(header[0] == r.TYPE_SYMBOL for header in headers.values()):
+        symbols = _read_symfile(sym_path)
+        lookup = {sym: i for i, sym in enumerate(symbols)}
+        for name in names:
+            if headers[name][0] != r.TYPE_SYMBOL:
+                continue
+            uniques, inverse = np.unique(vecs[name].to_numpy(), return_inverse=True)
+            unique_codes = np.empty(len(uniques), dtype=np.int64)
+            for i, sym in enumerate(uniques.tolist()):
+                if (code := lookup.get(sym)) is None:
+                    code = lookup[sym] = len(symbols) + len(added)
+                    added.append(sym)
+                unique_codes[i] = code
+            codes[name] = unique_codes[inverse]
+    domain = len(symbols) + len(added)
+
+    tails: dict[str, tuple[bytes, bytes]] = {}
+    staged: dict[str, str] = {}
+    for name in names:
+        full, vec = files[name], vecs[name]
+        type_code, attrs, sym_domain, length = headers[name]
+        stage = os.path.join(path, f".{os.path.basename(full)}{_APPEND_TMP_SUFFIX}")
+        if type_code == r.TYPE_SYMBOL:
+            width = max(attrs, _symbol_width(domain))
+            header = _COLUMN_HEADER.pack(type_code, width, domain, length + len(codes[name]))
+            items = codes[name].astype(_SYMBOL_INDEX_DTYPES[width]).tobytes()
+            widen = None
+            if width != attrs:
+                widen = (_SYMBOL_INDEX_DTYPES[attrs], _SYMBOL_INDEX_DTYPES[width])
+        elif type_code in _COLUMN_ITEM_SIZES:
+            items = FFI.read_vector_raw(vec.ptr)
+            header = _COLUMN_HEADER.pack(
+                type_code, attrs, sym_domain, length + len(items) // _COLUMN_ITEM_SIZES[type_code]
+            )
+            widen = None
+        else:
+            # Variable-width columns are laid out by the core: it writes the
+            # combined column into a scratch directory.
+            existing = Table(_get_splayed(path, symfile, [name]))
+            appended = Table(
+                FFI.init_table(
+                    columns=Vector(items=[name], ray_type=Symbol).ptr,
+                    values=FFI.init_list([vec.ptr]),
+                )
+            )
+            scratch = os.path.join(path, f".scratch{_APPEND_TMP_SUFFIX}")
+            shutil.rmtree(scratch, ignore_errors=True)
+            _concat_tables([existing, appended]).set_splayed(f"{scratch}/", stats=False)
+            codec = compression_utils.codec_for_suffix(full)
+            with (
+                open(os.path.join(scratch, name), "rb") as src,
+                compression_utils.open_compressed(stage, "wb", codec) as dst,
+            ):
+                compression_utils.copy_stream(src, dst)
+            shutil.rmtree(scratch)
+            _fsync_file(stage)
+            staged[full] = stage
+            continue
+        if widen is None and compression_utils.codec_for_suffix(full) is None:
+            tails[full] = (items, header)
+        else:
+            _stage_column(full, stage, header, items, widen)
+            staged[full] = stage
+
+    old_stats = _read_stats(path)
+    if old_stats is None:
+        _drop_stats(path)
+    with open(os.path.join(path, _APPEND_JOURNAL + _APPEND_TMP_SUFFIX), "w") as fh:
+        json.dump(
+            {
+                "symfile": {
+                    "path": os.path.abspath(sym_path),
+                    "size": os.path.getsize(sym_path),
+                    "count": len(symbols),
+                }
+                if added
+                else None,
+                "tails": {
+                    os.path.basename(full): {
+                        "size": os.path.getsize(full),
+                        "header": _COLUMN_HEADER.pack(*headers[name]).hex(),
+                    }
+                    for name, full in files.items()
+                    if full in tails
+                },
+                "replaced": [os.path.basename(full) for full in staged],
+                "rows": headers[names[0]][3],
+                "stats": old_stats,
+            },
+            fh,
+        )
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(
+        os.path.join(path, _APPEND_JOURNAL + _APPEND_TMP_SUFFIX),
+        os.path.join(path, _APPEND_JOURNAL),
+    )
+    _fsync_dir(path)
+
+    if added:
+        with open(sym_path, "r+b") as fh:
+            fh.seek(0, os.SEEK_END)
+            for sym in added:
+                raw = sym.encode()
+                fh.write(struct.pack("<I", len(raw)) + raw)
+            fh.flush()
+            os.fsync(fh.fileno())
+            fh.seek(len(_SYMFILE_MAGIC))
+            fh.write(struct.pack("<I", domain))
+            os.fsync(fh.fileno())
+    for full, (items, _) in tails.items():
+        with open(full, "r+b") as fh:
+            fh.seek(0, os.SEEK_END)
+            fh.write(items)
+            fh.flush()
+            os.fsync(fh.fileno())
+    for full, (_, header) in tails.items():
+        with open(full, "r+b") as fh:
+            fh.seek(_COLUMN_HEADER_OFFSET)
+            fh.write(header)
+            fh.flush()
+            os.fsync(fh.fileno())
+    for full, stage in staged.items():
+        os.link(full, os.path.join(path, f".{os.path.basename(full)}{_APPEND_OLD_SUFFIX}"))
+        os.replace(stage, full)
+    if old_stats is not None:
+        with open(os.path.join(path, _STATS_FILE), "w") as fh:
+            json.dump(_merge_stats(old_stats, _column_stats(table)), fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+    _fsync_dir(path)
+    os.remove(os.path.join(path, _APPEND_JOURNAL))
+    _fsync_dir(path)
+    # With the journal gone the append is committed; this only sweeps the
+    # replaced columns' backups.
+    _recover_splayed_append(path)
 
 
 def _col_name(c: t.Any) -> str:
@@ -193,8 +948,8 @@ class AggregationMixin:
             return Expression(Operation.NOT, self)
         return Expression(Operation.EQUALS, self, other)
 
-    def isin(self, values: list[t.Any] | RayObject) -> Expression:
-        if isinstance(values, RayObject):
+    def isin(self, values: list[t.Any] | RayObject | Param) -> Expression:
+        if isinstance(values, (RayObject, Param)):
             return Expression(Operation.IN, self, values)
 
         if all(isinstance(x, type(values[0])) for x in values):
@@ -209,6 +964,81 @@ class AggregationMixin:
 
         return Expression(Operation.IN, self, Expression(Operation.LIST, *values))
 
+    # Window functions. Inside a grouped select they run over each group's
+    # rows separately, in table order.
+    def rolling(self, n: int) -> Rolling:
+        return Rolling(self, n)
+
+    def cumsum(self) -> Expression:
+        return _WindowExpression(_WindowKind.CUMSUM, self)
+
+    def cummax(self) -> Expression:
+        return _WindowExpression(_WindowKind.CUMMAX, self)
+
+    def cummin(self) -> Expression:
+        return _WindowExpression(_WindowKind.CUMMIN, self)
+
+    def shift(self, k: int = 1) -> Expression:
+        """Value `k` rows earlier (later for negative `k`); null where that
+        row does not exist."""
+        if not isinstance(k, int):
+            raise errors.RayforceValueError(f"shift() expects an integer offset, got {k!r}")
+        return _WindowExpression(_WindowKind.SHIFT, self, k)
+
+    def diff(self, k: int = 1) -> Expression:
+        if not isinstance(k, int):
+            raise errors.RayforceValueError(f"diff() expects an integer offset, got {k!r}")
+        return _WindowExpression(_WindowKind.DIFF, self, k)
+
+    def ema(self, alpha: float) -> Expression:
+        """Exponential moving average, y[i] = alpha * x[i] + (1 - alpha) * y[i-1],
+        starting from the first value. Nulls carry the previous average."""
+        if not 0 < alpha <= 1:
+            raise errors.RayforceValueError(f"ema() expects 0 < alpha <= 1, got {alpha!r}")
+        return _WindowExpression(_WindowKind.EMA, self, float(alpha))
+
+    def approx_distinct(self, precision: int = 12) -> Expression:
+        """Approximate distinct count from a HyperLogLog sketch with
+        `2**precision` registers (about 1.6% standard error at 12)."""
+        HyperLogLog(precision)  # validates
+        return _SketchExpression(_WindowKind.APPROX_DISTINCT, self, precision)
+
+    def approx_quantile(self, q: float, relative_accuracy: float = 0.01) -> Expression:
+        """Approximate `q`-quantile, within `relative_accuracy` of the exact
+        value."""
+        if not 0 <= q <= 1:
+            raise errors.RayforceValueError(f"Quantile must be in [0, 1], got {q!r}")
+        QuantileSketch(relative_accuracy)  # validates
+        return _SketchExpression(_WindowKind.APPROX_QUANTILE, self, float(q), relative_accuracy)
+
+    def quantile(self, q: float | t.Sequence[float]) -> Expression:
+        """Exact `q`-quantile, interpolating linearly between the two nearest
+        values (numpy's default). A sequence of quantiles gives an F64 vector
+        per group, in the order asked for."""
+        qs = [q] if isinstance(q, (int, float)) else list(q)
+        if not qs or not all(isinstance(x, (int, float)) and 0 <= x <= 1 for x in qs):
+            raise errors.RayforceValueError(f"Quantiles must be in [0, 1], got {q!r}")
+        if isinstance(q, (int, float)):
+            return _GroupedAggregation(_WindowKind.QUANTILE, self, float(q))
+        return _GroupedAggregation(_WindowKind.QUANTILE, self, tuple(float(x) for x in qs))
+
+    def histogram(self, bins: int | t.Sequence[float]) -> Expression:
+        """I64 vector of value counts per bin. An integer gives that many
+        equal-width bins spanning the selected rows, the same edges for every
+        group; a sequence gives the edges themselves. As in numpy, the last
+        bin includes its right edge and values outside the edges are not
+        counted."""
+        if isinstance(bins, int):
+            if bins < 1:
+                raise errors.RayforceValueError(f"histogram() needs at least one bin, got {bins}")
+            return _GroupedAggregation(_WindowKind.HISTOGRAM, self, bins)
+        edges = tuple(float(x) for x in bins)
+        if len(edges) < 2 or np.any(np.diff(edges) <= 0):
+            raise errors.RayforceValueError(
+                f"histogram() edges must be at least two increasing values, got {bins!r}"
+            )
+        return _GroupedAggregation(_WindowKind.HISTOGRAM, self, edges)
+
 
 # Method name → Operation member. mean is an AVG alias; deviation is population
 # std (engine `dev`); std is sample std (engine `stddev`).
@@ -303,7 +1133,9 @@ del _dunder, _op
 
 
 class Expression(AggregationMixin, OperatorMixin):
-    def __init__(self, operation: Operation | Fn | r.RayObject, *operands: t.Any) -> None:
+    def __init__(
+        self, operation: Operation | Fn | r.RayObject | _WindowKind, *operands: t.Any
+    ) -> None:
         self.operation = operation
         self.operands = operands
 
@@ -340,6 +1172,8 @@ class Expression(AggregationMixin, OperatorMixin):
                 converted_operands.append(operand.compile(ipc=ipc))
             elif isinstance(operand, Column):
                 converted_operands.append(_make_name_sym(operand.name))
+            elif isinstance(operand, Param):
+                converted_operands.append(_make_name_sym(operand.bound_name))
             elif hasattr(operand, "ptr"):
                 converted_operands.append(operand)
             elif isinstance(operand, str):
@@ -364,6 +1198,75 @@ class _ShiftTzExpression(Expression):
     recovers it by casting the column Python-side after the select runs."""
 
 
+class _WindowKind(enum.StrEnum):
+    """Functions computed over the column buffers rather than by the engine."""
+
+    CUMSUM = "cumsum"
+    CUMMAX = "cummax"
+    CUMMIN = "cummin"
+    SHIFT = "shift"
+    DIFF = "diff"
+    EMA = "ema"
+    ROLLING_SUM = "rolling_sum"
+    ROLLING_MEAN = "rolling_mean"
+    ROLLING_MAX = "rolling_max"
+    ROLLING_MIN = "rolling_min"
+    QUANTILE = "quantile"
+    HISTOGRAM = "histogram"
+    APPROX_DISTINCT = "approx_distinct"
+    APPROX_QUANTILE = "approx_quantile"
+
+
+class _WindowExpression(Expression):
+    """A window function: `kind` names it, the operands are the input
+    followed by the kind's parameters. The DAG select has no window
+    operators, so these never compile to a ray form; `SelectQuery` computes
+    them over the column buffers and projects the result by name."""
+
+    def __init__(self, kind: _WindowKind, *operands: t.Any) -> None:
+        super().__init__(kind, *operands)
+        self.kind = kind
+
+    def compile(self, *, ipc: bool = False) -> r.RayObject:  # noqa: ARG002
+        raise errors.RayforceQueryCompilationError(
+            f"{self.kind}() is only supported in a select projection"
+        )
+
+
+class _GroupedAggregation(_WindowExpression):
+    """An aggregation the engine has no verb for, computed per group over
+    the column buffers. Each group's result is spread over its rows and the
+    query then takes the first one per group."""
+
+
+class _SketchExpression(_GroupedAggregation):
+    """An approximate aggregation, answered from a mergeable sketch built
+    per group over the column buffers (see `rayforce.utils.sketch`)."""
+
+
+class Rolling:
+    """Fixed-size trailing window over the last `n` rows, from `rolling(n)`.
+    Results are null until the window is full; nulls inside it are skipped."""
+
+    def __init__(self, source: AggregationMixin, n: int) -> None:
+        if not isinstance(n, int) or n < 1:
+            raise errors.RayforceValueError(f"rolling() expects a positive window size, got {n!r}")
+        self.source = source
+        self.n = n
+
+    def sum(self) -> Expression:
+        return _WindowExpression(_WindowKind.ROLLING_SUM, self.source, self.n)
+
+    def mean(self) -> Expression:
+        return _WindowExpression(_WindowKind.ROLLING_MEAN, self.source, self.n)
+
+    def max(self) -> Expression:
+        return _WindowExpression(_WindowKind.ROLLING_MAX, self.source, self.n)
+
+    def min(self) -> Expression:
+        return _WindowExpression(_WindowKind.ROLLING_MIN, self.source, self.n)
+
+
 class Column(AggregationMixin, OperatorMixin):
     def __init__(self, name: str, table: Table | None = None):
         self.name = name
@@ -380,6 +1283,50 @@ class Column(AggregationMixin, OperatorMixin):
         return _ShiftTzExpression(Operation.ADD, self, tz_offset_nanos(tz))
 
 
+class Param:
+    """Named placeholder for a literal in a prepared query.
+
+    A parameter compiles to a reference to the `__param_<name>` global, so a
+    compiled plan never embeds the value: `PreparedQuery.execute` binds the
+    global, re-evaluates the same plan object and unbinds it again."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @property
+    def bound_name(self) -> str:
+        return f"__param_{self.name}"
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+
+# A column to sort on: a name / Column using the call's `desc`, or a
+# `(column, "asc" | "desc")` pair carrying its own direction.
+OrderKey = Column | str | tuple[Column | str, str]
+
+
+def _order_spec(
+    cols: tuple[OrderKey, ...], desc: bool
+) -> tuple[tuple[str, ...], bool | tuple[bool, ...]]:
+    """Normalise `order_by` arguments to `(names, desc)`. `desc` stays a
+    single bool when every key sorts the same way, which keeps the common
+    case on the native `xasc`/`xdesc` path; otherwise it is one flag per key."""
+    names: list[str] = []
+    flags: list[bool] = []
+    for key in cols:
+        col, direction = key if isinstance(key, tuple) else (key, "desc" if desc else "asc")
+        if direction not in ("asc", "desc"):
+            raise errors.RayforceValueError(
+                f"Sort direction must be 'asc' or 'desc', got {direction!r}"
+            )
+        names.append(col.name if isinstance(col, Column) else col)
+        flags.append(direction == "desc")
+    if len(set(flags)) <= 1:
+        return tuple(names), flags[0] if flags else desc
+    return tuple(names), tuple(flags)
+
+
 def _coerce_column(col: t.Any) -> t.Any:
     """Unify homogeneous Python lists and rayforce `List` columns into a
     typed `Vector`. RAY_LIST columns are not accepted by the v2 DAG filter
@@ -407,8 +1354,8 @@ class TableInitMixin:
     _ptr: r.RayObject | str
     type_code: int
 
-    def __init__(self, ptr: r.RayObject | str | dict[str, Vector]) -> None:
-        if isinstance(ptr, dict):
+    def __init__(self, ptr: r.RayObject | str | Mapping[str, Vector | List]) -> None:
+        if isinstance(ptr, Mapping):
             coerced = {name: _coerce_column(val) for name, val in ptr.items()}
             self._ptr, self.is_reference = (
                 FFI.init_table(
@@ -452,10 +1399,47 @@ class TableInitMixin:
         return cls(columns)
 
     @classmethod
-    def from_csv(cls, column_types: list[RayObject], path: str) -> t.Self:
+    def from_csv(
+        cls,
+        column_types: list[RayObject],
+        path: str,
+        *,
+        compression: str | None = "infer",
+    ) -> t.Self:
         schema = Vector([c.ray_name.upper() for c in column_types], ray_type=Symbol).ptr
-        result = FFI.read_csv(schema, FFI.init_string(path))
-        return cls(result)
+        codec = compression_utils.resolve_compression(path, compression)
+        if codec is None:
+            return cls(FFI.read_csv(schema, FFI.init_string(path)))
+
+        # The core parser mmaps its input, so it cannot consume a pipe. The
+        # inflated stream is parsed a piece of whole records at a time, each
+        # from its own short-lived scratch file, and the pieces concatenated.
+        parts: list[_TableProtocol] = []
+        with (
+            tempfile.TemporaryDirectory(prefix="rayforce-csv-") as scratch,
+            compression_utils.open_compressed(path, "rb", codec) as stream,
+        ):
+            for i, chunk in enumerate(_csv_chunks(stream, _CSV_CHUNK_BYTES)):
+                plain = os.path.join(scratch, f"{i}.csv")
+                with open(plain, "wb") as fh:
+                    fh.write(chunk)
+                parts.append(Table(FFI.read_csv(schema, FFI.init_string(plain))))
+                # Unlinking leaves anything parsed from the file intact, and
+                # keeps at most one piece on disk.
+                os.remove(plain)
+        return cls(_concat_tables(parts).ptr if len(parts) > 1 else parts[0].ptr)
+
+    @classmethod
+    def load(cls, path: str) -> t.Self:
+        """Restore a table written by `Table.dump`. The file is read once into
+        a core buffer and decoded from there; the wire format cannot be used
+        in place, so nothing is mapped. For restores that map column files
+        instead of copying them, save with `set_splayed` and reopen with
+        `from_splayed`."""
+        ptr = FFI.load_obj(os.fspath(path))
+        if FFI.get_obj_type(ptr) != r.TYPE_TABLE:
+            raise errors.RayforceTypeError(f"Snapshot at {path} does not hold a table")
+        return cls(ptr)
 
     @property
     def ptr(self) -> r.RayObject:
@@ -466,49 +1450,52 @@ class TableInitMixin:
     @property
     def evaled_ptr(self) -> r.RayObject:
         if isinstance(self._ptr, str):
-            return utils.eval_str(self._ptr).ptr
+            # Resolved as a name reference: `eval_str` would also drop the
+            # cached schemas of every reference table.
+            return utils.eval_obj(_make_name_sym(self._ptr)).ptr
         return self._ptr
 
     @classmethod
-    def from_splayed(cls, path: str, symfile: str | None = None) -> Table:
-        sym_ptr = FFI.init_string(symfile) if symfile is not None else None
-        _tbl_ptr = FFI.get_splayed(FFI.init_string(path), sym_ptr)
+    def from_splayed(
+        cls, path: str, symfile: str | None = None, *, columns: list[str] | None = None
+    ) -> Table:
+        # Never during an append; after one that was interrupted, the rows it
+        # left behind are not read, and only the next append rolls it back.
+        with _file_lock(os.path.join(path, _APPEND_LOCK), shared=True):
+            _tbl_ptr = _get_splayed(path, symfile, columns)
         _tbl = utils.ray_to_python(_tbl_ptr)
         _tbl.is_parted = True
         return _tbl
 
     @classmethod
-    def from_parted(cls, path: str, name: str) -> Table:
+    def from_parted(
+        cls, path: str, name: str, *, lazy: bool = False, columns: list[str] | None = None
+    ) -> Table | PartedTable:
         part_dirs = _collect_part_dirs(path)
         if not part_dirs:
             _tbl_ptr = FFI.get_parted(FFI.init_string(path), QuotedSymbol(name).ptr)
+            if columns is not None:
+                _tbl_ptr = _project_columns(_tbl_ptr, columns)
             _tbl = utils.ray_to_python(_tbl_ptr)
             _tbl.is_parted = True
             return _tbl
+        if lazy:
+            return PartedTable(path, name, columns=columns)
 
-        part_col_name, part_values, part_ray_type = _infer_part_column(part_dirs)
+        part_col_name, part_values, part_ray_type = _infer_part_column(path, part_dirs)
         sym_path = os.path.join(path, "sym")
-        has_sym = os.path.exists(sym_path)
-
         root = path.rstrip("/")
-        parts: list[Table] = []
-        for part_dir, part_value in zip(part_dirs, part_values, strict=True):
-            splayed = f"{root}/{part_dir}/{name}/"
-            part_tbl = cls.from_splayed(splayed, sym_path if has_sym else None)
-            part_tbl.is_parted = False
-            nrows = len(part_tbl)
-            part_col = Vector(items=[part_value] * nrows, ray_type=part_ray_type)
-            cols = part_tbl.columns().to_python()
-            col_names = [part_col_name] + [_col_name(c) for c in cols]
-            col_values = [part_col] + [part_tbl[_col_name(c)] for c in cols]
-            parts.append(
-                Table(
-                    FFI.init_table(
-                        columns=Vector(items=col_names, ray_type=Symbol).ptr,
-                        values=List(col_values).ptr,
-                    )
-                )
+        parts = [
+            _load_partition(
+                f"{root}/{part_dir}/{name}/",
+                sym_path if os.path.exists(sym_path) else None,
+                part_col_name=part_col_name,
+                part_value=part_value,
+                part_ray_type=part_ray_type,
+                columns=columns,
             )
+            for part_dir, part_value in zip(part_dirs, part_values, strict=True)
+        ]
 
         result = parts[0].concat(*parts[1:]) if len(parts) > 1 else parts[0]
         result.is_parted = True
@@ -526,32 +1513,250 @@ class TableIOMixin:
         @property
         def evaled_ptr(self) -> r.RayObject: ...
 
+        def columns(self) -> Vector: ...
+
+        def values(self) -> List: ...
+
     def ipcsave(self, name: str) -> Expression:
         return Expression(Operation.SET, name, self.ptr)
 
     def save(self, name: str) -> None:
         FFI.binary_set(FFI.init_symbol(name), self.ptr)
-
-    def set_splayed(self, path: str, symlink: str | None = None) -> None:
+        _forget_reference_schemas(name)
+
+    def dump(self, path: str) -> int:
+        """Write a binary snapshot (the IPC serialization format) to `path`.
+        The core serializes into one buffer, so the encoding is held in memory
+        while it is written; it is not streamed. The file is replaced
+        atomically; returns the number of bytes written."""
+        path = os.fspath(path)
+        staging = f"{path}.tmp"
+        written = FFI.dump_obj(self.evaled_ptr, staging)
+        os.replace(staging, path)
+        return written
+
+    def set_splayed(
+        self,
+        path: str,
+        symlink: str | None = None,
+        *,
+        compression: str | None = None,
+        stats: bool = True,
+    ) -> None:
+        codec = None
+        if compression is not None:
+            codec = compression_utils.resolve_compression(path, compression)
+            if codec is None:
+                raise errors.RayforceValueError(
+                    "Splayed compression must name a codec: 'gzip', 'zstd' or 'lz4'"
+                )
         os.makedirs(path, exist_ok=True)
         sym_ptr = FFI.init_string(symlink) if symlink is not None else None
-        FFI.set_splayed(FFI.init_string(path), self.evaled_ptr, sym_ptr)
+        table = self.evaled_ptr
+        # A compressed copy of a column left by an earlier write would be
+        # inflated over the fresh plain file on load.
+        names = {_col_name(c) for c in utils.ray_to_python(FFI.get_table_keys(table))}
+        for entry in os.listdir(path):
+            if (
+                compression_utils.codec_for_suffix(entry) is not None
+                and os.path.splitext(entry)[0] in names
+            ):
+                os.remove(os.path.join(path, entry))
+        # Stats left by an earlier write would describe the old rows.
+        _drop_stats(path)
+        FFI.set_splayed(FFI.init_string(path), table, sym_ptr)
+        if stats:
+            _write_stats(path, table)
+        if codec is not None:
+            for column_file in _splayed_column_files(path, symlink):
+                compression_utils.compress_file(column_file, codec)
+
+    def to_splayed(
+        self,
+        path: str,
+        symlink: str | None = None,
+        *,
+        compression: str | None = None,
+        stats: bool = True,
+    ) -> None:
+        self.set_splayed(path, symlink, compression=compression, stats=stats)
+
+    def append_splayed(self, path: str, symlink: str | None = None) -> None:
+        """Append this table's rows to the splayed table at `path`.
+
+        Each column file is extended in place and the symfile only gains the
+        symbols it did not have, so a flush costs the size of the new rows
+        rather than of the whole table. Appends to a directory are serialised
+        by a lock file in it, and the symfile is written under the same lock
+        the core takes for it. The append is journaled: loads of the
+        directory read past one a crash interrupted, and the next
+        `append_splayed` rolls it back. Writes to a missing directory create
+        it with `set_splayed`.
+        """
+        target = path.rstrip("/")
+        if not os.path.isfile(os.path.join(target, ".d")):
+            self.set_splayed(f"{target}/", symlink)
+            return
+        sym_path = symlink if symlink is not None else os.path.join(target, ".sym")
+        with (
+            _file_lock(os.path.join(target, _APPEND_LOCK)),
+            _file_lock(f"{sym_path}.lk"),
+        ):
+            _recover_splayed_append(target)
+            _append_splayed(target, symlink, self.evaled_ptr)
 
-    def to_splayed(self, path: str, symlink: str | None = None) -> None:
-        self.set_splayed(path, symlink)
+    def to_parted(
+        self,
+        root: str,
+        partition_by: str = "date",
+        name: str = "t",
+        *,
+        compression: str | None = None,
+        stats: bool = True,
+    ) -> list[str]:
+        """Write the table as a partitioned layout readable by `from_parted`.
+
+        The partition column is scanned once: a stable argsort yields every
+        partition's row indices, each partition is gathered natively and
+        written as `root/<value>/<name>/` with the partition column dropped.
+        All partitions enumerate symbols against one shared `root/sym`.
+        The partition column's name and type are recorded at the root, so
+        `from_parted` restores the column as it was. Returns the partition
+        directory names in write order.
+        """
+        col_names = [_col_name(c) for c in self.columns()]
+        if partition_by not in col_names:
+            raise errors.RayforceValueError(f"Partition column not found: {partition_by}")
+        if len(col_names) == 1:
+            raise errors.RayforceValueError("Cannot partition a table with no data columns")
+
+        values = self.values()
+        part_vec = values[col_names.index(partition_by)]
+        type_code = FFI.get_obj_type(part_vec.ptr)
+        if type_code not in _PART_KEY_DTYPES:
+            raise errors.RayforceTypeError(
+                f"Partition column '{partition_by}' must be a date or integer column"
+            )
+
+        dtype = _PART_KEY_DTYPES[type_code]
+        keys = np.frombuffer(FFI.read_vector_raw(part_vec.ptr), dtype=dtype)
+        if (keys == np.iinfo(dtype).min).any():
+            raise errors.RayforceValueError(f"Partition column '{partition_by}' contains nulls")
+        if len(keys) == 0:
+            return []
+
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        bounds = np.flatnonzero(np.diff(sorted_keys)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [len(sorted_keys)]))
+
+        data_names = [c for c in col_names if c != partition_by]
+        data_tbl = FFI.init_table(
+            columns=Vector(items=data_names, ray_type=Symbol).ptr,
+            values=FFI.init_list(
+                [values[i].ptr for i, c in enumerate(col_names) if c != partition_by]
+            ),
+        )
+        sym_path = os.path.join(root, "sym")
+        root = root.rstrip("/")
+        os.makedirs(root, exist_ok=True)
+        with open(os.path.join(root, _PART_META_FILE), "w") as fh:
+            json.dump({"column": partition_by, "type": type_code}, fh)
+
+        written: list[str] = []
+        for start, stop in zip(starts, stops, strict=True):
+            key = int(sorted_keys[start])
+            if type_code == r.TYPE_DATE:
+                part_dir = (_PART_DATE_EPOCH + dt.timedelta(days=key)).strftime("%Y.%m.%d")
+            else:
+                part_dir = str(key)
+            idx = Vector.from_numpy(order[start:stop].astype(np.int64))
+            part_tbl = utils.eval_obj(List([Operation.AT, data_tbl, idx]))
+            part_tbl.set_splayed(
+                f"{root}/{part_dir}/{name}/", sym_path, compression=compression, stats=stats
+            )
+            written.append(part_dir)
+        return written
 
-    def set_csv(self, path: str, separator: str | None = None) -> None:
-        FFI.write_csv(self.evaled_ptr, FFI.init_string(path))
-        if separator is not None and separator != ",":
-            # Re-emit via the stdlib csv module so embedded commas inside
-            # quoted fields survive the delimiter change. A naive
-            # str.replace(",", sep) corrupts any comma-bearing values.
-            import csv
+    def set_csv(
+        self,
+        path: str,
+        separator: str | None = None,
+        *,
+        quote_char: str = '"',
+        null_value: str = "",
+        compression: str | None = "infer",
+    ) -> None:
+        sep = "," if separator is None else separator
+        if len(sep) != 1 or len(quote_char) != 1:
+            raise errors.RayforceValueError(
+                "CSV separator and quote_char must be single characters"
+            )
+        if sep == quote_char or sep in "\r\n" or quote_char in "\r\n":
+            raise errors.RayforceValueError(
+                f"Invalid CSV dialect: separator={sep!r}, quote_char={quote_char!r}"
+            )
+        codec = compression_utils.resolve_compression(path, compression)
 
-            with open(path, newline="") as fh:
-                rows = list(csv.reader(fh))
-            with open(path, "w", newline="") as fh:
-                csv.writer(fh, delimiter=separator).writerows(rows)
+        if sep == "," and quote_char == '"' and null_value == "" and codec is None:
+            FFI.write_csv(self.evaled_ptr, FFI.init_string(path))
+            return
+
+        # Non-default dialects are formatted natively in bounded row chunks
+        # and streamed to the sink, so peak memory is one chunk of text
+        # rather than the whole file (and compression happens on the fly).
+        table = self.evaled_ptr
+        nrows = FFI.get_obj_length(table)
+        dialect = {"separator": sep, "quote": quote_char, "null_value": null_value}
+        with compression_utils.open_compressed(path, "wb", codec) as sink:
+            sink.write(FFI.format_csv(table, 0, 0, header=True, **dialect))
+            for offset in range(0, nrows, _CSV_CHUNK_ROWS):
+                length = min(_CSV_CHUNK_ROWS, nrows - offset)
+                sink.write(FFI.format_csv(table, offset, length, header=False, **dialect))
+
+
+class _TableMeta:
+    """Schema of one table object: its column names, the boxed key vector,
+    (computed on first use) the per-column dtypes and the join indexes built
+    with `Table.index`. The table itself is held, so its address cannot be
+    reused by another object while the schema is cached."""
+
+    __slots__ = ("addr", "columns", "dtypes", "indexes", "names", "table")
+
+    def __init__(self, table: r.RayObject) -> None:
+        self.table = table
+        self.addr = FFI.obj_addr(table)
+        self.columns: Vector = utils.ray_to_python(FFI.get_table_keys(table))
+        self.names = [_col_name(c) for c in self.columns]
+        self.dtypes: dict[str, str] | None = None
+        self.indexes: dict[tuple[str, ...], _KeyIndex] = {}
+
+
+# Schemas of reference tables, by name. An entry is only trusted while the
+# name still resolves to the same table object. Every path that binds
+# globals drops the entries it may have rebound: insert/upsert/update
+# through a reference, `Table.save`, `Fn` binding, `restore_env` and any
+# `eval_str`.
+_reference_schemas: dict[str, _TableMeta] = {}
+
+
+def _forget_reference_schemas(name: str | None = None) -> None:
+    """Drop the cached schema of the reference table `name`, or of every
+    reference table."""
+    if name is None:
+        _reference_schemas.clear()
+    else:
+        _reference_schemas.pop(name, None)
+
+
+def _invalidate_table_meta(table: t.Any) -> None:
+    if getattr(table, "is_reference", False):
+        _forget_reference_schemas(table._ptr)
+    elif isinstance(table, TableValueAccessorMixin):
+        # The engine may have appended to the object in place.
+        table._schema = None
+        table._rows = None
 
 
 class DestructiveOperationHandler:
@@ -570,6 +1775,10 @@ class DestructiveOperationHandler:
 class TableValueAccessorMixin:
     _ptr: r.RayObject | str
     is_parted: bool
+    # Metadata caches. Non-reference tables wrap an immutable object, so both
+    # are kept for the instance's lifetime.
+    _schema: _TableMeta | None = None
+    _rows: int | None = None
 
     if t.TYPE_CHECKING:
         is_reference: bool
@@ -630,8 +1839,30 @@ class TableValueAccessorMixin:
 
         return utils.eval_obj(List([Operation.TAKE, self.evaled_ptr, args]))
 
+    def _table_schema(self) -> _TableMeta:
+        table = self.evaled_ptr
+        if isinstance(self._ptr, str):
+            schema = _reference_schemas.get(self._ptr)
+            # The schema holds its table, so an equal address is the same object.
+            if schema is None or schema.addr != FFI.obj_addr(table):
+                schema = _reference_schemas[self._ptr] = _TableMeta(table)
+            return schema
+        if self._schema is None:
+            self._schema = _TableMeta(table)
+        return self._schema
+
+    def _row_count(self) -> int:
+        if self._rows is not None:
+            return self._rows
+        # Length of the first column, read straight off the object.
+        values = FFI.get_table_values(self.evaled_ptr)
+        rows = FFI.get_obj_length(FFI.at_idx(values, 0)) if FFI.get_obj_length(values) else 0
+        if not isinstance(self._ptr, str):
+            self._rows = rows
+        return rows
+
     def columns(self) -> Vector:
-        return utils.ray_to_python(FFI.get_table_keys(self.evaled_ptr))
+        return self._table_schema().columns
 
     @DestructiveOperationHandler()
     def values(self) -> List:
@@ -639,17 +1870,11 @@ class TableValueAccessorMixin:
 
     @DestructiveOperationHandler()
     def shape(self) -> tuple[int, int]:
-        rows = utils.eval_obj(
-            List([Operation.COUNT, [Operation.AT, [Operation.VALUE, self.evaled_ptr], 0]])
-        )
-        cols = utils.eval_obj(List([Operation.COUNT, [Operation.KEY, self.evaled_ptr]]))
-        return (rows.value, cols.value)
+        return (self._row_count(), len(self._table_schema().names))
 
     @DestructiveOperationHandler()
     def __len__(self) -> int:
-        return utils.eval_obj(
-            List([Operation.COUNT, [Operation.AT, [Operation.VALUE, self.evaled_ptr], 0]])
-        ).value
+        return self._row_count()
 
     @DestructiveOperationHandler()
     def __getitem__(
@@ -727,29 +1952,106 @@ class TableValueAccessorMixin:
         return t.cast("Table", self).take(-n)
 
     @DestructiveOperationHandler()
-    def describe(self) -> dict[str, dict[str, t.Any]]:
-        stats: dict[str, dict[str, t.Any]] = {}
-        columns, values = self.columns(), self.values()
+    def sample(
+        self,
+        n: int | None = None,
+        *,
+        frac: float | None = None,
+        seed: int | None = None,
+        by: str | t.Sequence[str] | None = None,
+    ) -> Table:
+        """Random rows, drawn without replacement and kept in table order:
+        `n` of them or a `frac` of the table. With `by`, each group of those
+        columns is sampled separately (`n` rows or `frac` of each group).
+        The same `seed` draws the same rows."""
+        if (n is None) == (frac is None):
+            raise errors.RayforceValueError("sample() needs exactly one of n and frac")
+        if n is not None and (not isinstance(n, int) or n < 0):
+            raise errors.RayforceValueError(f"sample() n must be a non-negative integer, got {n!r}")
+        if frac is not None and not 0 <= frac <= 1:
+            raise errors.RayforceValueError(f"sample() frac must be in [0, 1], got {frac!r}")
+
+        names = self._table_schema().names
+        keys = [by] if isinstance(by, str) else list(by or ())
+        if missing := [k for k in keys if k not in names]:
+            raise errors.RayforceValueError(f"Columns not found: {', '.join(missing)}")
+        length, codes = self._row_count(), None
+        if keys and length:
+            codes, _ = _first_seen_codes([self.at_column(k).to_numpy() for k in keys])
+        rows = _sample_rows(length, n, frac, seed, codes)
+        return _take_rows(t.cast("_TableProtocol", self), rows)
 
-        numeric_types = {r.TYPE_I64, r.TYPE_I32, r.TYPE_I16, r.TYPE_F64, r.TYPE_U8}
+    @DestructiveOperationHandler()
+    def index(self, on: str | list[str]) -> Table:
+        """Index the `on` key columns for joins. Later `inner_join`,
+        `left_join` and `semi_join`/`anti_join` against this table on the
+        same columns look keys up in the index instead of hashing the
+        table again, for as long as the table is unchanged. Returns the
+        table."""
+        keys = [on] if isinstance(on, str) else list(on)
+        table = t.cast("_TableProtocol", self)
+        self._table_schema().indexes[tuple(keys)] = _KeyIndex(_key_arrays(table, keys))
+        return t.cast("Table", self)
 
-        for i, col_name in enumerate(columns):
-            col_vector = values[i]
-            if not col_vector:
+    @DestructiveOperationHandler()
+    def describe(
+        self,
+        *,
+        percentiles: t.Sequence[float] = (0.25, 0.5, 0.75),
+        sample: int | None = None,
+        seed: int | None = None,
+    ) -> dict[str, dict[str, t.Any]]:
+        """Summary statistics for every numeric and temporal column: count
+        and null_count, mean, std (sample), min, the requested percentiles
+        and max. `count` excludes nulls. Temporal columns report dates, times
+        and datetimes (std as a timedelta).
+
+        Everything is computed from the raw column buffers, so describing a
+        wide table costs no engine round trips. `sample` restricts the
+        statistics to that many rows drawn at random (the same rows for
+        every column)."""
+        stats: dict[str, dict[str, t.Any]] = {}
+        rows: t.Any = None
+        for col_name, vec in zip(self.columns(), self.values(), strict=True):
+            type_code = FFI.get_obj_type(vec.ptr)
+            if (dtype := _DESCRIBE_DTYPES.get(type_code)) is None:
                 continue
-
-            if FFI.get_obj_type(col_vector.ptr) not in numeric_types:
+            raw = np.frombuffer(FFI.read_vector_raw(vec.ptr), dtype=dtype)
+            if not len(raw):
                 continue
-
-            name = _col_name(col_name)
-
-            stats[name] = {
-                "count": _unwrap_value(utils.eval_obj(List([Operation.COUNT, col_vector.ptr]))),
-                "mean": _unwrap_value(utils.eval_obj(List([Operation.AVG, col_vector.ptr]))),
-                "min": _unwrap_value(utils.eval_obj(List([Operation.MIN, col_vector.ptr]))),
-                "max": _unwrap_value(utils.eval_obj(List([Operation.MAX, col_vector.ptr]))),
+            if sample is not None and sample < len(raw):
+                if rows is None:
+                    rows = _sample_rows(len(raw), sample, None, seed)
+                raw = raw[rows]
+
+            if raw.dtype.kind == "f":
+                nulls = np.isnan(raw)
+            elif type_code == r.TYPE_U8:
+                nulls = np.zeros(len(raw), dtype=bool)
+            else:
+                nulls = raw == np.iinfo(dtype).min
+            present = raw[~nulls]
+            entry: dict[str, t.Any] = {
+                "count": len(present),
+                "null_count": int(nulls.sum()),
             }
-
+            if len(present):
+                as_float = present.astype(np.float64)
+                quantiles = np.quantile(as_float, percentiles)
+                entry["mean"] = _describe_value(as_float.mean(), type_code)
+                entry["std"] = (
+                    _describe_value(as_float.std(ddof=1), type_code, spread=True)
+                    if len(present) > 1
+                    else None
+                )
+                entry["min"] = _describe_value(present.min().item(), type_code)
+                for q, value in zip(percentiles, quantiles, strict=True):
+                    entry[f"{q * 100:g}%"] = _describe_value(value.item(), type_code)
+                entry["max"] = _describe_value(present.max().item(), type_code)
+            else:
+                entry.update(dict.fromkeys(["mean", "std", "min", "max"]))
+                entry.update({f"{q * 100:g}%": None for q in percentiles})
+            stats[_col_name(col_name)] = entry
         return stats
 
     @property
@@ -757,16 +2059,17 @@ class TableValueAccessorMixin:
         # v2 `meta table` returns a summary dict ({'type': 'TABLE', 'len': N}),
         # not a per-column breakdown. Derive column types directly from each
         # column's type code via the scalar TypeRegistry entry.
-        cols = self.columns()
-        vals = self.values()
-        result: dict[str, str] = {}
-        for col_sym, vec in zip(cols, vals, strict=True):
-            name = _col_name(col_sym)
-            tc = FFI.get_obj_type(vec.ptr)
-            scalar_cls = TypeRegistry.get(-tc if tc > 0 else tc)
-            ray_name = getattr(scalar_cls, "ray_name", None) if scalar_cls else None
-            result[name] = ray_name.upper() if ray_name else str(tc)
-        return result
+        schema = self._table_schema()
+        if schema.dtypes is None:
+            values = FFI.get_table_values(self.evaled_ptr)
+            result: dict[str, str] = {}
+            for i, name in enumerate(schema.names):
+                tc = FFI.get_obj_type(FFI.at_idx(values, i))
+                scalar_cls = TypeRegistry.get(-tc if tc > 0 else tc)
+                ray_name = getattr(scalar_cls, "ray_name", None) if scalar_cls else None
+                result[name] = ray_name.upper() if ray_name else str(tc)
+            schema.dtypes = result
+        return dict(schema.dtypes)
 
     @DestructiveOperationHandler()
     def drop(self, *cols: str) -> Table:
@@ -795,30 +2098,57 @@ class TableValueAccessorMixin:
         select_args = {mapping.get(col, col): Column(col) for col in current_cols}
         return t.cast("Table", self).select(**select_args).execute()
 
-    def cast(self, column: str, to_type: type) -> Table:
-        current_cols = [_col_name(c) for c in self.columns()]
-        if column not in current_cols:
-            raise errors.RayforceConversionError(f"Column not found: {column}")
-
-        if not hasattr(to_type, "ray_name"):
+    def cast(self, column: str | Mapping[str, type], to_type: type | None = None) -> Table:
+        """Cast one column (``cast("px", F64)``) or several at once
+        (``cast({"px": F64, "qty": I32})``). Columns that are not cast are
+        carried over as-is, sharing their buffers with the source table."""
+        if isinstance(column, Mapping):
+            if to_type is not None:
+                raise errors.RayforceConversionError(
+                    "to_type must be omitted when cast() is given a mapping"
+                )
+            targets: dict[str, t.Any] = dict(column)
+        elif to_type is None:
             raise errors.RayforceConversionError(
-                f"Invalid target type: {to_type}. Must be a Rayforce type like I64, F64, Symbol."
+                "cast() needs a target type: cast(column, to_type) or cast({column: to_type})"
             )
+        else:
+            targets = {column: to_type}
+
+        current_cols = self._table_schema().names
+        for name, target in targets.items():
+            if name not in current_cols:
+                raise errors.RayforceConversionError(f"Column not found: {name}")
+            if not hasattr(target, "ray_name"):
+                raise errors.RayforceConversionError(
+                    f"Invalid target type: {target}. Must be a Rayforce type like I64, F64, Symbol."
+                )
 
         # v2's DAG SELECT rejects `(as 'type col)` as a projected expression,
-        # so cast the target column Python-side and rebuild the table via
-        # FFI.init_table directly.
-        target_sym = QuotedSymbol(to_type.ray_name.lower())
-        new_vecs: list[RayObject] = []
-        for col in current_cols:
-            vec = utils.eval_obj(List([Operation.AT, self.evaled_ptr, QuotedSymbol(col)]))
-            if col == column:
-                vec = utils.eval_obj(List([Operation.AS, target_sym, vec]))
-            new_vecs.append(vec)
+        # so cast the target columns Python-side and rebuild the table via
+        # FFI.init_table directly. All conversions run in one `(list ...)`
+        # evaluation; untouched columns are reused by reference.
+        values = FFI.get_table_values(self.evaled_ptr)
+        new_vecs = [FFI.at_idx(values, i) for i in range(len(current_cols))]
+        cast_idx = [current_cols.index(name) for name in targets]
+        if cast_idx:
+            converted = utils.eval_obj(
+                List(
+                    [
+                        Operation.LIST,
+                        *(
+                            [Operation.AS, QuotedSymbol(target.ray_name.lower()), new_vecs[i]]
+                            for i, target in zip(cast_idx, targets.values(), strict=True)
+                        ),
+                    ]
+                )
+            )
+            for pos, i in enumerate(cast_idx):
+                new_vecs[i] = FFI.at_idx(converted.ptr, pos)
 
         tbl_ptr = FFI.init_table(
-            columns=Vector(items=current_cols, ray_type=Symbol).ptr,
-            values=List([v.ptr for v in new_vecs]).ptr,
+            columns=FFI.get_table_keys(self.evaled_ptr),
+            values=FFI.init_list(new_vecs),
         )
         return Table(tbl_ptr)
 
@@ -897,15 +2227,16 @@ class TableQueryMixin:
     def upsert(self, *args, key_columns: int, **kwargs) -> UpsertQuery:
         return UpsertQuery(t.cast("_TableProtocol", self), *args, key_columns=key_columns, **kwargs)
 
-    def order_by(self, *cols: Column | str, desc: bool = False) -> SelectQuery:
+    def order_by(self, *cols: OrderKey, desc: bool = False) -> SelectQuery:
         return SelectQuery(table=t.cast("_TableProtocol", self)).order_by(*cols, desc=desc)
 
+    def lazy(self) -> LazyTable:
+        return LazyTable(t.cast("_TableProtocol", self))
+
     def concat(self, *others: _TableProtocol) -> Table:
-        result: _TableProtocol = t.cast("_TableProtocol", self)
-        for other in others:
-            expr = Expression(Operation.CONCAT, result.ptr, other.ptr)
-            result = t.cast("Table", utils.eval_obj(expr.compile()))
-        return t.cast("Table", result)
+        if not others:
+            return t.cast("Table", self)
+        return _concat_tables([t.cast("_TableProtocol", self), *others])
 
     def inner_join(self, other: _TableProtocol, on: str | list[str]) -> InnerJoin:
         return InnerJoin(t.cast("_TableProtocol", self), other, on)
@@ -916,6 +2247,14 @@ class TableQueryMixin:
     def asof_join(self, other: _TableProtocol, on: str | list[str]) -> AsofJoin:
         return AsofJoin(t.cast("_TableProtocol", self), other, on)
 
+    def semi_join(self, other: _TableProtocol, on: str | list[str]) -> SemiJoin:
+        """Rows whose `on` key is present in `other`, nothing of `other` added."""
+        return SemiJoin(t.cast("_TableProtocol", self), other, on)
+
+    def anti_join(self, other: _TableProtocol, on: str | list[str]) -> AntiJoin:
+        """Rows whose `on` key is absent from `other`."""
+        return AntiJoin(t.cast("_TableProtocol", self), other, on)
+
     def window_join(
         self,
         on: list[str],
@@ -962,6 +2301,60 @@ class Table(
     is_parted: bool = False
 
 
+@dataclass
+class QueryProfile:
+    """Wall time in seconds spent in each phase of one query execution:
+    building the ray form (`compile`), the engine call (`eval`), turning the
+    result into Python wrappers (`wrap`) and post-processing such as
+    temporal-dtype recovery (`recover`). `nbytes` is the serialized size of
+    the result; measuring it is not included in any phase."""
+
+    compile: float = 0.0
+    eval: float = 0.0
+    wrap: float = 0.0
+    recover: float = 0.0
+    rows: int = 0
+    nbytes: int = 0
+    result: t.Any = field(default=None, repr=False)
+
+    @property
+    def total(self) -> float:
+        return self.compile + self.eval + self.wrap + self.recover
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    def finish(self, result: t.Any) -> QueryProfile:
+        self.result = result
+        if isinstance(result, Table):
+            self.rows = len(result)
+        if hasattr(result, "ptr"):
+            self.nbytes = FFI.get_obj_length(FFI.ser_obj(result.ptr))
+        return self
+
+
+def _phase(profile: QueryProfile | None, name: str) -> t.ContextManager[None]:
+    return profile.phase(name) if profile is not None else contextlib.nullcontext()
+
+
+def _eval_form(form: t.Any, profile: QueryProfile | None) -> t.Any:
+    """`utils.eval_obj`, with the engine call and the result wrapping timed
+    as separate phases when profiling."""
+    if profile is None:
+        return utils.eval_obj(form)
+    with profile.phase("eval"):
+        result_ptr = FFI.eval_obj(form.ptr)
+    if FFI.get_obj_type(result_ptr) == r.TYPE_ERR:
+        raise errors.RayforceEvaluationError(f"Evaluation error: {FFI.get_error_obj(result_ptr)}")
+    with profile.phase("wrap"):
+        return utils.ray_to_python(result_ptr)
+
+
 class IPCQueryMixin:
     if t.TYPE_CHECKING:
 
@@ -971,6 +2364,11 @@ class IPCQueryMixin:
     def ipcsave(self, name: str) -> Expression:
         return Expression(Operation.SET, name, self.ipc)
 
+    def explain(self) -> str:
+        """The compiled ray expression this query sends to the engine.
+        Embedded tables are abbreviated."""
+        return FFI.repr_table(self.ipc, full=False)
+
 
 class _Join(IPCQueryMixin):
     type_: t.Literal[
@@ -999,8 +2397,67 @@ class _Join(IPCQueryMixin):
         return Expression(self.type_, *self.compile()).compile()
 
     def execute(self) -> Table:
+        if self.type_ in (Operation.INNER_JOIN, Operation.LEFT_JOIN):
+            on = [self.on] if isinstance(self.on, str) else list(self.on)
+            index = _cached_index(self.other, on)
+            if index is not None and (result := self._execute_indexed(index, on)) is not None:
+                return result
         return utils.eval_obj(List([self.type_, *self.compile()]))
 
+    def _execute_indexed(self, index: _KeyIndex, on: list[str]) -> Table | None:
+        """The join answered from an index of `other`, row for row as the
+        engine answers it: left rows in order, each followed by its matches
+        latest right row first, and the non-key columns of `other` after the
+        left ones even where their names clash. None when the engine has to
+        run it instead: either side has a LIST column, which the engine
+        drops, or unmatched rows need padding and `other` is empty."""
+        left_names = [_col_name(c) for c in self.table.columns()]
+        right_names = [_col_name(c) for c in self.other.columns()]
+        if _has_list_column(self.table) or _has_list_column(self.other):
+            return None
+
+        codes = index.lookup(_key_arrays(self.table, on))
+        matched = codes >= 0
+        counts = np.where(matched, index.starts[codes + 1] - index.starts[codes], 0)
+        if self.type_ is Operation.LEFT_JOIN:
+            counts = np.maximum(counts, 1)
+        left_rows = np.repeat(np.arange(len(codes)), counts)
+        offsets = np.arange(len(left_rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        last = index.starts[np.where(matched, codes + 1, 0)][left_rows] - 1
+        missing = ~matched[left_rows]
+        hits = np.flatnonzero(~missing)
+        if len(hits) < len(missing) and not index.length:
+            return None
+        right = _take_rows(self.other, index.rows[(last - offsets)[hits]])
+        if len(hits) < len(missing):
+            # Padding rows are gathered from a one-row null table, never by
+            # copying `other`, and interleaved with the hits by one gather.
+            padding = _take_rows(_null_row(self.other), np.zeros(len(missing) - len(hits)))
+            order = np.empty(len(missing), dtype=np.int64)
+            order[hits] = np.arange(len(hits))
+            order[missing] = np.arange(len(hits), len(missing))
+            right = _take_rows(_concat_tables([right, padding]), order)
+
+        extra = [i for i, n in enumerate(right_names) if n not in on]
+        left_values = FFI.get_table_values(_take_rows(self.table, left_rows).ptr)
+        right_values = FFI.get_table_values(right.ptr)
+        values = [FFI.at_idx(left_values, i) for i in range(len(left_names))]
+        values += [FFI.at_idx(right_values, i) for i in extra]
+        return Table(
+            FFI.init_table(
+                columns=Vector(
+                    items=[*left_names, *(right_names[i] for i in extra)], ray_type=Symbol
+                ).ptr,
+                values=FFI.init_list(values),
+            )
+        )
+
+    def profile(self) -> QueryProfile:
+        profile = QueryProfile()
+        with profile.phase("compile"):
+            form = List([self.type_, *self.compile()])
+        return profile.finish(_eval_form(form, profile))
+
 
 class _WindowJoin(_Join):
     def __init__(
@@ -1056,6 +2513,156 @@ class WindowJoin1(_WindowJoin):
     type_ = Operation.WINDOW_JOIN1
 
 
+class SemiJoin:
+    """Filter `table` by whether its key is present in `other`. The engine
+    has no semi-join verb, so the keys of `other` are indexed once and the
+    left keys looked up in one vectorized pass; only the surviving rows are
+    gathered."""
+
+    _keep_matches = True
+
+    def __init__(self, table: _TableProtocol, other: _TableProtocol, on: str | list[str]) -> None:
+        self.table = table
+        self.other = other
+        self.on = [on] if isinstance(on, str) else list(on)
+
+    def execute(self) -> Table:
+        index = _cached_index(self.other, self.on) or _KeyIndex(_key_arrays(self.other, self.on))
+        matched = index.lookup(_key_arrays(self.table, self.on)) >= 0
+        return _take_rows(self.table, np.flatnonzero(matched == self._keep_matches))
+
+
+class AntiJoin(SemiJoin):
+    _keep_matches = False
+
+
+class _KeyIndex:
+    """Sorted lookup structure over the key columns of a table: the distinct
+    values of each key column and, from the second column on, the distinct
+    combinations of the columns so far, each numbered densely. Looking up
+    another table's keys walks the same levels with binary searches.
+    `rows[starts[k]:starts[k + 1]]` are the indexed table's rows with key
+    number `k`, in table order."""
+
+    __slots__ = ("length", "levels", "rows", "starts")
+
+    def __init__(self, keys: list[t.Any]) -> None:
+        self.levels: list[tuple[t.Any, t.Any]] = []
+        self.length = len(keys[0])
+        codes = np.zeros(self.length, dtype=np.int64)
+        for i, key in enumerate(keys):
+            uniques, inverse = np.unique(key, return_inverse=True)
+            combined = None
+            if i:
+                # Re-densify after each column so the combined code cannot overflow.
+                combined, inverse = np.unique(codes * len(uniques) + inverse, return_inverse=True)
+            self.levels.append((uniques, combined))
+            codes = inverse.reshape(-1)
+        self.rows = np.argsort(codes, kind="stable")
+        self.starts = np.searchsorted(codes[self.rows], np.arange(codes.max(initial=-1) + 2))
+
+    def lookup(self, keys: list[t.Any]) -> t.Any:
+        """Each row's key number in the index, -1 where it is absent."""
+        codes = np.zeros(len(keys[0]), dtype=np.int64)
+        for (uniques, combined), key in zip(self.levels, keys, strict=True):
+            found = _sorted_lookup(uniques, key)
+            if combined is not None:
+                pairs = codes * len(uniques) + found
+                found = np.where((codes >= 0) & (found >= 0), _sorted_lookup(combined, pairs), -1)
+            codes = found
+        return codes
+
+
+def _cached_index(table: _TableProtocol, on: list[str]) -> _KeyIndex | None:
+    """The index `Table.index` built on exactly these key columns, if the
+    table still has the rows it was built over."""
+    if not isinstance(table, TableValueAccessorMixin) or table.is_parted:
+        return None
+    index = table._table_schema().indexes.get(tuple(on))
+    if index is None or index.length != table._row_count():
+        return None
+    return index
+
+
+def _sorted_lookup(sorted_values: t.Any, values: t.Any) -> t.Any:
+    if not len(sorted_values):
+        return np.full(len(values), -1, dtype=np.int64)
+    clipped = np.minimum(np.searchsorted(sorted_values, values), len(sorted_values) - 1)
+    return np.where(sorted_values[clipped] == values, clipped, -1)
+
+
+def _key_arrays(table: _TableProtocol, on: list[str]) -> list[t.Any]:
+    names = {_col_name(c) for c in table.columns()}
+    if missing := [k for k in on if k not in names]:
+        raise errors.RayforceValueError(f"Join columns not found: {', '.join(missing)}")
+    return [t.cast("Table", table).at_column(k).to_numpy() for k in on]
+
+
+def _null_row(table: _TableProtocol) -> Table:
+    """A one-row table of `table`'s columns, all null. Types without a null
+    hold the value the engine pads joins with instead: the empty symbol,
+    false or zero."""
+    row = _take_rows(table, [0])
+    columns: dict[str, t.Any] = {}
+    for name, vec in zip(row.columns(), row.values(), strict=True):
+        type_code = FFI.get_obj_type(vec.ptr)
+        if type_code in _JOIN_FILLS:
+            columns[_col_name(name)] = Vector(items=[_JOIN_FILLS[type_code]], ray_type=type_code)
+        else:
+            _apply_null_mask(vec, np.ones(1, dtype=bool))
+            columns[_col_name(name)] = vec
+    return Table(columns)
+
+
+def _has_list_column(table: _TableProtocol) -> bool:
+    values = t.cast("Table", table).values()
+    return any(FFI.get_obj_type(vec.ptr) == r.TYPE_LIST for vec in values)
+
+
+def _take_rows(table: _TableProtocol, rows: t.Any) -> Table:
+    """The given rows of every column, gathered natively by indexing the
+    table with one index vector."""
+    index = Vector.from_numpy(np.asarray(rows, dtype=np.int64))
+    return utils.eval_obj(List([Operation.AT, table.evaled_ptr, index]))
+
+
+def _take_count(n: int, offset: int = 0) -> int | Vector:
+    return Vector(items=[offset, n], ray_type=I64) if offset else n
+
+
+def _sort_rows(
+    table: Table,
+    cols: tuple[str, ...],
+    desc: tuple[bool, ...],
+    limit: tuple[int, int] | None = None,
+    *,
+    profile: QueryProfile | None = None,
+) -> Table:
+    """Stable multi-key sort with a direction per key. Each key is graded
+    once, natively and in its own direction, and turned into dense ranks
+    that follow the engine's ordering; one compound `lexsort` over the ranks
+    gives the row permutation, and the table is gathered once."""
+    source = table.evaled_ptr
+    ranks = []
+    for col, is_desc in zip(cols, desc, strict=True):
+        column = List([Operation.AT, source, QuotedSymbol(col)])
+        grade = List([Operation.IDESC if is_desc else Operation.IASC, column])
+        order = _eval_form(grade, profile).to_numpy()
+        ordered = table.at_column(col).to_numpy()[order]
+        starts = np.ones(len(order), dtype=bool)
+        starts[1:] = ordered[1:] != ordered[:-1]
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.cumsum(starts) - 1
+        ranks.append(rank)
+    # `lexsort` is stable and treats its last key as the most significant.
+    index = np.lexsort(ranks[::-1])
+
+    form = List([Operation.AT, source, Vector.from_numpy(index)])
+    if limit is not None:
+        form = List([Operation.TAKE, form, _take_count(*limit)])
+    return _eval_form(form, profile)
+
+
 class SelectQuery(IPCQueryMixin):
     def __init__(
         self,
@@ -1063,7 +2670,7 @@ class SelectQuery(IPCQueryMixin):
         select_cols: tuple[t.Any, t.Any] | None = None,
         where_conditions: list[Expression] | None = None,
         by_cols: tuple[tuple[t.Any, ...], dict[str, t.Any]] | None = None,
-        order_by_cols: tuple[tuple[str, ...], bool] | None = None,
+        order_by_cols: tuple[tuple[str, ...], bool | tuple[bool, ...]] | None = None,
     ) -> None:
         self.table = table
         self._select_cols = select_cols
@@ -1073,6 +2680,7 @@ class SelectQuery(IPCQueryMixin):
         )
         self._order_by_cols = order_by_cols
         self._ptr: r.RayObject | None = None
+        self._signature: tuple[t.Hashable, frozenset[str]] | None = None
 
     def select(self, *cols, **computed_cols) -> SelectQuery:
         return SelectQuery(
@@ -1103,13 +2711,13 @@ class SelectQuery(IPCQueryMixin):
             order_by_cols=self._order_by_cols,
         )
 
-    def order_by(self, *cols: Column | str, desc: bool = False) -> SelectQuery:
+    def order_by(self, *cols: OrderKey, desc: bool = False) -> SelectQuery:
         return SelectQuery(
             table=self.table,
             select_cols=self._select_cols,
             where_conditions=self._where_conditions,
             by_cols=self._by_cols,
-            order_by_cols=(tuple(c.name if isinstance(c, Column) else c for c in cols), desc),
+            order_by_cols=_order_spec(cols, desc),
         )
 
     @property
@@ -1167,6 +2775,10 @@ class SelectQuery(IPCQueryMixin):
                 query_items["from"] = name_sym
             else:
                 query_items["from"] = self.table.ptr
+        elif isinstance(self.table, PartedTable):
+            raise errors.RayforcePartedTableError(
+                "Queries on a lazy parted table run client-side; use .execute() or .collect()"
+            )
         else:
             query_items["from"] = utils.python_to_ray(self.table)
 
@@ -1210,43 +2822,720 @@ class SelectQuery(IPCQueryMixin):
             return None
         return (result_name, expr.operands[0].name)
 
-    def execute(self) -> Table:
+    def prepare(self) -> PreparedQuery:
+        """Compile this query once for repeated execution with different
+        `Param` values. Plans are cached by query structure, so preparing an
+        equivalent query again returns the already-compiled handle."""
+        key, params = self._plan_signature()
+        plans = _plans_for(self.table)
+        prepared = plans.get(key)
+        if prepared is not None:
+            plans.move_to_end(key)
+            return prepared
+        prepared = PreparedQuery(self, params)
+        plans[key] = prepared
+        if len(plans) > _PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+        return prepared
+
+    def _plan_signature(self) -> tuple[t.Hashable, frozenset[str]]:
+        """The plan cache key of this query and the parameters it takes,
+        worked out once per query object."""
+        if self._signature is None:
+            params: set[str] = set()
+            self._signature = (_query_key(self, params), frozenset(params))
+        return self._signature
+
+    def _check_params_bound(self) -> None:
+        # A Param compiles to a global that only `PreparedQuery.execute`
+        # binds, and only for the duration of its own evaluation.
+        _, params = self._plan_signature()
+        if params:
+            raise errors.RayforceValueError(
+                f"Unbound query parameters: {', '.join(sorted(params))}. "
+                "Use .prepare().execute(...) to bind them"
+            )
+
+    @t.overload
+    def execute(self, *, profile: t.Literal[False] = ...) -> Table: ...
+
+    @t.overload
+    def execute(self, *, profile: t.Literal[True]) -> QueryProfile: ...
+
+    def execute(self, *, profile: bool = False) -> Table | QueryProfile:
+        if profile:
+            return self.profile()
+        self._check_params_bound()
+        if isinstance(self.table, PartedTable):
+            return self.table._execute_select(self)
+        return self._run()
+
+    def profile(self) -> QueryProfile:
+        self._check_params_bound()
+        profile = QueryProfile()
+        if isinstance(self.table, PartedTable):
+            # Partition loading, pruning and merging all run client-side.
+            with profile.phase("eval"):
+                result = self.table._execute_select(self)
+            return profile.finish(result)
+        return profile.finish(self._run(profile=profile))
+
+    def _run(
+        self,
+        plan: r.RayObject | None = None,
+        limit: tuple[int, int] | None = None,
+        profile: QueryProfile | None = None,
+    ) -> Table:
+        if self._select_cols and any(map(_window_nodes, self._select_cols[1].values())):
+            return self._run_windowed(limit, profile)
+
         distinct_spec = self._distinct_only_projection()
         if distinct_spec is not None:
             result_name, col_name = distinct_spec
-            distinct_vec = utils.eval_obj(
-                List(
+            with _phase(profile, "compile"):
+                form = List(
                     [
                         Operation.DISTINCT,
                         List([Operation.AT, self.table.evaled_ptr, QuotedSymbol(col_name)]),
                     ]
                 )
+            distinct_vec = _eval_form(form, profile)
+            with _phase(profile, "recover"):
+                distinct = Table({result_name: distinct_vec})
+                return distinct.take(*limit) if limit is not None else distinct
+
+        with _phase(profile, "compile"):
+            if plan is None:
+                plan = self.compile()
+            form = List([Operation.SELECT, plan])
+            mixed_order = None
+            if self._order_by_cols:
+                cols, desc = self._order_by_cols
+                if isinstance(desc, tuple):
+                    mixed_order = (cols, desc)
+                else:
+                    form = List(
+                        [
+                            Operation.XDESC if desc else Operation.XASC,
+                            form,
+                            Vector(list(cols), ray_type=Symbol),
+                        ]
+                    )
+            aggregation_only = _is_aggregation_only_select(self)
+            fold_limit = limit is not None and not aggregation_only
+            if limit is not None and fold_limit and mixed_order is None:
+                # Fold the limit into the same eval, on top of the sort.
+                form = List([Operation.TAKE, form, _take_count(*limit)])
+        result = _eval_form(form, profile)
+        if mixed_order is not None and isinstance(result, Table):
+            result = _sort_rows(
+                result, *mixed_order, limit if fold_limit else None, profile=profile
             )
-            return Table({result_name: distinct_vec})
 
-        if self._order_by_cols:
-            cols, desc = self._order_by_cols
-            result = utils.eval_obj(
-                List(
-                    [
-                        Operation.XDESC if desc else Operation.XASC,
-                        List([Operation.SELECT, self.compile()]),
-                        Vector(list(cols), ray_type=Symbol),
-                    ]
+        with _phase(profile, "recover"):
+            if isinstance(result, Table) and self._select_cols:
+                _, computed = self._select_cols
+                shifts = {
+                    n: "TIMESTAMP" for n, e in computed.items() if isinstance(e, _ShiftTzExpression)
+                }
+                result = _recover_temporal_dtypes(result, shifts)
+            if isinstance(result, Table) and aggregation_only:
+                result = result.take(1)
+                if limit is not None:
+                    result = result.take(*limit)
+        return result
+
+    def _run_windowed(self, limit: tuple[int, int] | None, profile: QueryProfile | None) -> Table:
+        # Filter once, then add one column per window function (innermost
+        # first when they nest) and run the rest of the query against the
+        # widened table with every window replaced by its column.
+        cols, computed = self._select_cols  # type: ignore[misc]
+        by_cols, by_computed = self._by_cols
+        names = [_col_name(c) for c in self.table.columns()]
+        if "*" in cols:
+            cols = tuple(n for n in names if n not in computed)
+        keys = {
+            f"__window_key_{i}": Column(key) if isinstance(key, str) else key
+            for i, key in enumerate((*by_cols, *by_computed.values()))
+        }
+
+        # Columns the query reads besides its projections: group and sort keys.
+        fixed = [
+            *(k for k in by_cols if isinstance(k, str)),
+            *(n for e in by_computed.values() for n in _column_refs(e)),
+            *(self._order_by_cols[0] if self._order_by_cols else ()),
+        ]
+
+        current: _TableProtocol = self.table
+        available = set(names)
+        wheres = self._where_conditions
+        codes = None
+        # Keyed by id() with the node kept alongside: the nodes stay alive for
+        # the whole rewrite, so their ids cannot be reused by new expressions.
+        resolved: dict[int, tuple[_WindowExpression, t.Any]] = {}
+        aggregated: dict[t.Hashable, t.Any] = {}
+        group_lists: dict[str, list[Vector]] = {}
+        while nodes := [
+            node
+            for expr in computed.values()
+            for node in _window_nodes(expr)
+            if not _window_nodes(node.operands[0])
+        ]:
+            sources = {f"__window_src_{i}": n.operands[0] for i, n in enumerate(nodes)}
+            # Only the columns the rest of the query still reads once these
+            # windows are replaced come back alongside the window inputs.
+            pending = {
+                id(node): (node, Column(f"__window_{len(resolved) + i}"))
+                for i, node in enumerate(nodes)
+            }
+            ahead = [
+                n for e in computed.values() for n in _column_refs(_replace_windows(e, pending))
+            ]
+            carried = tuple(n for n in dict.fromkeys([*cols, *fixed, *ahead]) if n in available)
+            base = SelectQuery(
+                table=current,
+                select_cols=(carried, {**sources, **keys}),
+                where_conditions=wheres,
+            )._run(profile=profile)
+            if keys and codes is None:
+                # A `where` that matches nothing leaves no groups to number;
+                # the windows still run, over empty columns of the right type.
+                codes = (
+                    _first_seen_codes([base[k].to_numpy() for k in keys])[0]
+                    if len(base)
+                    else np.zeros(0, dtype=np.int64)
                 )
-            )
+            with _phase(profile, "recover"):
+                widened = {
+                    n: base[n]
+                    for n in (_col_name(c) for c in base.columns())
+                    if not n.startswith("__window_src_")
+                }
+                for i, node in enumerate(nodes):
+                    name = f"__window_{len(resolved)}"
+                    source = base[f"__window_src_{i}"]
+                    if isinstance(node, _GroupedAggregation):
+                        column = _aggregate_column(source, node, codes, aggregated)
+                        if isinstance(column, list):
+                            # Grouped selects drop list columns: the rows carry
+                            # their group code until the select has run.
+                            group_lists[name] = column
+                            rows = codes if codes is not None else np.zeros(len(source))
+                            column = Vector.from_numpy(rows.astype(np.int64))
+                        widened[name] = column
+                        resolved[id(node)] = (node, Expression(Operation.FIRST, Column(name)))
+                    else:
+                        widened[name] = _window_column(source, node.kind, node.operands[1:], codes)
+                        resolved[id(node)] = (node, Column(name))
+                current = Table(widened)
+                available = set(widened)
+                computed = {n: _replace_windows(e, resolved) for n, e in computed.items()}
+            wheres = []
+            keys = {}
+
+        if by_cols or by_computed:
+            if any(map(_has_aggregation, computed.values())):
+                select_cols, grouping = (cols, computed), self._by_cols
+            else:
+                # Only row-wise projections: one output row per input row,
+                # with the group keys in front.
+                select_cols, grouping = ((*by_cols, *cols), {**by_computed, **computed}), None
         else:
-            result = utils.eval_obj(List([Operation.SELECT, self.compile()]))
+            select_cols, grouping = (cols, computed), None
+        result = SelectQuery(
+            table=current,
+            select_cols=select_cols,
+            by_cols=grouping,
+            order_by_cols=self._order_by_cols,
+        )._run(limit=limit, profile=profile)
+        return _restore_group_lists(result, computed, group_lists)
 
-        if isinstance(result, Table) and self._select_cols:
-            _, computed = self._select_cols
-            shifts = {
-                n: "TIMESTAMP" for n, e in computed.items() if isinstance(e, _ShiftTzExpression)
-            }
-            result = _recover_temporal_dtypes(result, shifts)
-        if isinstance(result, Table) and _is_aggregation_only_select(self):
-            result = result.take(1)
+
+def _window_nodes(value: t.Any) -> list[_WindowExpression]:
+    """Every window function inside `value`, outermost first."""
+    if not isinstance(value, Expression):
+        return []
+    nodes = [value] if isinstance(value, _WindowExpression) else []
+    for operand in value.operands:
+        nodes.extend(_window_nodes(operand))
+    return nodes
+
+
+def _replace_windows(value: t.Any, resolved: dict[int, tuple[_WindowExpression, t.Any]]) -> t.Any:
+    if not isinstance(value, Expression):
+        return value
+    node, replacement = resolved.get(id(value), (None, None))
+    if node is value:
+        return replacement
+    return type(value)(value.operation, *(_replace_windows(o, resolved) for o in value.operands))
+
+
+# Window kinds that work on numbers; `shift` moves values of any type.
+_NUMERIC_WINDOWS = frozenset(
+    {"cumsum", "cummax", "cummin", "diff", "ema"}
+    | {f"rolling_{agg}" for agg in ("sum", "mean", "max", "min")}
+)
+
+
+def _window_column(vec: Vector, kind: str, params: tuple[t.Any, ...], codes: t.Any) -> Vector:
+    """Compute one window function over `vec`, per group when `codes`
+    (each row's group number) is given. Groups are made contiguous with one
+    stable sort, so every kind is a vectorised pass over the sorted buffer
+    followed by a scatter back into row order."""
+    n = len(vec)
+    if codes is None:
+        order = np.arange(n)
+        starts = np.zeros(min(n, 1), dtype=np.int64)
+    else:
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    lengths = np.diff(np.r_[starts, n])
+    seg = np.repeat(np.arange(len(starts)), lengths)
+    pos = np.arange(n) - starts[seg]
+
+    if kind == "shift":
+        (k,) = params
+        valid = (pos >= k) & (pos - k < lengths[seg])
+        src = order[np.where(valid, np.arange(n) - k, 0)]
+        indices = np.empty(n, dtype=np.int64)
+        indices[order] = np.where(valid, src, 0)
+        missing = np.empty(n, dtype=bool)
+        missing[order] = ~valid
+        shifted = _gather(vec, indices)
+        _apply_null_mask(shifted, missing)
+        return shifted
+
+    type_code = FFI.get_obj_type(vec.ptr)
+    dtype = _STATS_DTYPES.get(type_code)
+    if dtype is None or type_code in (r.TYPE_DATE, r.TYPE_TIME, r.TYPE_TIMESTAMP):
+        raise errors.RayforceTypeError(
+            f"Window function {kind}() needs a numeric column, got {TypeRegistry.get(type_code)}"
+        )
+    raw = np.frombuffer(FFI.read_vector_raw(vec.ptr), dtype=dtype)
+    x: np.ndarray
+    if raw.dtype.kind == "f":
+        x, nulls = raw.astype(np.float64)[order], np.isnan(raw)[order]
+    else:
+        x, nulls = raw.astype(np.int64)[order], (raw == np.iinfo(dtype).min)[order]
+
+    values, missing = _window_kernel(
+        kind, params, x, nulls, starts=starts, lengths=lengths, seg=seg, pos=pos
+    )
+    out = np.empty_like(values)
+    out[order] = values
+    out_missing = np.empty(n, dtype=bool)
+    out_missing[order] = missing
+    if out.dtype.kind == "f":
+        out[out_missing] = np.nan
+    result = Vector.from_numpy(out)
+    _apply_null_mask(result, out_missing)
+    return result
+
+
+# Grouped aggregations that only make sense over numbers.
+_NUMERIC_AGGREGATIONS = frozenset({"approx_quantile", "quantile", "histogram"})
+
+
+def _aggregation_input(vec: Vector, kind: str) -> tuple[t.Any, t.Any]:
+    """The non-null values of `vec` a grouped aggregation is computed from,
+    and the mask of rows they come from."""
+    type_code = FFI.get_obj_type(vec.ptr)
+    dtype = _STATS_DTYPES.get(type_code)
+    if kind in _NUMERIC_AGGREGATIONS and (
+        dtype is None or type_code in (r.TYPE_DATE, r.TYPE_TIME, r.TYPE_TIMESTAMP)
+    ):
+        raise errors.RayforceTypeError(
+            f"{kind}() needs a numeric column, got {TypeRegistry.get(type_code)}"
+        )
+    if dtype is not None:
+        raw = np.frombuffer(FFI.read_vector_raw(vec.ptr), dtype=dtype)
+        present = ~np.isnan(raw) if raw.dtype.kind == "f" else raw != np.iinfo(dtype).min
+        return raw[present], present
+    present = ~vec._null_mask()
+    return vec.to_numpy()[present], present
+
+
+def _group_sketches(
+    vec: Vector, node: _SketchExpression, codes: t.Any, cache: dict[t.Hashable, list[t.Any]]
+) -> list[t.Any]:
+    """One sketch per group (a single one without `codes`). Sketches of the
+    same input and settings are built once per query and shared, e.g. by
+    several `approx_quantile`s of one column."""
+    kind, source, *params = node.kind, *node.operands
+    setting = params[0] if kind == _WindowKind.APPROX_DISTINCT else params[1]
+    key = (kind, setting, _plan_key(source, set()))
+    if key not in cache:
+        values, present = _aggregation_input(vec, kind)
+        if codes is None:
+            groups, n_groups = np.zeros(len(values), dtype=np.int64), 1
+        else:
+            groups, n_groups = codes[present], int(codes.max()) + 1 if len(codes) else 0
+        sketch_cls: type[HyperLogLog | QuantileSketch] = (
+            HyperLogLog if kind == _WindowKind.APPROX_DISTINCT else QuantileSketch
+        )
+        cache[key] = sketch_cls.grouped(values, groups, n_groups, setting)
+    return cache[key]
+
+
+def _sketch_result(sketch: t.Any, node: _SketchExpression) -> t.Any:
+    if node.kind == _WindowKind.APPROX_DISTINCT:
+        return sketch.estimate()
+    return sketch.quantile(node.operands[1])
+
+
+def _sketch_column(
+    vec: Vector, node: _SketchExpression, codes: t.Any, cache: dict[t.Hashable, list[t.Any]]
+) -> Vector:
+    results = [_sketch_result(s, node) for s in _group_sketches(vec, node, codes, cache)]
+    missing = np.array([value is None for value in results], dtype=bool)
+    dtype = np.int64 if node.kind == _WindowKind.APPROX_DISTINCT else np.float64
+    per_group = np.array([np.nan if value is None else value for value in results], dtype=dtype)
+    rows = codes if codes is not None else np.zeros(len(vec), dtype=np.int64)
+    column = Vector.from_numpy(per_group[rows])
+    _apply_null_mask(column, missing[rows])
+    return column
+
+
+def _aggregate_column(
+    vec: Vector, node: _GroupedAggregation, codes: t.Any, cache: dict[t.Hashable, t.Any]
+) -> Vector | list[Vector]:
+    """The aggregation as a column aligned with `vec`'s rows, or one vector
+    per group for list-valued ones (histograms, several quantiles)."""
+    if isinstance(node, _SketchExpression):
+        return _sketch_column(vec, node, codes, cache)
+    kind, source, param = node.kind, *node.operands
+    key = ("values", _plan_key(source, set()))
+    if key not in cache:
+        # Values ordered by group, shared by every exact aggregation of the
+        # same input in this query.
+        values, present = _aggregation_input(vec, kind)
+        if codes is None:
+            groups, n_groups = np.zeros(len(values), dtype=np.int64), 1
+        else:
+            groups, n_groups = codes[present], int(codes.max()) + 1 if len(codes) else 0
+        order = np.argsort(groups, kind="stable")
+        bounds = np.searchsorted(groups[order], np.arange(n_groups + 1))
+        cache[key] = values[order].astype(np.float64), groups[order], bounds
+    values, groups, bounds = cache[key]
+    rows = codes if codes is not None else np.zeros(len(vec), dtype=np.int64)
+    if kind == _WindowKind.HISTOGRAM:
+        per_group = _histogram_counts(values, groups, len(bounds) - 1, param)
+        return [Vector.from_numpy(counts) for counts in per_group]
+    per_group = _exact_quantiles(values, bounds, param if isinstance(param, tuple) else (param,))
+    if isinstance(param, tuple):
+        return [Vector.from_numpy(qs) for qs in per_group]
+    column = Vector.from_numpy(per_group[rows, 0])
+    _apply_null_mask(column, np.isnan(per_group[rows, 0]))
+    return column
+
+
+def _exact_quantiles(values: t.Any, bounds: t.Any, qs: tuple[float, ...]) -> t.Any:
+    """Quantiles of each group's slice of `values`, one row per group (NaN
+    for an empty group). Only the values either side of each quantile are
+    put in place, by selection rather than a sort."""
+    qs_arr = np.asarray(qs)
+    out = np.full((len(bounds) - 1, len(qs)), np.nan)
+    for g in range(len(bounds) - 1):
+        lo, hi = bounds[g], bounds[g + 1]
+        if lo == hi:
+            continue
+        pos = qs_arr * (hi - lo - 1)
+        below = np.floor(pos).astype(np.int64)
+        above = np.minimum(below + 1, hi - lo - 1)
+        part = np.partition(values[lo:hi], np.unique(np.concatenate([below, above])))
+        out[g] = part[below] + (part[above] - part[below]) * (pos - below)
+    return out
+
+
+def _histogram_counts(
+    values: t.Any, groups: t.Any, n_groups: int, bins: int | tuple[float, ...]
+) -> t.Any:
+    if isinstance(bins, int):
+        lo, hi = (float(values.min()), float(values.max())) if len(values) else (0.0, 1.0)
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges = np.linspace(lo, hi, bins + 1)
+    else:
+        edges = np.asarray(bins)
+    n_bins = len(edges) - 1
+    index = np.searchsorted(edges, values, side="right") - 1
+    index[values == edges[-1]] = n_bins - 1
+    inside = (index >= 0) & (index < n_bins)
+    return np.bincount(
+        groups[inside] * n_bins + index[inside], minlength=n_groups * n_bins
+    ).reshape(n_groups, n_bins)
+
+
+def _restore_group_lists(
+    result: t.Any, computed: dict[str, t.Any], group_lists: dict[str, list[Vector]]
+) -> t.Any:
+    """Swap the group codes standing in for list-valued aggregations in
+    `result` for each group's vector."""
+    targets = {}
+    for out, expr in computed.items():
+        if (
+            isinstance(expr, Expression)
+            and expr.operation == Operation.FIRST
+            and isinstance(expr.operands[0], Column)
+            and expr.operands[0].name in group_lists
+        ):
+            targets[out] = group_lists[expr.operands[0].name]
+        elif _references(expr, group_lists):
+            raise errors.RayforceTypeError(
+                "List-valued aggregations cannot be used inside other expressions"
+            )
+    if not targets or not isinstance(result, Table):
         return result
+    columns: dict[str, Vector | List] = {}
+    for key, vec in zip(result.columns(), result.values(), strict=True):
+        name = _col_name(key)
+        if name in targets:
+            # Rows of a group share its vector rather than holding copies.
+            codes = vec.to_numpy().tolist()
+            columns[name] = List([targets[name][code].ptr for code in codes])
+        else:
+            columns[name] = vec
+    return Table(columns)
+
+
+def _references(value: t.Any, names: t.Container[str]) -> bool:
+    return any(name in names for name in _column_refs(value))
+
+
+def _column_refs(value: t.Any) -> list[str]:
+    """Names of the columns `value` reads, window inputs included."""
+    if isinstance(value, Column):
+        return [value.name]
+    if isinstance(value, Expression):
+        return [name for operand in value.operands for name in _column_refs(operand)]
+    return []
+
+
+def _segment_cumsum(x: t.Any, starts: t.Any, seg: t.Any) -> t.Any:
+    total = np.cumsum(x)
+    return total - (total[starts] - x[starts])[seg] if len(x) else total
+
+
+def _window_kernel(
+    kind: str,
+    params: tuple[t.Any, ...],
+    x: t.Any,
+    nulls: t.Any,
+    *,
+    starts: t.Any,
+    lengths: t.Any,
+    seg: t.Any,
+    pos: t.Any,
+) -> tuple[t.Any, t.Any]:
+    """Window `kind` over `x`, whose groups are the contiguous runs starting
+    at `starts`. Returns the values and their null mask."""
+    n = len(x)
+    zero = np.zeros((), dtype=x.dtype)
+
+    if kind == "diff":
+        (k,) = params
+        valid = (pos >= k) & (pos - k < lengths[seg])
+        src = np.where(valid, np.arange(n) - k, 0)
+        return x - x[src], ~valid | nulls | nulls[src]
+
+    if kind == "cumsum":
+        return _segment_cumsum(np.where(nulls, zero, x), starts, seg), nulls
+
+    if kind in ("cummax", "cummin"):
+        ufunc = np.maximum if kind == "cummax" else np.minimum
+        fill = _window_identity(x.dtype, ufunc)
+        filled = np.where(nulls, fill, x)
+        out = np.empty_like(filled)
+        for start, length in zip(starts.tolist(), lengths.tolist(), strict=True):
+            out[start : start + length] = ufunc.accumulate(filled[start : start + length])
+        return out, nulls
+
+    if kind == "ema":
+        (alpha,) = params
+        return _ema(x.astype(np.float64), nulls, alpha, starts, lengths)
+
+    (size,) = params
+    full = pos >= size - 1
+    present = (~nulls).astype(np.int64)
+    count = _segment_cumsum(present, starts, seg)
+    if size <= n:
+        count[size:] -= np.where(pos[size:] >= size, count[:-size], 0)
+    missing = ~full | (count == 0)
+
+    if kind in ("rolling_sum", "rolling_mean"):
+        total = _segment_cumsum(np.where(nulls, zero, x), starts, seg)
+        if size <= n:
+            total[size:] -= np.where(pos[size:] >= size, total[:-size], zero)
+        if kind == "rolling_sum":
+            return total, missing
+        return total / np.maximum(count, 1), missing
+
+    ufunc = np.maximum if kind == "rolling_max" else np.minimum
+    filled = np.where(nulls, _window_identity(x.dtype, ufunc), x)
+    out = np.zeros_like(filled)
+    if size <= n:
+        windows = np.lib.stride_tricks.sliding_window_view(filled, size)
+        out[size - 1 :] = ufunc.reduce(windows, axis=1)
+    return out, missing
+
+
+def _window_identity(dtype: t.Any, ufunc: t.Any) -> t.Any:
+    if dtype.kind == "f":
+        return -np.inf if ufunc is np.maximum else np.inf
+    info = np.iinfo(dtype)
+    return info.min if ufunc is np.maximum else info.max
+
+
+def _ema(
+    x: t.Any, nulls: t.Any, alpha: float, starts: t.Any, lengths: t.Any
+) -> tuple[t.Any, t.Any]:
+    # Within a block, y[i] = decay**(i+1) * y0 + alpha * sum_j decay**(i-j) * x[j]
+    # with y0 the average before the block; blocks are short enough that
+    # decay**-j stays finite. Seeding with y0 = x[first] makes y[first] = x[first].
+    decay = 1.0 - alpha
+    block = max(1, int(300 / -np.log(decay))) if decay > 0 else max(len(x), 1)
+    out = np.empty_like(x)
+    missing = np.zeros(len(x), dtype=bool)
+    for start, length in zip(starts.tolist(), lengths.tolist(), strict=True):
+        present = ~nulls[start : start + length]
+        if not present.any():
+            missing[start : start + length] = True
+            continue
+        first = int(np.argmax(present))
+        missing[start : start + first] = True
+        # Forward-fill nulls so each one carries the previous average.
+        filled = x[start : start + length][
+            np.maximum.accumulate(np.where(present, np.arange(length), first))
+        ]
+        prev = filled[first]
+        for lo in range(first, length, block):
+            chunk = filled[lo : lo + block]
+            if decay == 0:
+                y = chunk
+            else:
+                steps = np.arange(len(chunk))
+                y = decay**steps * (decay * prev + alpha * np.cumsum(chunk * decay**-steps))
+            out[start + lo : start + lo + len(chunk)] = y
+            prev = y[-1]
+    return out, missing
+
+
+# Compiled plans kept by `SelectQuery.prepare` for queries on reference
+# tables, least recently used first. Queries on any other table cache their
+# plans on the table object itself (see `_plans_for`).
+_PLAN_CACHE_SIZE = 256
+_plan_cache: OrderedDict[t.Hashable, PreparedQuery] = OrderedDict()
+
+
+def clear_plan_cache() -> None:
+    """Drop every cached plan of reference tables, e.g. after redefining a
+    referenced table's schema."""
+    _plan_cache.clear()
+
+
+def _plans_for(table: t.Any) -> OrderedDict[t.Hashable, PreparedQuery]:
+    """Plan cache for queries on `table`. Reference tables share the global
+    cache by name. Any other table keeps its own plans, which live exactly
+    as long as the table: a cached plan neither pins a table nor matches a
+    different one that happens to reuse its id."""
+    if isinstance(table, Table) and table.is_reference:
+        return _plan_cache
+    plans = getattr(table, "_plans", None)
+    if plans is None:
+        plans = OrderedDict()
+        with contextlib.suppress(AttributeError):
+            table._plans = plans
+    return plans
+
+
+def _plan_key(value: t.Any, params: set[str]) -> t.Hashable:
+    """Structural cache key for one query component, recording the names of
+    any `Param`s found along the way."""
+    if isinstance(value, Expression):
+        operands = tuple(_plan_key(o, params) for o in value.operands)
+        return ("expr", _plan_key(value.operation, params), operands)
+    if isinstance(value, Operation):
+        return ("op", value.value)
+    if isinstance(value, Column):
+        return ("col", value.name)
+    if isinstance(value, Param):
+        params.add(value.name)
+        return ("param", value.name)
+    if value is None or isinstance(value, (bool, int, float, str, dt.date, dt.time)):
+        return (type(value).__name__, value)
+    if isinstance(value, r.RayObject) and FFI.get_obj_type(value) == -r.TYPE_SYMBOL:
+        return ("sym", FFI.read_symbol(value))
+    # Anything else (literal vectors, tables, lambdas) is keyed by identity.
+    # The cache entry holds the query and so keeps the object alive, which
+    # stops its id from being reused while the entry exists.
+    return ("id", id(value))
+
+
+def _query_key(query: SelectQuery, params: set[str]) -> t.Hashable:
+    table = query.table
+    # Plans of other tables are cached per table object, see `_plans_for`.
+    table_key = table._ptr if isinstance(table, Table) and table.is_reference else None
+
+    def columns_key(spec: tuple[t.Any, t.Any] | None) -> t.Hashable:
+        if not spec:
+            return None
+        cols, computed = spec
+        return (
+            tuple(_plan_key(c, params) for c in cols),
+            tuple((name, _plan_key(e, params)) for name, e in computed.items()),
+        )
+
+    return (
+        table_key,
+        columns_key(query._select_cols),
+        tuple(_plan_key(c, params) for c in query._where_conditions),
+        columns_key(query._by_cols),
+        query._order_by_cols,
+    )
+
+
+def _param_value(value: t.Any) -> r.RayObject:
+    # Strings bind as RAY_STR atoms, the same shape `Expression.compile`
+    # emits for a literal, so a parameter behaves exactly like the literal.
+    if isinstance(value, str):
+        return String(value).ptr
+    if isinstance(value, r.RayObject):
+        return value
+    if hasattr(value, "ptr"):
+        return value.ptr
+    return utils.python_to_ray(value)
+
+
+class PreparedQuery:
+    """A SelectQuery compiled once. `execute` binds the parameter values and
+    evaluates the cached plan; nothing about the query is rebuilt."""
+
+    def __init__(self, query: SelectQuery, params: frozenset[str]) -> None:
+        self.query = query
+        self.params = params
+        self._plan = query.compile()
+        self._slots = {name: FFI.init_symbol(Param(name).bound_name) for name in params}
+        self._unbind = [
+            List([Operation.DEL, QuotedSymbol(Param(name).bound_name)]) for name in params
+        ]
+
+    def execute(self, **params: t.Any) -> Table:
+        if params.keys() != self.params:
+            missing = sorted(self.params - params.keys())
+            unknown = sorted(params.keys() - self.params)
+            raise errors.RayforceQueryCompilationError(
+                f"Prepared query parameters mismatch (missing: {missing}, unknown: {unknown})"
+            )
+        try:
+            for name, value in params.items():
+                FFI.binary_set(self._slots[name], _param_value(value))
+            return self.query._run(self._plan)
+        finally:
+            # The bindings are only meaningful to this evaluation; left in
+            # place they would show up as user globals (and in snapshots).
+            for form in self._unbind:
+                FFI.eval_obj(form.ptr)
 
 
 class _UngroupQuery(IPCQueryMixin):
@@ -1316,11 +3605,23 @@ class UpdateQuery(IPCQueryMixin):
         return Expression(Operation.UPDATE, self.compile(ipc=True)).compile()
 
     def execute(self) -> Table:
-        new_table = FFI.update(query=self.compile())
-        result_type = FFI.get_obj_type(new_table)
-        if self.table.is_reference and result_type == -r.TYPE_SYMBOL:
-            return Table(Symbol(ptr=new_table).value)
-        return Table(new_table)
+        return self._run()
+
+    def profile(self) -> QueryProfile:
+        profile = QueryProfile()
+        return profile.finish(self._run(profile))
+
+    def _run(self, profile: QueryProfile | None = None) -> Table:
+        with _phase(profile, "compile"):
+            query = self.compile()
+        with _phase(profile, "eval"):
+            new_table = FFI.update(query=query)
+        _invalidate_table_meta(self.table)
+        with _phase(profile, "wrap"):
+            result_type = FFI.get_obj_type(new_table)
+            if self.table.is_reference and result_type == -r.TYPE_SYMBOL:
+                return Table(Symbol(ptr=new_table).value)
+            return Table(new_table)
 
 
 def _build_list_of_vectors(args: tuple, *, ipc: bool) -> r.RayObject:
@@ -1378,6 +3679,7 @@ class InsertQuery(IPCQueryMixin):
         else:
             tbl_arg = self.table.ptr
         new_table = FFI.insert(table=tbl_arg, data=data)
+        _invalidate_table_meta(self.table)
         result_type = FFI.get_obj_type(new_table)
         if self.table.is_reference and result_type == -r.TYPE_SYMBOL:
             return Table(Symbol(ptr=new_table).value)
@@ -1432,12 +3734,756 @@ class UpsertQuery(IPCQueryMixin):
         else:
             tbl_arg = self.table.ptr
         new_table = FFI.upsert(table=tbl_arg, keys=keys, data=data)
+        _invalidate_table_meta(self.table)
         result_type = FFI.get_obj_type(new_table)
         if self.table.is_reference and result_type == -r.TYPE_SYMBOL:
             return Table(Symbol(ptr=new_table).value)
         return Table(new_table)
 
 
+# Comparisons the partition pruner understands, keyed by operator, plus the
+# operator to use when the literal is on the left (`5 < col` == `col > 5`).
+_PRUNE_COMPARATORS: dict[Operation, t.Callable[[t.Any, t.Any], bool]] = {
+    Operation.EQUALS: operator.eq,
+    Operation.NOT_EQUALS: operator.ne,
+    Operation.LESS_THAN: operator.lt,
+    Operation.LESS_EQUAL: operator.le,
+    Operation.GREATER_THAN: operator.gt,
+    Operation.GREATER_EQUAL: operator.ge,
+}
+_PRUNE_FLIPPED = {
+    Operation.EQUALS: Operation.EQUALS,
+    Operation.NOT_EQUALS: Operation.NOT_EQUALS,
+    Operation.LESS_THAN: Operation.GREATER_THAN,
+    Operation.LESS_EQUAL: Operation.GREATER_EQUAL,
+    Operation.GREATER_THAN: Operation.LESS_THAN,
+    Operation.GREATER_EQUAL: Operation.LESS_EQUAL,
+}
+
+# Aggregations whose per-partition results can be combined into the global
+# result, and the aggregation that combines them.
+_PARTITION_MERGE_AGGS = {
+    Operation.COUNT: Operation.SUM,
+    Operation.SUM: Operation.SUM,
+    Operation.MIN: Operation.MIN,
+    Operation.MAX: Operation.MAX,
+    Operation.FIRST: Operation.FIRST,
+    Operation.LAST: Operation.LAST,
+}
+
+
+def _prune_literal(value: t.Any, sample: t.Any) -> tuple[bool, t.Any]:
+    """Resolve a where-clause operand to a Python literal comparable with the
+    partition values. Returns (False, None) for anything else (columns,
+    expressions, values of a different kind), which disables pruning."""
+    if isinstance(value, Expression):
+        if value.operation != Operation.LIST:
+            return False, None
+        items = [_prune_literal(v, sample) for v in value.operands]
+        if not all(ok for ok, _ in items):
+            return False, None
+        return True, [v for _, v in items]
+    if isinstance(value, Column):
+        return False, None
+    if isinstance(value, Vector | List):
+        return _prune_literal(Expression(Operation.LIST, *value), sample)
+    value = _unwrap_value(value)
+    # Date partitions only compare against plain dates: `date == datetime` is
+    # simply False in Python and would wrongly prune every partition.
+    if isinstance(sample, dt.date) and type(value) is not dt.date:
+        return False, None
+    if isinstance(sample, int) and (not isinstance(value, int) or isinstance(value, bool)):
+        return False, None
+    return True, value
+
+
+def _partition_mask(cond: t.Any, part_col: str, values: list[t.Any]) -> list[bool] | None:
+    """Evaluate a where-condition against the partition values alone.
+
+    Returns one keep-flag per partition, or None when the condition does not
+    constrain the partition column (so every partition has to be scanned).
+    """
+    if not isinstance(cond, Expression) or len(cond.operands) != 2:
+        return None
+    op = cond.operation
+    if not isinstance(op, Operation):
+        return None
+    lhs, rhs = cond.operands
+
+    if op in (Operation.AND, Operation.OR):
+        left = _partition_mask(lhs, part_col, values)
+        right = _partition_mask(rhs, part_col, values)
+        if op == Operation.AND:
+            if left is None or right is None:
+                return left if right is None else right
+            return [a and b for a, b in zip(left, right, strict=True)]
+        if left is None or right is None:
+            return None
+        return [a or b for a, b in zip(left, right, strict=True)]
+
+    def is_part_col(x: t.Any) -> bool:
+        return isinstance(x, Column) and x.name == part_col
+
+    if op in _PRUNE_COMPARATORS:
+        if is_part_col(rhs) and not is_part_col(lhs):
+            lhs, rhs, op = rhs, lhs, _PRUNE_FLIPPED[op]
+        if not is_part_col(lhs):
+            return None
+        ok, lit = _prune_literal(rhs, values[0])
+        if not ok or isinstance(lit, list):
+            return None
+        compare = _PRUNE_COMPARATORS[op]
+        try:
+            return [bool(compare(v, lit)) for v in values]
+        except TypeError:
+            return None
+
+    if op in (Operation.IN, Operation.WITHIN) and is_part_col(lhs):
+        ok, lit = _prune_literal(rhs, values[0])
+        if not ok or not isinstance(lit, list):
+            return None
+        if op == Operation.IN:
+            return [v in lit for v in values]
+        if len(lit) != 2:
+            return None
+        try:
+            return [lit[0] <= v <= lit[1] for v in values]
+        except TypeError:
+            return None
+
+    return None
+
+
+def _referenced_columns(query: SelectQuery) -> list[str] | None:
+    """Column names a select reads, in first-use order, or None when it
+    needs every column (`*` or no projection at all)."""
+    if not query._select_cols:
+        return None
+    cols, computed = query._select_cols
+    if "*" in cols:
+        return None
+
+    found: dict[str, None] = {}
+
+    def walk(node: t.Any) -> None:
+        if isinstance(node, Column):
+            found[node.name] = None
+        elif isinstance(node, Expression):
+            for operand in node.operands:
+                walk(operand)
+
+    by_cols, by_computed = query._by_cols
+    for name in (*cols, *by_cols):
+        if isinstance(name, str):
+            found[name] = None
+        else:
+            walk(name)
+    for node in (*computed.values(), *by_computed.values(), *query._where_conditions):
+        walk(node)
+    if query._order_by_cols:
+        for name in query._order_by_cols[0]:
+            found[name] = None
+    return list(found)
+
+
+def _storage_value(value: t.Any, type_code: int) -> t.Any:
+    """Convert a where-clause literal to the raw storage units zone maps are
+    kept in, or None when it cannot be mapped exactly (pruning is skipped)."""
+    if isinstance(value, Date):
+        return value.to_days() if type_code == r.TYPE_DATE else None
+    if isinstance(value, Time):
+        return value.to_millis() if type_code == r.TYPE_TIME else None
+    if isinstance(value, Timestamp):
+        return value.to_millis() if type_code == r.TYPE_TIMESTAMP else None
+    value = _unwrap_value(value)
+    if type_code == r.TYPE_DATE:
+        return (value - _PART_DATE_EPOCH).days if type(value) is dt.date else None
+    if type_code == r.TYPE_TIME:
+        if not isinstance(value, dt.time) or value.microsecond % 1000:
+            return None
+        seconds = (value.hour * 60 + value.minute) * 60 + value.second
+        return seconds * 1000 + value.microsecond // 1000
+    if type_code == r.TYPE_TIMESTAMP:
+        if not isinstance(value, dt.datetime):
+            return None
+        # The engine reads naive datetimes as UTC; other offsets are not
+        # guaranteed to be honoured, so they disable pruning.
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt.UTC)
+        elif value.utcoffset() != dt.timedelta(0):
+            return None
+        delta = value - DATETIME_EPOCH
+        return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _zone_bounds(col: t.Any, zone: dict[str, t.Any]) -> tuple[t.Any, t.Any, int] | None:
+    if not isinstance(col, Column):
+        return None
+    entry = zone["columns"].get(col.name)
+    # Null rows compare in engine-specific ways; only null-free zones prune.
+    if entry is None or entry.get("nulls") != 0 or entry.get("min") is None:
+        return None
+    return entry["min"], entry["max"], entry["type"]
+
+
+def _zone_items(value: t.Any, type_code: int) -> list[t.Any] | None:
+    if isinstance(value, Expression) and value.operation == Operation.LIST:
+        items = list(value.operands)
+    elif isinstance(value, Vector | List | list | tuple):
+        items = list(value)
+    else:
+        return None
+    converted = [_storage_value(v, type_code) for v in items]
+    return None if any(v is None for v in converted) else converted
+
+
+def _zone_may_match(cond: t.Any, zone: dict[str, t.Any]) -> bool:
+    """False only when the zone map proves no row can satisfy `cond`."""
+    if not isinstance(cond, Expression) or len(cond.operands) != 2:
+        return True
+    op = cond.operation
+    if not isinstance(op, Operation):
+        return True
+    lhs, rhs = cond.operands
+    if op == Operation.AND:
+        return _zone_may_match(lhs, zone) and _zone_may_match(rhs, zone)
+    if op == Operation.OR:
+        return _zone_may_match(lhs, zone) or _zone_may_match(rhs, zone)
+
+    if op in _PRUNE_COMPARATORS:
+        if isinstance(rhs, Column) and not isinstance(lhs, Column):
+            lhs, rhs, op = rhs, lhs, _PRUNE_FLIPPED[op]
+        if (bounds := _zone_bounds(lhs, zone)) is None:
+            return True
+        lo, hi, type_code = bounds
+        if (lit := _storage_value(rhs, type_code)) is None:
+            return True
+        if op == Operation.EQUALS:
+            return lo <= lit <= hi
+        if op == Operation.NOT_EQUALS:
+            return not lo == hi == lit
+        if op in (Operation.LESS_THAN, Operation.LESS_EQUAL):
+            return _PRUNE_COMPARATORS[op](lo, lit)
+        return _PRUNE_COMPARATORS[op](hi, lit)
+
+    if op in (Operation.IN, Operation.WITHIN):
+        if (bounds := _zone_bounds(lhs, zone)) is None:
+            return True
+        lo, hi, type_code = bounds
+        if (items := _zone_items(rhs, type_code)) is None:
+            return True
+        if op == Operation.IN:
+            return any(lo <= v <= hi for v in items)
+        return len(items) != 2 or (items[0] <= hi and items[1] >= lo)
+
+    return True
+
+
+class PartedTable:
+    """Lazy handle over a date- or int-partitioned layout.
+
+    Returned by `Table.from_parted(..., lazy=True)`. Nothing is loaded up
+    front: a `SelectQuery` against the handle first prunes partitions using
+    its where-conditions on the partition column, then either runs the
+    query per partition and merges the partial aggregates (count, sum, min,
+    max, first, last), or concatenates the surviving partitions and runs it
+    once.
+    """
+
+    is_reference = False
+    is_parted = True
+
+    def __init__(self, path: str, name: str, *, columns: list[str] | None = None) -> None:
+        part_dirs = _collect_part_dirs(path)
+        if not part_dirs:
+            raise errors.RayforceValueError(f"No partitions found under {path}")
+        self.root = path.rstrip("/")
+        self.name = name
+        self.part_dirs = part_dirs
+        self.part_column, self.part_values, self._part_ray_type = _infer_part_column(
+            path, part_dirs
+        )
+        sym_path = os.path.join(path, "sym")
+        self._sym_path = sym_path if os.path.exists(sym_path) else None
+        self._columns = columns
+        self._stats: dict[int, dict[str, t.Any] | None] = {}
+
+    def __repr__(self) -> str:
+        return f"PartedTable['{self.root}', '{self.name}', partitions={len(self.part_dirs)}]"
+
+    def __len__(self) -> int:
+        return sum(
+            len(Table.from_splayed(self._splayed_path(i), self._sym_path))
+            for i in range(len(self.part_dirs))
+        )
+
+    def _splayed_path(self, index: int) -> str:
+        return f"{self.root}/{self.part_dirs[index]}/{self.name}/"
+
+    def load_partition(self, index: int, columns: list[str] | None = None) -> Table:
+        return _load_partition(
+            self._splayed_path(index),
+            self._sym_path,
+            part_col_name=self.part_column,
+            part_value=self.part_values[index],
+            part_ray_type=self._part_ray_type,
+            columns=self._columns if columns is None else columns,
+        )
+
+    def _load(self, indices: list[int], columns: list[str] | None = None) -> Table:
+        parts = [self.load_partition(i, columns) for i in indices]
+        return parts[0].concat(*parts[1:]) if len(parts) > 1 else parts[0]
+
+    def collect(self) -> Table:
+        """Eagerly load every partition, as `from_parted(..., lazy=False)` does."""
+        result = self._load(list(range(len(self.part_dirs))))
+        result.is_parted = True
+        return result
+
+    @property
+    def ptr(self) -> r.RayObject:
+        return self.collect().ptr
+
+    @property
+    def evaled_ptr(self) -> r.RayObject:
+        return self.collect().evaled_ptr
+
+    def columns(self) -> Vector:
+        if self._columns is not None:
+            return Vector(items=self._columns, ray_type=Symbol)
+        first = Table.from_splayed(self._splayed_path(0), self._sym_path)
+        names = [self.part_column] + [_col_name(c) for c in first.columns()]
+        return Vector(items=names, ray_type=Symbol)
+
+    def select(self, *cols, **computed_cols) -> SelectQuery:
+        return SelectQuery(table=t.cast("_TableProtocol", self)).select(*cols, **computed_cols)
+
+    def where(self, condition: Expression) -> SelectQuery:
+        return SelectQuery(table=t.cast("_TableProtocol", self)).where(condition)
+
+    def by(self, *cols, **computed_cols) -> SelectQuery:
+        return SelectQuery(table=t.cast("_TableProtocol", self)).by(*cols, **computed_cols)
+
+    def order_by(self, *cols: OrderKey, desc: bool = False) -> SelectQuery:
+        return SelectQuery(table=t.cast("_TableProtocol", self)).order_by(*cols, desc=desc)
+
+    def partition_stats(self, index: int) -> dict[str, t.Any] | None:
+        """Zone map written alongside the partition, if any (cached)."""
+        if index not in self._stats:
+            self._stats[index] = _read_stats(self._splayed_path(index))
+        return self._stats[index]
+
+    def prune(self, conditions: list[Expression]) -> list[int]:
+        """Indices of the partitions that can satisfy every condition: first
+        by the partition key, then by each partition's column zone map."""
+        keep = [True] * len(self.part_values)
+        for cond in conditions:
+            mask = _partition_mask(cond, self.part_column, self.part_values)
+            if mask is not None:
+                keep = [a and b for a, b in zip(keep, mask, strict=True)]
+        out = []
+        for i, k in enumerate(keep):
+            if not k:
+                continue
+            zone = self.partition_stats(i)
+            if zone is None or all(_zone_may_match(c, zone) for c in conditions):
+                out.append(i)
+        return out
+
+    def _merge_plan(self, query: SelectQuery) -> dict[str, Operation] | None:
+        if not query._select_cols:
+            return None
+        cols, computed = query._select_cols
+        if cols or not computed:
+            return None
+        by_cols, by_computed = query._by_cols
+        if by_computed or not all(isinstance(c, str) for c in by_cols):
+            return None
+        plan: dict[str, Operation] = {}
+        for name, expr in computed.items():
+            if type(expr) is not Expression or expr.operation not in _PARTITION_MERGE_AGGS:
+                return None
+            plan[name] = _PARTITION_MERGE_AGGS[t.cast("Operation", expr.operation)]
+        return plan
+
+    @staticmethod
+    def _is_sketch_only(query: SelectQuery) -> bool:
+        if not query._select_cols:
+            return False
+        cols, computed = query._select_cols
+        by_cols, by_computed = query._by_cols
+        return (
+            not cols
+            and bool(computed)
+            and not by_computed
+            and all(isinstance(c, str) for c in by_cols)
+            and all(isinstance(e, _SketchExpression) for e in computed.values())
+        )
+
+    def _execute_sketch_select(
+        self, query: SelectQuery, indices: list[int], needed: list[str] | None
+    ) -> Table:
+        """Approximate aggregations, one partition at a time: each partition's
+        groups are sketched, and sketches of the same group key are merged
+        before the estimates are read off."""
+        _, computed = query._select_cols  # type: ignore[misc]
+        by_cols = list(query._by_cols[0])
+        merged: dict[tuple[t.Any, ...], dict[str, t.Any]] = {}
+        key_types: list[int] = []
+        for i in indices:
+            part = SelectQuery(
+                table=self.load_partition(i, needed),
+                select_cols=(
+                    (),
+                    {
+                        **{f"__sketch_src_{n}": e.operands[0] for n, e in computed.items()},
+                        **{k: Column(k) for k in by_cols},
+                    },
+                ),
+                where_conditions=query._where_conditions,
+            ).execute()
+            key_types = key_types or [FFI.get_obj_type(part[k].ptr) for k in by_cols]
+            if by_cols and not len(part):
+                continue
+            key_values = [part[k].to_list() for k in by_cols]
+            codes, first = (
+                _first_seen_codes([part[k].to_numpy() for k in by_cols]) if by_cols else (None, [0])
+            )
+            cache: dict[t.Hashable, list[t.Any]] = {}
+            for name, node in computed.items():
+                sketches = _group_sketches(part[f"__sketch_src_{name}"], node, codes, cache)
+                for g, sketch in enumerate(sketches):
+                    key = tuple(values[first[g]] for values in key_values)
+                    slot = merged.setdefault(key, {})
+                    # Sketches may be shared between projections; merge copies.
+                    if name in slot:
+                        slot[name].merge(sketch)
+                    else:
+                        slot[name] = type(sketch).from_bytes(sketch.to_bytes())
+
+        columns: dict[str, t.Any] = {
+            k: Vector(items=[key[j] for key in merged], ray_type=key_types[j])
+            for j, k in enumerate(by_cols)
+        }
+        for name, node in computed.items():
+            results = [_sketch_result(slot[name], node) for slot in merged.values()]
+            if node.kind == _WindowKind.APPROX_DISTINCT:
+                columns[name] = Vector(items=results, ray_type=I64)
+            else:
+                missing = np.array([value is None for value in results], dtype=bool)
+                columns[name] = Vector.from_numpy(
+                    np.array([np.nan if v is None else v for v in results], dtype=np.float64)
+                )
+                _apply_null_mask(columns[name], missing)
+        result = Table(columns)
+        if query._order_by_cols:
+            result = SelectQuery(table=result, order_by_cols=query._order_by_cols).execute()
+        return result
+
+    def _execute_select(self, query: SelectQuery) -> Table:
+        indices = self.prune(query._where_conditions)
+        plan = self._merge_plan(query)
+        needed = _referenced_columns(query)
+        if needed is not None:
+            # Drop output aliases (e.g. an order_by on a computed name).
+            available = {_col_name(c) for c in self.columns()}
+            needed = [c for c in needed if c in available] or None
+
+        def rebind(table: Table, *, order: bool) -> SelectQuery:
+            return SelectQuery(
+                table=table,
+                select_cols=query._select_cols,
+                where_conditions=query._where_conditions,
+                by_cols=query._by_cols,
+                order_by_cols=query._order_by_cols if order else None,
+            )
+
+        if not indices:
+            # Nothing survives pruning: run against an empty slice of one
+            # partition so the result still carries the right schema.
+            return rebind(self.load_partition(0, needed).take(0), order=True).execute()
+
+        if len(indices) > 1 and self._is_sketch_only(query):
+            return self._execute_sketch_select(query, indices, needed)
+
+        if plan is None or len(indices) == 1:
+            return rebind(self._load(indices, needed), order=True).execute()
+
+        partials = [rebind(self.load_partition(i, needed), order=False).execute() for i in indices]
+        combined = partials[0].concat(*partials[1:])
+        merge = SelectQuery(
+            table=combined,
+            select_cols=((), {n: Expression(op, Column(n)) for n, op in plan.items()}),
+            by_cols=(query._by_cols[0], {}),
+            order_by_cols=query._order_by_cols,
+        )
+        return merge.execute()
+
+
+# Operations whose result is not row-aligned with their input. A projection
+# containing one cannot have filters or further projections pushed through it.
+_ROW_CHANGING_OPS: frozenset[Operation] = frozenset(
+    Operation[op] for op in (*_UNARY_AGGS.values(), *_BINARY_AGGS.values())
+)
+
+
+def _has_aggregation(value: t.Any) -> bool:
+    if not isinstance(value, Expression):
+        return False
+    if isinstance(value, _WindowExpression):
+        # Not row-aligned either: each row depends on its neighbours.
+        return True
+    if isinstance(value.operation, Operation) and value.operation in _ROW_CHANGING_OPS:
+        return True
+    return any(_has_aggregation(o) for o in value.operands)
+
+
+def _substitute(value: t.Any, projection: dict[str, t.Any] | None) -> t.Any:
+    """Rewrite `value` so its column references point at the expressions
+    `projection` defines them as, i.e. in terms of the projection's input."""
+    if projection is None:
+        return value
+    if isinstance(value, Column):
+        if value.name not in projection:
+            raise errors.RayforceConversionError(f"Columns not found: {value.name}")
+        return projection[value.name]
+    if isinstance(value, Expression):
+        return type(value)(value.operation, *(_substitute(o, projection) for o in value.operands))
+    return value
+
+
+def _same_expr(a: t.Any, b: t.Any) -> bool:
+    return _plan_key(a, set()) == _plan_key(b, set())
+
+
+class _LazyStage:
+    """Operations fused into a single select over `source`: one projection
+    (output name -> expression over the source columns), the where
+    conditions, grouping, a sort and a limit, applied in that order."""
+
+    def __init__(self, source: _TableProtocol) -> None:
+        self.source = source
+        self.projection: dict[str, t.Any] | None = None
+        self.wheres: list[Expression] = []
+        self.by: tuple[tuple[t.Any, ...], dict[str, t.Any]] | None = None
+        self.order: tuple[tuple[str, ...], bool | tuple[bool, ...]] | None = None
+        self.limit: tuple[int, int] | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.projection is None
+            and not self.wheres
+            and self.by is None
+            and self.order is None
+            and self.limit is None
+        )
+
+    @property
+    def is_row_aligned(self) -> bool:
+        """Whether output row i is still a function of source row i only."""
+        if self.by is not None or self.limit is not None:
+            return False
+        return self.projection is None or not any(
+            _has_aggregation(e) for e in self.projection.values()
+        )
+
+    def names(self) -> list[str]:
+        if self.projection is not None:
+            return list(self.projection)
+        return [_col_name(c) for c in self.source.columns()]
+
+    def ref(self, name: str) -> t.Any:
+        if self.projection is None:
+            return Column(name)
+        if name not in self.projection:
+            raise errors.RayforceConversionError(f"Columns not found: {name}")
+        return self.projection[name]
+
+    def materialize(self) -> Table:
+        if self.is_empty:
+            return t.cast("Table", self.source)
+        query = SelectQuery(
+            table=self.source,
+            select_cols=((), dict(self.projection)) if self.projection is not None else None,
+            where_conditions=list(self.wheres),
+            by_cols=self.by,
+            order_by_cols=self.order,
+        )
+        if isinstance(self.source, PartedTable):
+            result = query.execute()
+            return result.take(*self.limit) if self.limit is not None else result
+        return query._run(limit=self.limit)
+
+    def flush(self) -> _LazyStage:
+        return self if self.is_empty else _LazyStage(self.materialize())
+
+    def where(self, condition: Expression) -> _LazyStage:
+        stage = self if self.is_row_aligned else self.flush()
+        # Filters commute with row-aligned projections (renames included) and
+        # with sorts, so they are rewritten against the source columns and
+        # evaluated before either.
+        stage.wheres.append(_substitute(condition, stage.projection))
+        return stage
+
+    def project(self, projection: dict[str, t.Any]) -> _LazyStage:
+        """Apply `projection`, whose expressions reference this stage's output."""
+        stage = self if self.is_row_aligned else self.flush()
+        if stage.order is not None and not all(
+            c in projection and _same_expr(projection[c], Column(c)) for c in stage.order[0]
+        ):
+            # The sort keys would not survive the projection.
+            stage = stage.flush()
+        stage.projection = {n: _substitute(e, stage.projection) for n, e in projection.items()}
+        return stage
+
+    def select(self, cols: tuple[t.Any, ...], computed: dict[str, t.Any]) -> _LazyStage:
+        stage = self if self.is_row_aligned else self.flush()
+        projection: dict[str, t.Any] = {}
+        for col in cols:
+            name = col.name if isinstance(col, Column) else col
+            for n in stage.names() if name == "*" else [name]:
+                projection[n] = Column(n)
+        projection.update(computed)
+        return stage.project(projection)
+
+    def drop(self, cols: tuple[str, ...]) -> _LazyStage:
+        stage = self if self.is_row_aligned else self.flush()
+        names = stage.names()
+        if unknown := (set(cols) - set(names)):
+            raise errors.RayforceConversionError(f"Columns not found: {', '.join(sorted(unknown))}")
+        keep = [n for n in names if n not in cols]
+        if not keep:
+            raise errors.RayforceConversionError("Cannot drop all columns")
+        return stage.project({n: Column(n) for n in keep})
+
+    def rename(self, mapping: dict[str, str]) -> _LazyStage:
+        stage = self if self.is_row_aligned else self.flush()
+        names = stage.names()
+        if unknown := (set(mapping) - set(names)):
+            raise errors.RayforceConversionError(f"Columns not found: {', '.join(sorted(unknown))}")
+        resulting = [mapping.get(n, n) for n in names]
+        if collisions := {n for n in resulting if resulting.count(n) > 1}:
+            raise errors.RayforceConversionError(
+                f"Rename would produce duplicate column names: {', '.join(sorted(collisions))}"
+            )
+        projection = {mapping.get(n, n): stage.ref(n) for n in names}
+        if stage.order is not None:
+            cols, desc = stage.order
+            stage.order = (tuple(mapping.get(c, c) for c in cols), desc)
+        stage.projection = projection
+        return stage
+
+    def group(self, cols: tuple[t.Any, ...], computed: dict[str, t.Any]) -> _LazyStage:
+        # `select(...).by(...)` is one grouped select; anything else already
+        # in the stage (a sort, a limit, a plain projection) runs first.
+        stage = self
+        if (
+            self.by is not None
+            or self.order is not None
+            or self.limit is not None
+            or (
+                self.projection is not None
+                and not all(_has_aggregation(e) for e in self.projection.values())
+            )
+        ):
+            stage = self.flush()
+        stage.by = (cols, computed)
+        return stage
+
+    def sort(self, cols: tuple[str, ...], desc: bool | tuple[bool, ...]) -> _LazyStage:
+        stage = self if self.order is None and self.limit is None else self.flush()
+        stage.order = (cols, desc)
+        return stage
+
+    def take(self, n: int, offset: int) -> _LazyStage:
+        stage = self if self.limit is None else self.flush()
+        stage.limit = (n, offset)
+        return stage
+
+
+class LazyTable:
+    """Deferred chain of table operations, built by `Table.lazy()`.
+
+    Nothing runs until `collect()`, which fuses the recorded operations into
+    as few selects as possible: filters are pushed below projections, renames
+    and sorts, and a limit is folded into the same eval as the sort before
+    it. Joins and casts run on their own, on the fused result so far."""
+
+    def __init__(self, source: _TableProtocol, ops: tuple[tuple[t.Any, ...], ...] = ()) -> None:
+        self._source = source
+        self._ops = ops
+
+    def _then(self, *op: t.Any) -> LazyTable:
+        return LazyTable(self._source, (*self._ops, op))
+
+    def select(self, *cols, **computed_cols) -> LazyTable:
+        return self._then("select", cols, computed_cols)
+
+    def where(self, condition: Expression) -> LazyTable:
+        return self._then("where", condition)
+
+    def by(self, *cols, **computed_cols) -> LazyTable:
+        return self._then("group", cols, computed_cols)
+
+    def order_by(self, *cols: OrderKey, desc: bool = False) -> LazyTable:
+        return self._then("sort", *_order_spec(cols, desc))
+
+    def take(self, n: int, offset: int = 0) -> LazyTable:
+        if not isinstance(n, int) or not isinstance(offset, int):
+            raise errors.RayforceConversionError("Number of rows has to be an integer")
+        return self._then("take", n, offset)
+
+    def head(self, n: int = 5) -> LazyTable:
+        return self.take(n)
+
+    def drop(self, *cols: str) -> LazyTable:
+        return self._then("drop", cols)
+
+    def rename(self, mapping: dict[str, str]) -> LazyTable:
+        return self._then("rename", dict(mapping))
+
+    def cast(self, column: str | Mapping[str, type], to_type: type | None = None) -> LazyTable:
+        return self._then("cast", column, to_type)
+
+    def inner_join(self, other: _TableProtocol | LazyTable, on: str | list[str]) -> LazyTable:
+        return self._then("join", InnerJoin, other, on)
+
+    def left_join(self, other: _TableProtocol | LazyTable, on: str | list[str]) -> LazyTable:
+        return self._then("join", LeftJoin, other, on)
+
+    def asof_join(self, other: _TableProtocol | LazyTable, on: str | list[str]) -> LazyTable:
+        return self._then("join", AsofJoin, other, on)
+
+    def semi_join(self, other: _TableProtocol | LazyTable, on: str | list[str]) -> LazyTable:
+        return self._then("join", SemiJoin, other, on)
+
+    def anti_join(self, other: _TableProtocol | LazyTable, on: str | list[str]) -> LazyTable:
+        return self._then("join", AntiJoin, other, on)
+
+    def collect(self) -> Table:
+        stage = _LazyStage(self._source)
+        for op, *args in self._ops:
+            if op == "join":
+                join_cls, other, on = args
+                if isinstance(other, LazyTable):
+                    other = other.collect()
+                stage = _LazyStage(join_cls(stage.materialize(), other, on).execute())
+            elif op == "cast":
+                # The DAG select rejects `(as 'type col)` projections, so a
+                # cast cannot be fused and always materializes what precedes it.
+                stage = _LazyStage(stage.materialize().cast(*args))
+            else:
+                stage = getattr(stage, op)(*args)
+        return stage.materialize()
+
+    def execute(self) -> Table:
+        return self.collect()
+
+
 class PivotQuery:
     AGGFUNC_MAP: t.ClassVar[dict[str, Operation]] = {
         "sum": Operation.SUM,
@@ -1468,31 +4514,99 @@ class PivotQuery:
         self.aggfunc = aggfunc
 
     def execute(self) -> Table:
-        col_vec = self.table[self.columns]
-        unique_values = list(dict.fromkeys(_unwrap_value(v) for v in col_vec.to_python()))
-        if not unique_values:
+        # One grouped aggregation over the source, then a reshape of the
+        # (index, column) groups into the wide layout: each output column is
+        # a single gather from the aggregated values, with nulls for the
+        # combinations that do not occur.
+        grouped = (
+            self.table.select(
+                **{_PIVOT_VALUE: Expression(self.AGGFUNC_MAP[self.aggfunc], Column(self.values))}
+            )
+            .by(*self.index, self.columns)
+            .execute()
+        )
+        if len(grouped) == 0:
             raise errors.RayforceValueError(f"No values in pivot column '{self.columns}'")
 
-        tables: list[Table] = []
-        for val in unique_values:
-            filtered = (
-                self.table.select(*self.index, self.values)
-                .where(Column(self.columns) == val)
-                .execute()
-            )
-            tables.append(
-                filtered.select(
-                    **{str(val): Expression(self.AGGFUNC_MAP[self.aggfunc], Column(self.values))}
-                )
-                .by(*self.index)
-                .execute()
-            )
+        row_ids, row_first = _first_seen_codes([grouped[c].to_numpy() for c in self.index])
+        col_ids, col_first = _first_seen_codes([grouped[self.columns].to_numpy()])
+        n_cols = len(col_first)
+        cells = np.full(len(row_first) * n_cols, -1, dtype=np.int64)
+        cells[row_ids * n_cols + col_ids] = np.arange(len(grouped), dtype=np.int64)
+
+        result: dict[str, t.Any] = {c: _gather(grouped[c], row_first) for c in self.index}
+        pivot_values = _gather(grouped[self.columns], col_first).to_python()
+        values = grouped[_PIVOT_VALUE]
+        for j, value in enumerate(pivot_values):
+            sources = cells[j::n_cols]
+            missing = sources < 0
+            column = _gather(values, np.where(missing, 0, sources))
+            _apply_null_mask(column, missing)
+            result[str(_unwrap_value(value))] = column
+        return Table(result)
+
+
+# Name of the aggregated column in the intermediate grouped pivot result.
+_PIVOT_VALUE = "__pivot_value"
+
+
+def _gather(vec: Vector, indices: t.Any) -> Vector:
+    # `at` with an index vector boxes its result into a list when applied to
+    # a vector; indexing a table gathers every column as a typed vector.
+    table = FFI.init_table(
+        columns=Vector(items=["x"], ray_type=Symbol).ptr, values=FFI.init_list([vec.ptr])
+    )
+    index = Vector.from_numpy(np.asarray(indices, dtype=np.int64))
+    gathered = utils.eval_obj(List([Operation.AT, table, index]))
+    return utils.ray_to_python(FFI.at_idx(FFI.get_table_values(gathered.ptr), 0))
 
-        result = tables[0]
-        for tbl in tables[1:]:
-            result = result.left_join(tbl, on=self.index).execute()
 
-        return result
+def _sample_rows(
+    length: int, n: int | None, frac: float | None, seed: int | None, codes: t.Any = None
+) -> t.Any:
+    """Sorted row numbers of a sample without replacement: `n` rows or a
+    `frac` of them, per group of `codes` when given."""
+    if n is not None:
+        count = n
+
+        def quota(sizes: t.Any) -> t.Any:
+            return np.minimum(count, sizes)
+
+    elif frac is not None:
+        share = frac
+
+        def quota(sizes: t.Any) -> t.Any:
+            return np.round(share * sizes).astype(np.int64)
+
+    else:
+        raise errors.RayforceValueError("sample() needs exactly one of n and frac")
+
+    rng = np.random.default_rng(seed)
+    if codes is None:
+        return np.sort(rng.choice(length, int(quota(length)), replace=False))
+    # Shuffle within each group by random priority and keep each group's
+    # first rows.
+    order = np.lexsort((rng.random(length), codes))
+    grouped = codes[order]
+    sizes = np.bincount(codes)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    keep = np.arange(length) - starts[grouped] < quota(sizes)[grouped]
+    return np.sort(order[keep])
+
+
+def _first_seen_codes(keys: list[t.Any]) -> tuple[t.Any, t.Any]:
+    """Number the distinct rows of the key arrays in order of first
+    appearance. Returns each row's code and, per code, its first row."""
+    codes = np.zeros(len(keys[0]), dtype=np.int64)
+    for key in keys:
+        _, inverse = np.unique(key, return_inverse=True)
+        # Re-densify after each key so the combined code cannot overflow.
+        _, codes = np.unique(codes * (inverse.max() + 1) + inverse, return_inverse=True)
+    _, first, codes = np.unique(codes, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[codes], first[order]
 
 
 class TableColumnInterval:
@@ -1538,14 +4652,20 @@ __all__ = [
     "Expression",
     "InnerJoin",
     "InsertQuery",
+    "LazyTable",
     "LeftJoin",
+    "Param",
+    "PartedTable",
     "PivotQuery",
+    "PreparedQuery",
+    "QueryProfile",
     "Table",
     "TableColumnInterval",
     "UpdateQuery",
     "UpsertQuery",
     "WindowJoin",
     "WindowJoin1",
+    "clear_plan_cache",
 ]
 
 TypeRegistry.register(type_code=r.TYPE_TABLE, type_class=Table)
@@ -1,9 +1,20 @@
 from .conversion import python_to_ray, ray_to_python
 from .evaluation import eval_obj, eval_str
+from .hooks import EvalEvent, add_eval_hook, enable_slow_query_log, remove_eval_hook
+from .sketch import HyperLogLog, QuantileSketch
+from .snapshot import restore_env, snapshot_env
 
 __all__ = [
+    "EvalEvent",
+    "HyperLogLog",
+    "QuantileSketch",
+    "add_eval_hook",
+    "enable_slow_query_log",
     "eval_obj",
     "eval_str",
     "python_to_ray",
     "ray_to_python",
+    "remove_eval_hook",
+    "restore_env",
+    "snapshot_env",
 ]
@@ -1,21 +1,51 @@
 from __future__ import annotations
 
+import time
 import typing as t
 
 from rayforce import _rayforce_c as r
 from rayforce import errors
 from rayforce.ffi import FFI
+from rayforce.utils import hooks
 from rayforce.utils.conversion import ray_to_python
 
 
+def _checked(result_ptr: r.RayObject) -> r.RayObject:
+    if FFI.get_obj_type(result_ptr) == r.TYPE_ERR:
+        raise errors.RayforceEvaluationError(f"Evaluation error: {FFI.get_error_obj(result_ptr)}")
+    return result_ptr
+
+
+def _evaluate(expr: str | r.RayObject, evaluate: t.Callable[[], r.RayObject]) -> r.RayObject:
+    if not hooks.observing():
+        return _checked(evaluate())
+
+    start = time.perf_counter()
+    result_ptr: r.RayObject | None = None
+    error: Exception | None = None
+    try:
+        with hooks.suspended():
+            result_ptr = _checked(evaluate())
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        hooks.dispatch(expr, duration, result_ptr, error)
+    return result_ptr
+
+
 def eval_str(expr: str, *, raw: bool = False) -> t.Any:
     if not isinstance(expr, str):
         raise errors.RayforceEvaluationError(f"Expression must be a string, got {type(expr)}")
 
-    result_ptr = FFI.eval_str(FFI.init_string(expr))
-    if FFI.get_obj_type(result_ptr) == r.TYPE_ERR:
-        raise errors.RayforceEvaluationError(f"Evaluation error: {FFI.get_error_obj(result_ptr)}")
+    from rayforce.types.table import _forget_reference_schemas
 
+    try:
+        result_ptr = _evaluate(expr, lambda: FFI.eval_str(FFI.init_string(expr)))
+    finally:
+        # Source text can rebind any global, reference tables included.
+        _forget_reference_schemas()
     return result_ptr if raw else ray_to_python(result_ptr)
 
 
@@ -27,8 +57,5 @@ def eval_obj(obj: t.Any) -> t.Any:
     else:
         raise errors.RayforceEvaluationError(f"Cannot evaluate {type(obj)}")
 
-    result_ptr = FFI.eval_obj(ptr)
-    if FFI.get_obj_type(result_ptr) == r.TYPE_ERR:
-        raise errors.RayforceEvaluationError(f"Evaluation error: {FFI.get_error_obj(result_ptr)}")
-
+    result_ptr = _evaluate(ptr, lambda: FFI.eval_obj(ptr))
     return ray_to_python(result_ptr)
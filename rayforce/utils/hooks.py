@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass
+import logging
+import random
+import typing as t
+
+from rayforce.ffi import FFI
+
+if t.TYPE_CHECKING:
+    from rayforce import _rayforce_c as r
+
+logger = logging.getLogger("rayforce.eval")
+slow_query_logger = logging.getLogger("rayforce.slow_query")
+
+
+@dataclass(frozen=True)
+class EvalEvent:
+    """One call to `eval_str` / `eval_obj` as seen by an eval hook.
+
+    `expr` is the source string or the evaluated RayObject; `duration` is
+    the engine time in seconds. On failure `error` holds the exception and
+    the result fields are None."""
+
+    expr: str | r.RayObject
+    duration: float
+    result_type: int | None = None
+    result_size: int | None = None
+    error: Exception | None = None
+
+    @property
+    def text(self) -> str:
+        """The expression as source text (formatted on demand)."""
+        if isinstance(self.expr, str):
+            return self.expr
+        return FFI.repr_table(self.expr, full=False)
+
+
+EvalHook = t.Callable[[EvalEvent], None]
+
+_eval_hooks: list[EvalHook] = []
+
+# Set while an observed evaluation or its hooks run. Evaluations made from
+# inside a hook, or by the library itself while it converts a result or an
+# error, are not dispatched again.
+_dispatching: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "rayforce_eval_hooks_dispatching", default=False
+)
+
+
+def observing() -> bool:
+    """Whether the evaluation about to start should be reported to hooks."""
+    return bool(_eval_hooks) and not _dispatching.get()
+
+
+@contextmanager
+def suspended() -> t.Iterator[None]:
+    token = _dispatching.set(True)
+    try:
+        yield
+    finally:
+        _dispatching.reset(token)
+
+
+def add_eval_hook(hook: EvalHook) -> EvalHook:
+    """Call `hook` with an `EvalEvent` after every evaluation. Returns the
+    hook, so it can also be used as a decorator."""
+    _eval_hooks.append(hook)
+    return hook
+
+
+def remove_eval_hook(hook: EvalHook) -> None:
+    if hook in _eval_hooks:
+        _eval_hooks.remove(hook)
+
+
+def dispatch(
+    expr: str | r.RayObject,
+    duration: float,
+    result: r.RayObject | None,
+    error: Exception | None,
+) -> None:
+    if _dispatching.get():
+        return
+    result_type = result_size = None
+    if result is not None:
+        result_type = FFI.get_obj_type(result)
+        result_size = FFI.get_obj_length(result) if result_type >= 0 else 1
+    event = EvalEvent(expr, duration, result_type, result_size, error)
+    with suspended():
+        for hook in _eval_hooks.copy():
+            # A broken hook must not fail the query it is observing.
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("eval hook %r raised", hook)
+
+
+def enable_slow_query_log(
+    threshold: float = 0.1,
+    *,
+    sample_rate: float = 1.0,
+    log: logging.Logger | None = None,
+) -> EvalHook:
+    """Log evaluations that take at least `threshold` seconds (and all
+    failed ones) as warnings, keeping a `sample_rate` fraction of them.
+    Returns the installed hook; pass it to `remove_eval_hook` to stop."""
+    target = log or slow_query_logger
+
+    def slow_query_hook(event: EvalEvent) -> None:
+        if event.error is None and event.duration < threshold:
+            return
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return
+        if event.error is not None:
+            target.warning("failed after %.3fs: %s (%s)", event.duration, event.text, event.error)
+        else:
+            target.warning(
+                "slow query %.3fs (size %s): %s", event.duration, event.result_size, event.text
+            )
+
+    return add_eval_hook(slow_query_hook)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+import typing as t
+
+import numpy as np
+
+from rayforce import errors
+
+_U64 = np.uint64
+
+
+def _mix64(bits: t.Any) -> t.Any:
+    # splitmix64 finalizer: a cheap, well-distributed 64-bit mix.
+    z = bits + _U64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> _U64(30))) * _U64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> _U64(27))) * _U64(0x94D049BB133111EB)
+    return z ^ (z >> _U64(31))
+
+
+def hash64(values: t.Any) -> t.Any:
+    """Stable 64-bit hash of every element of `values`. Numbers and
+    datetimes hash their bit pattern; anything else hashes its string form
+    once per distinct value. Stable across processes, so sketches built in
+    different interpreters can be merged."""
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind in "iub":
+        return _mix64(values.astype(np.int64).view(_U64))
+    if kind == "f":
+        as_float = values.astype(np.float64)
+        return _mix64(np.where(as_float == 0, 0.0, as_float).view(_U64))  # -0.0 == 0.0
+    if kind in "mM":
+        return _mix64(values.view(np.int64).view(_U64))
+    uniques, inverse = np.unique(values.astype(str), return_inverse=True)
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(u.encode(), digest_size=8).digest(), "little")
+            for u in uniques.tolist()
+        ),
+        dtype=_U64,
+        count=len(uniques),
+    )
+    return hashes[inverse.reshape(-1)]
+
+
+def _bit_length32(values: t.Any) -> t.Any:
+    # Exact for values below 2**32, which float64 represents exactly.
+    return np.frexp(values.astype(np.float64))[1]
+
+
+def _leading_zeros64(values: t.Any) -> t.Any:
+    high = _bit_length32(values >> _U64(32))
+    low = _bit_length32(values & _U64(0xFFFFFFFF))
+    return np.where(high > 0, 32 - high, 64 - low)
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch with `2**precision` registers.
+
+    The standard error is about `1.04 / sqrt(2**precision)`, 1.6% at the
+    default precision of 12, and the sketch takes `2**precision` bytes
+    however many values it has seen. Sketches of the same precision merge
+    by taking the register-wise maximum."""
+
+    def __init__(self, precision: int = 12) -> None:
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise errors.RayforceValueError(
+                f"HyperLogLog precision must be an integer in [4, 18], got {precision!r}"
+            )
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @staticmethod
+    def _positions(values: t.Any, precision: int) -> tuple[t.Any, t.Any]:
+        hashes = hash64(values)
+        index = (hashes >> _U64(64 - precision)).astype(np.int64)
+        rank = np.minimum(_leading_zeros64(hashes << _U64(precision)) + 1, 64 - precision + 1)
+        return index, rank.astype(np.uint8)
+
+    @classmethod
+    def grouped(
+        cls, values: t.Any, groups: t.Any, n_groups: int, precision: int = 12
+    ) -> list[HyperLogLog]:
+        """One sketch per group, `groups` holding each value's group number."""
+        sketches = [cls(precision) for _ in range(n_groups)]
+        if n_groups and len(values):
+            size = 1 << precision
+            index, rank = cls._positions(values, precision)
+            registers = np.zeros(n_groups * size, dtype=np.uint8)
+            np.maximum.at(registers, np.asarray(groups, dtype=np.int64) * size + index, rank)
+            for sketch, row in zip(sketches, registers.reshape(n_groups, size), strict=True):
+                sketch.registers = row
+        return sketches
+
+    def update(self, values: t.Any) -> None:
+        if len(values):
+            index, rank = self._positions(values, self.precision)
+            np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """Fold `other` into this sketch (in place) and return it."""
+        if other.precision != self.precision:
+            raise errors.RayforceValueError(
+                f"Cannot merge HyperLogLog sketches of precision {self.precision} "
+                f"and {other.precision}"
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(size, 0.7213 / (1 + 1.079 / size))
+        raw = alpha * size * size / np.exp2(-self.registers.astype(np.float64)).sum()
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            return round(size * np.log(size / zeros))
+        return round(raw)
+
+    def to_bytes(self) -> bytes:
+        return bytes([self.precision]) + self.registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> HyperLogLog:
+        sketch = cls(data[0])
+        sketch.registers = np.frombuffer(data, dtype=np.uint8, offset=1).copy()
+        return sketch
+
+
+# Bucket keys are laid out so that they sort in value order: negative values
+# below _ZERO_KEY (larger magnitude first), zero at it, positive values above.
+_ZERO_KEY = 1 << 40
+# Magnitudes below this are counted as zero.
+_MIN_MAGNITUDE = 1e-300
+_QUANTILE_HEADER = struct.Struct("<dq")
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with relative error guarantees.
+
+    Values are counted in logarithmically sized buckets, so any quantile is
+    returned within `relative_accuracy` of the exact value, using memory that
+    grows with the range of the data rather than its size. Merging adds the
+    bucket counts, so a merged sketch answers exactly as one built over all
+    of the values would."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise errors.RayforceValueError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy!r}"
+            )
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = float(np.log(self._gamma))
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def _keys_for(self, values: t.Any) -> t.Any:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        magnitude = np.abs(values)
+        indexable = magnitude >= _MIN_MAGNITUDE
+        logs = np.log(np.where(indexable, magnitude, 1.0))
+        exponent = np.ceil(logs / self._log_gamma).astype(np.int64)
+        return np.where(
+            ~indexable, _ZERO_KEY, np.where(values > 0, 2 * _ZERO_KEY + exponent, -exponent)
+        )
+
+    def _value(self, key: int) -> float:
+        if key == _ZERO_KEY:
+            return 0.0
+        exponent = key - 2 * _ZERO_KEY if key > _ZERO_KEY else -key
+        value = 2 * self._gamma**exponent / (self._gamma + 1)
+        return value if key > _ZERO_KEY else -value
+
+    def _add(self, keys: t.Any, counts: t.Any) -> None:
+        keys, inverse = np.unique(np.concatenate([self.keys, keys]), return_inverse=True)
+        self.counts = np.bincount(
+            inverse.reshape(-1), weights=np.concatenate([self.counts, counts]), minlength=len(keys)
+        ).astype(np.int64)
+        self.keys = keys
+
+    @classmethod
+    def grouped(
+        cls, values: t.Any, groups: t.Any, n_groups: int, relative_accuracy: float = 0.01
+    ) -> list[QuantileSketch]:
+        """One sketch per group, `groups` holding each value's group number."""
+        sketches = [cls(relative_accuracy) for _ in range(n_groups)]
+        if not n_groups:
+            return sketches
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(values)
+        keys = sketches[0]._keys_for(values)
+        groups = np.asarray(groups, dtype=np.int64)[finite]
+        order = np.lexsort((keys, groups))
+        keys, groups = keys[order], groups[order]
+        starts = np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]) | (groups[1:] != groups[:-1])])
+        counts = np.diff(np.r_[starts, len(keys)])
+        bounds = np.searchsorted(groups[starts], np.arange(n_groups + 1))
+        for g, sketch in enumerate(sketches):
+            lo, hi = bounds[g], bounds[g + 1]
+            sketch.keys = keys[starts[lo:hi]]
+            sketch.counts = counts[lo:hi]
+        return sketches
+
+    def update(self, values: t.Any) -> None:
+        keys, counts = np.unique(self._keys_for(values), return_counts=True)
+        self._add(keys, counts)
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Fold `other` into this sketch (in place) and return it."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise errors.RayforceValueError(
+                "Cannot merge quantile sketches with different relative accuracy"
+            )
+        self._add(other.keys, other.counts)
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        """The `q`-quantile (0 <= q <= 1) of the values seen, or None if
+        there are none."""
+        if not 0 <= q <= 1:
+            raise errors.RayforceValueError(f"Quantile must be in [0, 1], got {q!r}")
+        total = self.count
+        if not total:
+            return None
+        position = int(np.searchsorted(np.cumsum(self.counts), q * (total - 1), side="right"))
+        return self._value(int(self.keys[position]))
+
+    def to_bytes(self) -> bytes:
+        header = _QUANTILE_HEADER.pack(self.relative_accuracy, len(self.keys))
+        return header + self.keys.tobytes() + self.counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> QuantileSketch:
+        relative_accuracy, size = _QUANTILE_HEADER.unpack_from(data)
+        sketch = cls(relative_accuracy)
+        offset = _QUANTILE_HEADER.size
+        sketch.keys = np.frombuffer(data, dtype=np.int64, count=size, offset=offset).copy()
+        sketch.counts = np.frombuffer(
+            data, dtype=np.int64, count=size, offset=offset + 8 * size
+        ).copy()
+        return sketch
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+
+from rayforce import _rayforce_c as r
+from rayforce import errors
+from rayforce.ffi import FFI
+from rayforce.types.operators import Operation
+
+# Builtins live in the environment alongside user globals; they are part of
+# the runtime itself and must never be written to (or restored from) disk.
+_BUILTIN_TYPES = frozenset({r.TYPE_UNARY, r.TYPE_BINARY, r.TYPE_VARY})
+
+
+def _env_bindings() -> tuple[list[str], list[r.RayObject]]:
+    env = FFI.eval_obj(FFI.init_list([Operation.ENV.primitive]))
+    if FFI.get_obj_type(env) == r.TYPE_ERR:
+        raise errors.RayforceEvaluationError(f"Evaluation error: {FFI.get_error_obj(env)}")
+    if FFI.get_obj_type(env) != r.TYPE_DICT:
+        raise errors.RayforceTypeError("Expected (env) to return a dict of globals")
+
+    keys = FFI.get_dict_keys(env)
+    values = FFI.get_dict_values(env)
+    names: list[str] = []
+    bound: list[r.RayObject] = []
+    for i in range(FFI.get_obj_length(keys)):
+        name = FFI.read_symbol(FFI.at_idx(keys, i))
+        value = FFI.at_idx(values, i)
+        # Dot-prefixed names are the runtime's own namespaces (.sys, .os, ...);
+        # double-underscore names are rayforce-py's internal bindings
+        # (`__param_*`, `__pyfn_*`), which only make sense in this process.
+        if name.startswith((".", "__")) or FFI.get_obj_type(value) in _BUILTIN_TYPES:
+            continue
+        names.append(name)
+        bound.append(value)
+    return names, bound
+
+
+def snapshot_env(path: str | os.PathLike[str]) -> list[str]:
+    """Persist every user-defined global (tables, dicts, lambdas, ...) to a
+    single snapshot file at `path`. Returns the names that were saved.
+
+    Symbols are carried by name in the serialization format, so restoring
+    re-interns them in the new process."""
+    path = os.fspath(path)
+    names, bound = _env_bindings()
+    snapshot = FFI.init_dict(FFI.init_vector(r.TYPE_SYMBOL, names), FFI.init_list(bound))
+    staging = f"{path}.tmp"
+    FFI.dump_obj(snapshot, staging)
+    os.replace(staging, path)
+    return names
+
+
+def restore_env(path: str | os.PathLike[str]) -> list[str]:
+    """Rebind every global stored by `snapshot_env`, overwriting existing
+    bindings of the same name. Returns the names that were restored."""
+    from rayforce.types.table import _forget_reference_schemas
+
+    snapshot = FFI.load_obj(os.fspath(path))
+    if FFI.get_obj_type(snapshot) != r.TYPE_DICT:
+        raise errors.RayforceTypeError(f"Snapshot at {os.fspath(path)!r} is not an environment")
+
+    keys = FFI.get_dict_keys(snapshot)
+    values = FFI.get_dict_values(snapshot)
+    names: list[str] = []
+    for i in range(FFI.get_obj_length(keys)):
+        name = FFI.read_symbol(FFI.at_idx(keys, i))
+        FFI.binary_set(FFI.init_symbol(name), FFI.at_idx(values, i))
+        _forget_reference_schemas(name)
+        names.append(name)
+    return names
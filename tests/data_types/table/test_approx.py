@@ -0,0 +1,53 @@
+import pytest
+
+from rayforce import errors
+from rayforce.types import Column, Table, Vector
+from rayforce.types.scalars import F64, I64, Symbol
+from tests.helpers.assertions import assert_column_values, assert_table_shape
+
+
+@pytest.fixture
+def latencies():
+    n = 1000
+    return Table(
+        {
+            "venue": Vector(items=["x" if i % 4 else "y" for i in range(n)], ray_type=Symbol),
+            "user": Vector(items=[i % 300 for i in range(n)], ray_type=I64),
+            "ms": Vector(items=[float(i + 1) for i in range(n)], ray_type=F64),
+        }
+    )
+
+
+def test_approx_distinct(latencies):
+    result = latencies.select(users=Column("user").approx_distinct()).execute()
+
+    assert_table_shape(result, rows=1, cols=1)
+    assert result["users"].to_list() == [pytest.approx(300, rel=0.02)]
+
+
+def test_approx_aggregations_by_group(latencies):
+    result = (
+        latencies.select(
+            users=Column("user").approx_distinct(),
+            p50=Column("ms").approx_quantile(0.5),
+            p99=Column("ms").approx_quantile(0.99),
+            n=Column("ms").count(),
+        )
+        .by("venue")
+        .order_by("venue")
+        .execute()
+    )
+
+    assert_column_values(result, "venue", ["x", "y"])
+    assert_column_values(result, "n", [750, 250])
+    assert result["users"].to_list() == pytest.approx([225, 75], rel=0.02)
+    # Within the default 1% relative accuracy of the exact (lower) quantiles.
+    assert result["p50"].to_list() == pytest.approx([500.0, 497.0], rel=0.01)
+    assert result["p99"].to_list() == pytest.approx([990.0, 985.0], rel=0.01)
+
+
+def test_approx_quantile_rejects_non_numeric(latencies):
+    with pytest.raises(errors.RayforceValueError):
+        Column("ms").approx_quantile(2)
+    with pytest.raises(errors.RayforceTypeError):
+        latencies.select(q=Column("venue").approx_quantile(0.5)).execute()
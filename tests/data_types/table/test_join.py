@@ -1,4 +1,17 @@
-from rayforce import F64, I64, Column, Symbol, Table, TableColumnInterval, Vector
+import uuid
+
+from rayforce import (
+    B8,
+    F64,
+    GUID,
+    I64,
+    Column,
+    String,
+    Symbol,
+    Table,
+    TableColumnInterval,
+    Vector,
+)
 from rayforce.types.scalars import Time
 from tests.helpers.assertions import (
     assert_column_values,
@@ -422,6 +435,153 @@ def test_left_join_with_duplicate_keys():
     assert c_rows[0]["val2"] == None  # noqa: E711  (Rayforce Null == None is True)
 
 
+def test_semi_and_anti_join():
+    trades = Table(
+        {
+            "Sym": Vector(items=["AAPL", "MSFT", "GOOGL", "AAPL", "IBM"], ray_type=Symbol),
+            "Price": Vector(items=[100, 200, 300, 400, 500], ray_type=I64),
+        },
+    )
+    watchlist = Table({"Sym": Vector(items=["AAPL", "GOOGL", "TSLA"], ray_type=Symbol)})
+
+    semi = trades.semi_join(watchlist, "Sym").execute()
+    anti = trades.anti_join(watchlist, "Sym").execute()
+
+    assert_table_shape(semi, rows=3, cols=2)
+    assert_column_values(semi, "Sym", ["AAPL", "GOOGL", "AAPL"])
+    assert_column_values(semi, "Price", [100, 300, 400])
+    assert_column_values(anti, "Sym", ["MSFT", "IBM"])
+    assert_column_values(anti, "Price", [200, 500])
+
+
+def test_semi_join_on_multiple_columns():
+    orders = Table(
+        {
+            "id": Vector(items=[1, 2, 3, 4], ray_type=I64),
+            "venue": Vector(items=["x", "y", "x", "y"], ray_type=Symbol),
+            "qty": Vector(items=[10, 20, 30, 40], ray_type=I64),
+        },
+    )
+    fills = Table(
+        {
+            "id": Vector(items=[1, 2, 3, 3], ray_type=I64),
+            "venue": Vector(items=["x", "x", "x", "x"], ray_type=Symbol),
+        },
+    )
+
+    filled = orders.semi_join(fills, ["id", "venue"]).execute()
+    unfilled = orders.anti_join(fills, ["id", "venue"]).execute()
+
+    # Duplicate keys on the right never duplicate left rows.
+    assert_column_values(filled, "qty", [10, 30])
+    assert_column_values(unfilled, "qty", [20, 40])
+
+
+def test_joins_against_an_indexed_table():
+    trades = Table(
+        {
+            "Sym": Vector(items=["AAPL", "MSFT", "GOOGL", "AAPL"], ray_type=Symbol),
+            "Price": Vector(items=[100, 200, 300, 400], ray_type=I64),
+        },
+    )
+    instruments = Table(
+        {
+            "Sym": Vector(items=["GOOGL", "AAPL", "AAPL"], ray_type=Symbol),
+            "Venue": Vector(items=["x", "y", "z"], ray_type=Symbol),
+            "Lot": Vector(items=[1, 10, 100], ray_type=I64),
+        },
+    )
+    expected = {
+        join: getattr(trades, join)(instruments, "Sym").execute().to_dict()
+        for join in ("inner_join", "left_join", "semi_join")
+    }
+
+    instruments.index("Sym")
+
+    # Answered from the index, row for row as the engine answers them.
+    for join, rows in expected.items():
+        assert getattr(trades, join)(instruments, "Sym").execute().to_dict() == rows
+    assert_column_values(
+        trades.left_join(instruments, "Sym").execute(), "Venue", ["z", "y", "", "x", "z", "y"]
+    )
+
+
+def _contents(table):
+    """Column names and rendered values, nulls included and duplicate names kept."""
+    names = [str(name) for name in table.columns()]
+    return names, [[str(item) for item in column] for column in table.values()]
+
+
+def test_indexed_joins_match_the_engine_for_non_numeric_columns():
+    trades = Table(
+        {
+            "Sym": Vector(items=["AAPL", "MSFT", "GOOGL", "AAPL", "IBM"], ray_type=Symbol),
+            "Venue": Vector(items=["x", "y", "x", "z", "x"], ray_type=Symbol),
+            "Qty": Vector(items=[1, 2, 3, 4, 5], ray_type=I64),
+        },
+    )
+    quotes = Table(
+        {
+            "Sym": Vector(items=["AAPL", "AAPL", "GOOGL", "MSFT", "AAPL"], ray_type=Symbol),
+            "Venue": Vector(items=["x", "x", "x", "x", "z"], ray_type=Symbol),
+            "Id": Vector(items=[uuid.UUID(int=i) for i in range(1, 6)], ray_type=GUID),
+            "Note": Vector(items=["a", "bb", "ccc", "dddd", "e"], ray_type=String),
+            "Live": Vector(items=[True, True, False, True, True], ray_type=B8),
+            "Bid": Vector(items=[1.5, 2.5, 3.5, 4.5, 5.5], ray_type=F64),
+        },
+    )
+    # Duplicate keys on the right, one and two key columns, unmatched rows.
+    for on in ("Sym", ["Sym", "Venue"]):
+        expected = {
+            join: _contents(getattr(trades, join)(quotes, on).execute())
+            for join in ("inner_join", "left_join")
+        }
+        quotes.index(on)
+        for join, contents in expected.items():
+            assert _contents(getattr(trades, join)(quotes, on).execute()) == contents
+
+    assert_column_values(
+        trades.left_join(quotes, ["Sym", "Venue"]).execute(),
+        "Live",
+        [True, True, False, False, True, False],
+    )
+
+
+def test_indexed_join_keeps_clashing_right_columns():
+    left = Table(
+        {
+            "key": Vector(items=["a", "b"], ray_type=Symbol),
+            "val": Vector(items=[1, 2], ray_type=I64),
+        },
+    )
+    right = Table(
+        {
+            "key": Vector(items=["a", "a"], ray_type=Symbol),
+            "val": Vector(items=[10, 20], ray_type=I64),
+        },
+    )
+    expected = _contents(left.left_join(right, "key").execute())
+
+    right.index("key")
+
+    assert _contents(left.left_join(right, "key").execute()) == expected
+
+
+def test_index_is_dropped_when_the_table_changes(make_table):
+    name, _ = make_table(
+        {
+            "Sym": Vector(items=["AAPL"], ray_type=Symbol),
+            "Bid": Vector(items=[50], ray_type=I64),
+        },
+    )
+    quotes = Table(name).index("Sym")
+    trades = Table({"Sym": Vector(items=["AAPL", "MSFT"], ray_type=Symbol)})
+
+    quotes.insert(Sym="MSFT", Bid=60).execute()
+
+    assert_column_values(trades.inner_join(quotes, "Sym").execute(), "Bid", [50, 60])
+
+
 def test_asof_join_with_no_matching_quotes():
     """ASOF join where all trades occur before any quotes — nulls returned."""
     trades = Table(
@@ -544,3 +704,24 @@ def test_left_join_on_reference_tables(make_table):
     assert isinstance(result, Table)
     assert_contains_columns(result, ["Sym", "Price", "Bid"])
     assert_table_shape(result, rows=2, cols=3)
+
+
+def test_inner_join_profile_and_explain():
+    left = Table(
+        {
+            "Sym": Vector(items=["AAPL", "GOOGL"], ray_type=Symbol),
+            "Price": Vector(items=[100, 200], ray_type=I64),
+        }
+    )
+    right = Table(
+        {
+            "Sym": Vector(items=["AAPL", "GOOGL"], ray_type=Symbol),
+            "Bid": Vector(items=[50, 100], ray_type=I64),
+        }
+    )
+    join = left.inner_join(right, "Sym")
+
+    assert "Sym" in join.explain()
+    profile = join.profile()
+    assert profile.rows == 2
+    assert_contains_columns(profile.result, ["Sym", "Price", "Bid"])
@@ -0,0 +1,124 @@
+import pytest
+
+from rayforce import F64, I64, Column, Symbol, Table, Vector, errors
+from rayforce.types.table import LazyTable, SelectQuery
+from tests.helpers.assertions import (
+    assert_column_values,
+    assert_columns,
+    assert_table_equal,
+)
+
+
+@pytest.fixture
+def trades():
+    return Table(
+        {
+            "sym": Vector(items=["a", "b", "a", "c", "b", "a"], ray_type=Symbol),
+            "px": Vector(items=[10.0, 20.0, 11.0, 30.0, 21.0, 12.0], ray_type=F64),
+            "qty": Vector(items=[1, 2, 3, 4, 5, 6], ray_type=I64),
+        }
+    )
+
+
+def test_lazy_returns_lazy_table(trades):
+    assert isinstance(trades.lazy(), LazyTable)
+    assert isinstance(trades.lazy().where(Column("qty") > 1), LazyTable)
+
+
+def test_lazy_matches_eager_chain(trades):
+    eager = (
+        trades.select("sym", "qty", notional=Column("px") * Column("qty"))
+        .where(Column("qty") > 2)
+        .execute()
+        .rename({"notional": "value"})
+    )
+    lazy = (
+        trades.lazy()
+        .select("sym", "qty", notional=Column("px") * Column("qty"))
+        .where(Column("qty") > 2)
+        .rename({"notional": "value"})
+        .collect()
+    )
+    assert_table_equal(lazy, eager)
+
+
+def test_lazy_pushes_filter_through_rename(trades):
+    result = (
+        trades.lazy()
+        .rename({"qty": "size"})
+        .where(Column("size") >= 4)
+        .drop("px")
+        .collect()
+    )
+    assert_columns(result, ["sym", "size"])
+    assert_column_values(result, "size", [4, 5, 6])
+
+
+def test_lazy_sort_limit_fuses_into_one_select(trades, monkeypatch):
+    runs = []
+    original = SelectQuery._run
+
+    def counting_run(self, *args, **kwargs):
+        runs.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(SelectQuery, "_run", counting_run)
+    result = (
+        trades.lazy()
+        .where(Column("sym") == "a")
+        .order_by("px", desc=True)
+        .select("px", "qty")
+        .take(2)
+        .collect()
+    )
+    assert len(runs) == 1
+    assert_column_values(result, "px", [12.0, 11.0])
+
+
+def test_lazy_filter_after_aggregation_runs_in_a_new_stage(trades):
+    result = (
+        trades.lazy()
+        .select(total=Column("qty").sum())
+        .by("sym")
+        .where(Column("total") > 5)
+        .order_by("sym")
+        .collect()
+    )
+    assert_column_values(result, "sym", ["a", "b"])
+    assert_column_values(result, "total", [10, 7])
+
+
+def test_lazy_filter_after_take_is_not_pushed_down(trades):
+    result = trades.lazy().take(3).where(Column("qty") > 1).collect()
+    assert_column_values(result, "qty", [2, 3])
+
+
+def test_lazy_join_and_cast(trades):
+    names = Table(
+        {
+            "sym": Vector(items=["a", "b", "c"], ray_type=Symbol),
+            "name": Vector(items=["alpha", "beta", "gamma"], ray_type=Symbol),
+        }
+    )
+    result = (
+        trades.lazy()
+        .where(Column("qty") <= 2)
+        .inner_join(names.lazy().where(Column("sym") != "c"), on="sym")
+        .cast("qty", F64)
+        .collect()
+    )
+    assert result.dtypes["qty"] == "F64"
+    assert_column_values(result, "name", ["alpha", "beta"])
+
+
+def test_lazy_anti_join(trades):
+    seen = Table({"sym": Vector(items=["a"], ray_type=Symbol)})
+    result = trades.lazy().where(Column("qty") > 1).anti_join(seen, on="sym").collect()
+    assert_column_values(result, "qty", [2, 4, 5])
+
+
+def test_lazy_unknown_column_raises(trades):
+    with pytest.raises(errors.RayforceConversionError):
+        trades.lazy().drop("missing").collect()
+    with pytest.raises(errors.RayforceConversionError):
+        trades.lazy().select("sym").where(Column("qty") > 1).collect()
@@ -1,6 +1,6 @@
 import pytest
 
-from rayforce import F64, I64, Column, Symbol, Table, Vector
+from rayforce import F64, I64, Column, Symbol, Table, Vector, errors
 from tests.helpers.assertions import (
     assert_column_sorted,
     assert_column_values,
@@ -216,3 +216,78 @@ def test_order_by_float_column():
     assert_column_sorted(result, "price")
     assert_column_values(result, "id", ["004", "002", "003", "001"])
     assert_column_values(result, "price", [0.99, 1.59, 2.65, 3.14])
+
+
+@pytest.mark.parametrize("is_inplace", [True, False])
+def test_order_by_mixed_directions(is_inplace, make_table):
+    data = {
+        "sym": Vector(items=["b", "a", "b", "a", "a"], ray_type=Symbol),
+        "time": Vector(items=[1, 2, 3, 4, 2], ray_type=I64),
+        "id": Vector(items=[1, 2, 3, 4, 5], ray_type=I64),
+    }
+
+    if is_inplace:
+        table = Table(data)
+    else:
+        name, _ = make_table(data)
+        table = Table(name)
+    result = table.order_by(("sym", "asc"), (Column("time"), "desc")).execute()
+
+    assert_column_values(result, "sym", ["a", "a", "a", "b", "b"])
+    assert_column_values(result, "time", [4, 2, 2, 3, 1])
+    # Ties keep their input order: the sort is stable.
+    assert_column_values(result, "id", [4, 2, 5, 3, 1])
+
+
+def test_order_by_mixed_directions_with_select_and_where():
+    table = Table(
+        {
+            "sym": Vector(items=["b", "a", "b", "a"], ray_type=Symbol),
+            "px": Vector(items=[1.0, 2.0, 3.0, 4.0], ray_type=F64),
+        },
+    )
+
+    result = (
+        table.select("sym", "px")
+        .where(Column("px") > 1.0)
+        .order_by(("sym", "desc"), "px")
+        .execute()
+    )
+
+    assert_column_values(result, "sym", ["b", "a", "a"])
+    assert_column_values(result, "px", [3.0, 2.0, 4.0])
+
+
+def test_order_by_three_keys_mixed_directions():
+    syms = ["b", "a", "b", "a", "b", "a", "a"]
+    px = [1.0, 2.0, 1.0, 2.0, 3.0, 1.0, 2.0]
+    qty = [5, 3, 7, 3, 1, 2, 9]
+    table = Table(
+        {
+            "sym": Vector(items=syms, ray_type=Symbol),
+            "px": Vector(items=px, ray_type=F64),
+            "qty": Vector(items=qty, ray_type=I64),
+            "id": Vector(items=list(range(7)), ray_type=I64),
+        }
+    )
+
+    result = table.order_by("sym", ("px", "desc"), "qty").execute()
+
+    expected = sorted(range(7), key=lambda i: (syms[i], -px[i], qty[i]))
+    assert_column_values(result, "id", expected)
+
+
+def test_order_by_uniform_pairs_use_single_direction():
+    table = Table({"x": Vector(items=[2, 3, 1], ray_type=I64)})
+
+    query = table.order_by(("x", "desc"))
+
+    assert query._order_by_cols == (("x",), True)
+    assert_column_values(query.execute(), "x", [3, 2, 1])
+
+
+def test_order_by_invalid_direction():
+    table = Table({"x": Vector(items=[2, 3, 1], ray_type=I64)})
+
+    with pytest.raises(errors.RayforceValueError):
+        table.order_by(("x", "down"))
@@ -255,3 +255,21 @@ def test_pivot_default_aggfunc_is_min():
     pv = _get_pivot_values(result, "symbol")
     assert pv["AAPL"]["price"] == 140
     assert pv["GOOG"]["price"] == 2800
+
+
+def test_pivot_keeps_index_keys_missing_from_first_column():
+    table = Table(
+        {
+            "category": Vector(items=["A", "B", "C"], ray_type=Symbol),
+            "type": Vector(items=["x", "y", "y"], ray_type=Symbol),
+            "value": Vector(items=[1, 2, 3], ray_type=I64),
+        }
+    )
+
+    result = table.pivot(index="category", columns="type", values="value", aggfunc="sum").execute()
+
+    assert_table_shape(result, rows=3, cols=3)
+    pv = _get_pivot_values(result, "category")
+    assert pv["A"] == {"x": 1, "y": None}
+    assert pv["B"] == {"x": None, "y": 2}
+    assert pv["C"] == {"x": None, "y": 3}
@@ -0,0 +1,85 @@
+import pytest
+
+from rayforce import errors
+from rayforce.types import Column, Table, Vector
+from rayforce.types.scalars import F64, I64, Symbol
+from tests.helpers.assertions import assert_column_values, assert_table_shape
+
+
+@pytest.fixture
+def latencies():
+    return Table(
+        {
+            "venue": Vector(items=["x", "y", "x", "y", "x", "x", "y"], ray_type=Symbol),
+            "ms": Vector(items=[4.0, 10.0, 1.0, 30.0, 3.0, 2.0, 20.0], ray_type=F64),
+            "qty": Vector(items=[1, 2, 3, 4, 5, 6, 7], ray_type=I64),
+        }
+    )
+
+
+def test_quantile(latencies):
+    result = latencies.select(p50=Column("ms").quantile(0.5)).execute()
+
+    assert_table_shape(result, rows=1, cols=1)
+    assert result["p50"].to_list() == [4.0]
+
+
+def test_quantiles_by_group(latencies):
+    result = (
+        latencies.select(
+            p50=Column("ms").quantile(0.5),
+            p95=Column("ms").quantile(0.95),
+            qty=Column("qty").quantile(0.25),
+        )
+        .by("venue")
+        .order_by("venue")
+        .execute()
+    )
+
+    assert_column_values(result, "venue", ["x", "y"])
+    # Linear interpolation between the nearest values, as numpy does.
+    assert result["p50"].to_list() == pytest.approx([2.5, 20.0])
+    assert result["p95"].to_list() == pytest.approx([3.85, 29.0])
+    assert result["qty"].to_list() == pytest.approx([2.5, 3.0])
+
+
+def test_quantile_list_by_group(latencies):
+    result = (
+        latencies.select(ps=Column("ms").quantile([0.5, 0.0, 1.0]))
+        .by("venue")
+        .order_by("venue")
+        .execute()
+    )
+
+    assert [v.to_list() for v in result["ps"]] == [[2.5, 1.0, 4.0], [20.0, 10.0, 30.0]]
+
+
+def test_histogram_by_group(latencies):
+    result = (
+        latencies.select(
+            even=Column("ms").histogram(2), edges=Column("ms").histogram([0.0, 5.0, 20.0])
+        )
+        .by("venue")
+        .order_by("venue")
+        .execute()
+    )
+
+    # Two equal-width bins over [1, 30], shared by both groups.
+    assert [v.to_list() for v in result["even"]] == [[4, 0], [1, 2]]
+    # The last edge is inclusive, values outside the edges are not counted.
+    assert [v.to_list() for v in result["edges"]] == [[4, 0], [0, 2]]
+
+
+def test_quantile_rejects_bad_arguments(latencies):
+    with pytest.raises(errors.RayforceValueError):
+        Column("ms").quantile(1.5)
+    with pytest.raises(errors.RayforceValueError):
+        Column("ms").quantile([])
+    with pytest.raises(errors.RayforceValueError):
+        Column("ms").histogram(0)
+    with pytest.raises(errors.RayforceValueError):
+        Column("ms").histogram([1.0, 1.0])
+    with pytest.raises(errors.RayforceTypeError):
+        latencies.select(p=Column("venue").quantile(0.5)).execute()
+    with pytest.raises(errors.RayforceTypeError):
+        latencies.select(ps=Column("ms").quantile([0.5, 1.0]) + 1).by("venue").execute()
@@ -1,7 +1,12 @@
 import datetime as dt
+import gc
+import weakref
 from zoneinfo import ZoneInfo
 
-from rayforce import F64, I64, Column, Symbol, Table, Vector
+import pytest
+
+from rayforce import F64, I64, Column, Param, Symbol, Table, Vector, errors
+from rayforce.utils import eval_str
 from tests.helpers.assertions import (
     assert_column_values,
     assert_columns,
@@ -471,3 +476,102 @@ def test_select_star_with_expression():
 
     assert_columns(result, ["price", "qty", "total"])
     assert_column_values(result, "total", [20, 60, 30])
+
+
+def test_prepared_select_rebinds_params(employees_table):
+    name, _ = employees_table
+    query = (
+        Table(name)
+        .select("id", "name")
+        .where(Column("dept") == Param("dept"))
+        .where(Column("age") > Param("min_age"))
+    )
+    prepared = query.prepare()
+
+    eng = prepared.execute(dept="eng", min_age=30)
+    assert_column_values(eng, "name", ["bob", "dana"])
+
+    marketing = prepared.execute(dept="marketing", min_age=30)
+    assert_column_values(marketing, "name", ["charlie"])
+
+
+def test_prepared_select_unbinds_params_after_execute(employees_table):
+    name, _ = employees_table
+    prepared = Table(name).select("name").where(Column("age") >= Param("age")).prepare()
+
+    assert len(prepared.execute(age=30)) > 0
+
+    # The parameter global exists only while the plan is evaluated.
+    with pytest.raises(errors.RayforceError, match="__param_age"):
+        eval_str("__param_age")
+
+
+def test_prepare_reuses_cached_plan(employees_table):
+    name, _ = employees_table
+
+    def build():
+        return Table(name).select("name").where(Column("age") >= Param("age"))
+
+    first = build().prepare()
+    assert build().prepare() is first
+    assert Table(name).select("id").where(Column("age") >= Param("age")).prepare() is not first
+
+
+def test_prepare_caches_plans_on_in_memory_tables():
+    def build(table):
+        return table.select("x").where(Column("x") >= Param("lo"))
+
+    table = Table({"x": Vector(items=[1, 2, 3], ray_type=I64)})
+    first = build(table).prepare()
+    assert build(table).prepare() is first
+    assert_column_values(first.execute(lo=2), "x", [2, 3])
+
+    other = Table({"x": Vector(items=[5, 6], ray_type=I64)})
+    assert build(other).prepare() is not first
+
+    # The plans live on the table, so they do not keep it alive.
+    ref = weakref.ref(table)
+    del table, first
+    gc.collect()
+    assert ref() is None
+
+
+def test_execute_with_unbound_param_raises(employees_table):
+    name, _ = employees_table
+    query = Table(name).select("name").where(Column("age") >= Param("age"))
+
+    with pytest.raises(errors.RayforceValueError, match="age"):
+        query.execute()
+    with pytest.raises(errors.RayforceValueError):
+        query.profile()
+
+
+def test_prepared_select_rejects_mismatched_params(employees_table):
+    name, _ = employees_table
+    prepared = Table(name).select("name").where(Column("age") >= Param("age")).prepare()
+
+    with pytest.raises(errors.RayforceQueryCompilationError):
+        prepared.execute()
+    with pytest.raises(errors.RayforceQueryCompilationError):
+        prepared.execute(age=30, dept="eng")
+
+
+def test_select_explain_shows_compiled_form(employees_table):
+    name, _ = employees_table
+    plan = Table(name).select("name").where(Column("age") > 30).explain()
+
+    assert "select" in plan
+    assert "age" in plan
+
+
+def test_select_profile_reports_phases(employees_table):
+    name, _ = employees_table
+    query = Table(name).select("name", "age").where(Column("age") > 30)
+
+    profile = query.execute(profile=True)
+
+    assert profile.rows == 3
+    assert profile.nbytes > 0
+    assert profile.compile >= 0 and profile.eval > 0 and profile.wrap >= 0
+    assert profile.total >= profile.eval
+    assert_column_values(profile.result, "name", ["bob", "charlie", "dana"])
@@ -1,9 +1,10 @@
 import numpy as np
 import pytest
 
-from rayforce import errors
+from rayforce import errors, eval_str
+from rayforce.ffi import FFI
 from rayforce.types import Column, Dict, Table, Vector
-from rayforce.types.scalars import B8, F64, I64, Date, Symbol, Time, Timestamp
+from rayforce.types.scalars import B8, F64, I32, I64, Date, String, Symbol, Time, Timestamp
 from tests.helpers.assertions import (
     assert_column_values,
     assert_contains_columns,
@@ -106,6 +107,102 @@ def test_set_csv_with_custom_separator(tmp_path):
     assert ";" in lines[0]  # Header should contain semicolon
 
 
+def test_set_csv_custom_separator_quotes_embedded_values(tmp_path):
+    table = Table(
+        {
+            "name": Vector(items=["smith, j", 'say "hi"', "plain"], ray_type=Symbol),
+            "score": Vector(items=[1.5, 2.25, 3.0], ray_type=F64),
+        }
+    )
+
+    csv_path = tmp_path / "quoted.csv"
+    table.set_csv(str(csv_path), separator="|")
+
+    lines = csv_path.read_text().splitlines()
+    assert lines[0] == "name|score"
+    assert lines[1] == "smith, j|1.5"
+    assert lines[2] == '"say ""hi"""|2.25'
+    assert lines[3] == "plain|3"
+
+
+def test_set_csv_null_value(tmp_path):
+    table = Table(
+        {
+            "id": Vector(items=[1, 2, 3], ray_type=I64),
+            "px": Vector(items=[1.5, None, 3.5], ray_type=F64),
+        }
+    )
+
+    csv_path = tmp_path / "nulls.csv"
+    table.set_csv(str(csv_path), null_value="NA")
+
+    assert csv_path.read_text().splitlines() == ["id,px", "1,1.5", "2,NA", "3,3.5"]
+
+
+def test_set_csv_gzip_round_trip(tmp_path):
+    import gzip
+
+    table = Table(
+        {
+            "sym": Vector(items=["a", "b"] * 50, ray_type=Symbol),
+            "qty": Vector(items=list(range(100)), ray_type=I64),
+        }
+    )
+
+    gz_path = tmp_path / "out.csv.gz"
+    table.set_csv(str(gz_path))
+
+    with gzip.open(gz_path, "rt") as fh:
+        lines = fh.read().splitlines()
+    assert lines[0] == "sym,qty"
+    assert len(lines) == 101
+    assert lines[-1] == "b,99"
+
+
+def test_set_csv_rejects_multichar_separator(tmp_path):
+    table = Table({"a": Vector(items=[1], ray_type=I64)})
+    with pytest.raises(errors.RayforceValueError):
+        table.set_csv(str(tmp_path / "bad.csv"), separator="||")
+
+
+def test_from_csv_gzip(tmp_path):
+    import gzip
+
+    csv_path = tmp_path / "input.csv.gz"
+    with gzip.open(csv_path, "wt") as fh:
+        fh.write("sym,qty\nAAPL,10\nMSFT,20\n")
+
+    table = Table.from_csv([Symbol, I64], str(csv_path))
+
+    assert_table_shape(table, rows=2, cols=2)
+    assert_column_values(table, "sym", ["AAPL", "MSFT"])
+    assert_column_values(table, "qty", [10, 20])
+
+
+def test_from_csv_gzip_parses_in_record_pieces(tmp_path, monkeypatch):
+    import gzip
+
+    lines = ["id,note"] + [f'{i},"line {i}\nstill ""{i}"", here"' for i in range(50)]
+    data = "\n".join(lines) + "\n"
+    (tmp_path / "input.csv").write_text(data)
+    with gzip.open(tmp_path / "input.csv.gz", "wt") as fh:
+        fh.write(data)
+    expected = Table.from_csv([I64, String], str(tmp_path / "input.csv"))
+
+    # Pieces far smaller than a record: no cut may land inside a quoted field.
+    monkeypatch.setattr("rayforce.types.table._CSV_CHUNK_BYTES", 16)
+    table = Table.from_csv([I64, String], str(tmp_path / "input.csv.gz"))
+
+    assert_table_shape(table, rows=50, cols=2)
+    assert_column_values(table, "id", list(range(50)))
+    assert [v.value for v in table["note"]] == [v.value for v in expected["note"]]
+
+
+def test_from_csv_unknown_compression_raises(tmp_path):
+    with pytest.raises(errors.RayforceValueError):
+        Table.from_csv([I64], str(tmp_path / "x.csv"), compression="brotli")
+
+
 def test_set_splayed_and_from_splayed(tmp_path):
     table = Table(
         {
@@ -137,6 +234,275 @@ def test_set_splayed_and_from_splayed(tmp_path):
     assert_column_values(result, "status", ["active", "inactive", "active", "active"])
 
 
+def test_append_splayed(tmp_path):
+    splayed_dir = tmp_path / "intraday"
+    sym_path = str(tmp_path / "sym")
+
+    first = Table(
+        {
+            "sym": Vector(items=["A", "B"], ray_type=Symbol),
+            "qty": Vector(items=[1, 2], ray_type=I64),
+        }
+    )
+    second = Table(
+        {
+            "sym": Vector(items=["C", "A"], ray_type=Symbol),
+            "qty": Vector(items=[3, 4], ray_type=I64),
+        }
+    )
+
+    first.append_splayed(f"{splayed_dir}/", sym_path)
+    second.append_splayed(f"{splayed_dir}/", sym_path)
+
+    assert not (splayed_dir / ".append").exists()
+    result = Table.from_splayed(f"{splayed_dir}/", sym_path).select("*").execute()
+    assert_column_values(result, "sym", ["A", "B", "C", "A"])
+    assert_column_values(result, "qty", [1, 2, 3, 4])
+
+
+def test_append_splayed_extends_column_files_in_place(tmp_path):
+    splayed_dir = tmp_path / "intraday"
+    sym_path = str(tmp_path / "sym")
+    Table(
+        {
+            "sym": Vector(items=["A", "B"], ray_type=Symbol),
+            "qty": Vector(items=[1, 2], ray_type=I64),
+        }
+    ).append_splayed(f"{splayed_dir}/", sym_path)
+    qty_file = splayed_dir / "qty"
+    before, inode = qty_file.read_bytes(), qty_file.stat().st_ino
+
+    Table(
+        {
+            "sym": Vector(items=["C", "A"], ray_type=Symbol),
+            "qty": Vector(items=[3, 4], ray_type=I64),
+        }
+    ).append_splayed(f"{splayed_dir}/", sym_path)
+
+    # Same file, existing rows untouched past the header: only the tail grew.
+    after = qty_file.read_bytes()
+    assert qty_file.stat().st_ino == inode
+    assert after[32 : len(before)] == before[32:]
+    assert after[len(before) :] == np.array([3, 4], dtype=np.int64).tobytes()
+    result = Table.from_splayed(f"{splayed_dir}/", sym_path).select("*").execute()
+    assert_column_values(result, "sym", ["A", "B", "C", "A"])
+    assert_column_values(result, "qty", [1, 2, 3, 4])
+
+
+def _interrupt_append(splayed_dir, sym_path, monkeypatch):
+    Table(
+        {
+            "sym": Vector(items=["A", "B"], ray_type=Symbol),
+            "qty": Vector(items=[1, 2], ray_type=I64),
+        }
+    ).append_splayed(f"{splayed_dir}/", str(sym_path))
+
+    def crash(*_args):
+        raise OSError("crash")
+
+    # The zone map is rewritten after the columns and symfile, just before
+    # the journal is dropped.
+    with monkeypatch.context() as patch:
+        patch.setattr("rayforce.types.table._merge_stats", crash)
+        with pytest.raises(OSError, match="crash"):
+            Table(
+                {
+                    "sym": Vector(items=["C"], ray_type=Symbol),
+                    "qty": Vector(items=[3], ray_type=I64),
+                }
+            ).append_splayed(f"{splayed_dir}/", str(sym_path))
+    assert (splayed_dir / ".append").exists()
+
+
+def test_from_splayed_reads_past_an_interrupted_append(tmp_path, monkeypatch):
+    splayed_dir, sym_path = tmp_path / "intraday", tmp_path / "sym"
+    _interrupt_append(splayed_dir, sym_path, monkeypatch)
+    qty_bytes = (splayed_dir / "qty").read_bytes()
+
+    result = Table.from_splayed(f"{splayed_dir}/", str(sym_path)).select("*").execute()
+    projected = Table.from_splayed(f"{splayed_dir}/", str(sym_path), columns=["qty"])
+
+    # Loads see the rows before the append and leave the journal and the
+    # files for the next writer to roll back.
+    assert_column_values(result, "sym", ["A", "B"])
+    assert_column_values(result, "qty", [1, 2])
+    assert_column_values(projected.select("*").execute(), "qty", [1, 2])
+    assert (splayed_dir / ".append").exists()
+    assert (splayed_dir / "qty").read_bytes() == qty_bytes
+
+
+def test_append_splayed_rolls_back_an_interrupted_append(tmp_path, monkeypatch):
+    splayed_dir, sym_path = tmp_path / "intraday", tmp_path / "sym"
+    _interrupt_append(splayed_dir, sym_path, monkeypatch)
+
+    Table(
+        {
+            "sym": Vector(items=["D"], ray_type=Symbol),
+            "qty": Vector(items=[4], ray_type=I64),
+        }
+    ).append_splayed(f"{splayed_dir}/", str(sym_path))
+
+    assert not (splayed_dir / ".append").exists()
+    result = Table.from_splayed(f"{splayed_dir}/", str(sym_path)).select("*").execute()
+    assert_column_values(result, "sym", ["A", "B", "D"])
+    assert_column_values(result, "qty", [1, 2, 4])
+    # A committed symbol stays in the shared symfile, after the old ones.
+    records = [len(sym).to_bytes(4, "little") + sym for sym in (b"", b"A", b"B", b"C", b"D")]
+    assert sym_path.read_bytes()[12:] == b"".join(records)
+
+
+@pytest.mark.parametrize("lock", ["intraday/.append.lk", "sym.lk"])
+def test_append_splayed_waits_for_locks(tmp_path, lock):
+    import fcntl
+    import threading
+    import time
+
+    splayed_dir, sym_path = tmp_path / "intraday", tmp_path / "sym"
+    Table({"sym": Vector(items=["A"], ray_type=Symbol)}).append_splayed(
+        f"{splayed_dir}/", str(sym_path)
+    )
+    held = threading.Event()
+
+    def hold():
+        # The same advisory lock the core takes on `<symfile>.lk`.
+        with open(tmp_path / lock, "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            held.set()
+            time.sleep(0.3)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+    start = time.monotonic()
+    Table({"sym": Vector(items=["B"], ray_type=Symbol)}).append_splayed(
+        f"{splayed_dir}/", str(sym_path)
+    )
+    waited = time.monotonic() - start
+    thread.join()
+
+    assert waited >= 0.2
+    result = Table.from_splayed(f"{splayed_dir}/", str(sym_path)).select("*").execute()
+    assert_column_values(result, "sym", ["A", "B"])
+
+
+def test_append_splayed_refuses_an_unexpected_column_layout(tmp_path):
+    splayed_dir = tmp_path / "t"
+    Table({"qty": Vector(items=[1, 2], ray_type=I64)}).append_splayed(f"{splayed_dir}/")
+    with open(splayed_dir / "qty", "ab") as fh:
+        fh.write(b"\0")
+
+    with pytest.raises(errors.RayforceValueError, match="qty"):
+        Table({"qty": Vector(items=[3], ray_type=I64)}).append_splayed(f"{splayed_dir}/")
+    assert not (splayed_dir / ".append").exists()
+
+
+def test_append_splayed_schema_mismatch_raises(tmp_path):
+    splayed_dir = tmp_path / "t"
+    Table({"qty": Vector(items=[1], ray_type=I64)}).append_splayed(f"{splayed_dir}/")
+
+    with pytest.raises(errors.RayforceValueError):
+        Table({"other": Vector(items=[2], ray_type=I64)}).append_splayed(f"{splayed_dir}/")
+
+
+def test_from_splayed_column_projection(tmp_path):
+    table = Table(
+        {
+            "a": Vector(items=[1, 2], ray_type=I64),
+            "b": Vector(items=["x", "y"], ray_type=Symbol),
+            "c": Vector(items=[1.5, 2.5], ray_type=F64),
+        }
+    )
+    table.set_splayed(f"{tmp_path}/wide/")
+
+    projected = Table.from_splayed(f"{tmp_path}/wide/", columns=["c", "a"])
+    result = projected.select("*").execute()
+    assert [c.value for c in result.columns()] == ["c", "a"]
+    assert_column_values(result, "c", [1.5, 2.5])
+
+    with pytest.raises(errors.RayforceConversionError):
+        Table.from_splayed(f"{tmp_path}/wide/", columns=["missing"])
+
+
+def test_from_splayed_projection_reads_only_listed_columns(tmp_path):
+    table = Table(
+        {
+            "a": Vector(items=[1, 2], ray_type=I64),
+            "b": Vector(items=["x", "y"], ray_type=Symbol),
+            "c": Vector(items=[1.5, 2.5], ray_type=F64),
+        }
+    )
+    table.set_splayed(f"{tmp_path}/plain/")
+    table.set_splayed(f"{tmp_path}/packed/", compression="gzip")
+    # A column that is not asked for is never opened.
+    (tmp_path / "plain" / "b").unlink()
+    next((tmp_path / "packed").glob("b.*")).unlink()
+
+    for name in ("plain", "packed"):
+        result = Table.from_splayed(f"{tmp_path}/{name}/", columns=["c", "a"]).select("*")
+        result = result.execute()
+        assert [c.value for c in result.columns()] == ["c", "a"]
+        assert_column_values(result, "a", [1, 2])
+
+
+def test_set_splayed_compressed_round_trip(tmp_path):
+    table = Table(
+        {
+            "category": Vector(items=["A", "B", "A"], ray_type=Symbol),
+            "amount": Vector(items=[100, 200, 150], ray_type=I64),
+        }
+    )
+
+    splayed_dir = tmp_path / "compressed"
+    table.set_splayed(f"{splayed_dir}/", compression="gzip")
+
+    assert (splayed_dir / ".d").exists()
+    assert (splayed_dir / "amount.gz").exists()
+    assert not (splayed_dir / "amount").exists()
+
+    result = Table.from_splayed(f"{splayed_dir}/").select("*").execute()
+    assert_table_shape(result, rows=3, cols=2)
+    assert_column_values(result, "category", ["A", "B", "A"])
+    assert_column_values(result, "amount", [100, 200, 150])
+
+
+def test_from_splayed_inflates_only_compressed_columns(tmp_path, monkeypatch):
+    from rayforce.utils import compression
+
+    splayed_dir = tmp_path / "mixed"
+    Table(
+        {
+            "category": Vector(items=["A", "B"], ray_type=Symbol),
+            "amount": Vector(items=[100, 200], ray_type=I64),
+        }
+    ).set_splayed(f"{splayed_dir}/")
+    compression.compress_file(splayed_dir / "amount", "gzip")
+    inflated = []
+    decompress = compression.decompress_file
+    monkeypatch.setattr(
+        compression,
+        "decompress_file",
+        lambda src, *args: inflated.append(src) or decompress(src, *args),
+    )
+
+    result = Table.from_splayed(f"{splayed_dir}/").select("*").execute()
+
+    assert inflated == [str(splayed_dir / "amount.gz")]
+    assert_column_values(result, "category", ["A", "B"])
+    assert_column_values(result, "amount", [100, 200])
+
+
+def test_set_splayed_plain_over_compressed(tmp_path):
+    splayed_dir = tmp_path / "rewritten"
+    Table({"amount": Vector(items=[1, 2], ray_type=I64)}).set_splayed(
+        f"{splayed_dir}/", compression="gzip"
+    )
+    Table({"amount": Vector(items=[7, 8, 9], ray_type=I64)}).set_splayed(f"{splayed_dir}/")
+
+    assert not (splayed_dir / "amount.gz").exists()
+    result = Table.from_splayed(f"{splayed_dir}/").select("*").execute()
+    assert_column_values(result, "amount", [7, 8, 9])
+
+
 def test_set_splayed_and_from_parted(tmp_path):
     table = Table(
         {
@@ -170,6 +536,209 @@ def test_set_splayed_and_from_parted(tmp_path):
     assert_column_values(result, "status", ["active", "inactive", "active", "active"] * 3)
 
 
+def test_to_parted_round_trip(tmp_path):
+    import datetime as dt
+
+    days = [dt.date(2024, 1, 2), dt.date(2024, 1, 1), dt.date(2024, 1, 2), dt.date(2024, 1, 1)]
+    table = Table(
+        {
+            "date": Vector(items=days, ray_type=Date),
+            "sym": Vector(items=["A", "B", "C", "D"], ray_type=Symbol),
+            "qty": Vector(items=[1, 2, 3, 4], ray_type=I64),
+        }
+    )
+
+    written = table.to_parted(str(tmp_path), partition_by="date", name="trades")
+
+    assert written == ["2024.01.01", "2024.01.02"]
+    assert (tmp_path / "sym").exists()
+    assert (tmp_path / "2024.01.01" / "trades" / ".d").exists()
+    assert not (tmp_path / "2024.01.01" / "trades" / "date").exists()
+
+    result = Table.from_parted(f"{tmp_path}/", "trades").select("*").execute()
+    assert_table_shape(result, rows=4, cols=3)
+    assert_column_values(result, "sym", ["B", "D", "A", "C"])
+    assert_column_values(result, "qty", [2, 4, 1, 3])
+
+
+def test_to_parted_int_partitions(tmp_path):
+    table = Table(
+        {
+            "bucket": Vector(items=[10, 2, 10], ray_type=I32),
+            "qty": Vector(items=[1, 2, 3], ray_type=I64),
+        }
+    )
+
+    assert table.to_parted(str(tmp_path), partition_by="bucket", name="t") == ["2", "10"]
+    result = Table.from_parted(f"{tmp_path}/", "t").select("*").execute()
+    assert result.dtypes["bucket"] == "I32"
+    assert_column_values(result, "bucket", [2, 10, 10])
+    assert_column_values(result, "qty", [2, 1, 3])
+
+
+def test_to_parted_rejects_non_key_column(tmp_path):
+    table = Table(
+        {
+            "sym": Vector(items=["A"], ray_type=Symbol),
+            "qty": Vector(items=[1], ray_type=I64),
+        }
+    )
+    with pytest.raises(errors.RayforceTypeError):
+        table.to_parted(str(tmp_path), partition_by="sym")
+
+
+def _write_daily_partitions(root):
+    import datetime as dt
+
+    days = [dt.date(2024, 1, d) for d in (1, 1, 2, 2, 3, 3)]
+    Table(
+        {
+            "date": Vector(items=days, ray_type=Date),
+            "sym": Vector(items=["A", "B", "A", "B", "A", "B"], ray_type=Symbol),
+            "qty": Vector(items=[1, 2, 3, 4, 5, 6], ray_type=I64),
+        }
+    ).to_parted(str(root), partition_by="date", name="trades")
+
+
+def test_from_parted_lazy_prunes_partitions(tmp_path):
+    import datetime as dt
+
+    from rayforce.types.table import PartedTable
+
+    _write_daily_partitions(tmp_path)
+    lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+    assert isinstance(lazy, PartedTable)
+
+    day = dt.date(2024, 1, 2)
+    assert lazy.prune([Column("date") == day]) == [1]
+    assert lazy.prune([Column("date") > day]) == [2]
+    assert lazy.prune([Column("date").isin([dt.date(2024, 1, 1), dt.date(2024, 1, 3)])]) == [0, 2]
+    # Zone maps also rule out the first day, whose quantities are 1 and 2.
+    assert lazy.prune([Column("qty") > 2]) == [1, 2]
+
+    result = lazy.select("sym", "qty").where(Column("date") == day).execute()
+    assert_table_shape(result, rows=2, cols=2)
+    assert_column_values(result, "qty", [3, 4])
+
+
+def test_from_parted_lazy_merges_partial_aggregates(tmp_path):
+    import datetime as dt
+
+    _write_daily_partitions(tmp_path)
+    lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+
+    result = (
+        lazy.select(total=Column("qty").sum(), n=Column("qty").count(), hi=Column("qty").max())
+        .where(Column("date") >= dt.date(2024, 1, 2))
+        .by("sym")
+        .execute()
+    )
+    d = result.to_dict()
+    rows = dict(zip(d["sym"], zip(d["total"], d["n"], d["hi"], strict=True), strict=True))
+    assert rows == {"A": (8, 2, 5), "B": (10, 2, 6)}
+
+
+def test_from_parted_lazy_merges_sketches(tmp_path):
+    _write_daily_partitions(tmp_path)
+    lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+
+    result = (
+        lazy.select(days=Column("date").approx_distinct(), mid=Column("qty").approx_quantile(0.5))
+        .by("sym")
+        .order_by("sym")
+        .execute()
+    )
+    assert_column_values(result, "sym", ["A", "B"])
+    assert_column_values(result, "days", [3, 3])
+    assert result["mid"].to_list() == pytest.approx([3.0, 4.0], rel=0.01)
+
+
+def test_from_parted_column_projection(tmp_path):
+    import datetime as dt
+
+    _write_daily_partitions(tmp_path)
+
+    eager = Table.from_parted(f"{tmp_path}/", "trades", columns=["date", "qty"])
+    result = eager.select("*").execute()
+    assert_contains_columns(result, ["date", "qty"])
+    assert_table_shape(result, rows=6, cols=2)
+
+    dates = Table.from_parted(f"{tmp_path}/", "trades", columns=["date"]).select("*").execute()
+    assert_table_shape(dates, rows=6, cols=1)
+
+    lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+    top = (
+        lazy.select(hi=Column("qty").max())
+        .where(Column("date") == dt.date(2024, 1, 3))
+        .order_by("hi")
+        .execute()
+    )
+    assert_column_values(top, "hi", [6])
+
+
+def test_to_parted_writes_zone_maps(tmp_path):
+    import json
+
+    _write_daily_partitions(tmp_path)
+
+    stats = json.loads((tmp_path / "2024.01.02" / "trades" / ".stats").read_text())
+    assert stats["rows"] == 2
+    assert stats["columns"]["qty"]["min"] == 3
+    assert stats["columns"]["qty"]["max"] == 4
+    assert stats["columns"]["qty"]["nulls"] == 0
+    assert stats["columns"]["sym"]["distinct"] == 2
+
+
+def test_from_parted_lazy_prunes_by_zone_map(tmp_path):
+    _write_daily_partitions(tmp_path)
+    lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+
+    assert lazy.prune([Column("qty") > 4]) == [2]
+    assert lazy.prune([Column("qty") < 3]) == [0]
+    assert lazy.prune([Column("qty").isin([2, 6])]) == [0, 2]
+    assert lazy.prune([(Column("qty") == 3) | (Column("qty") == 6)]) == [1, 2]
+    assert lazy.prune([Column("qty") > 100]) == []
+
+    result = lazy.select("qty").where(Column("qty") >= 5).execute()
+    assert_column_values(result, "qty", [5, 6])
+
+
+def test_lazy_pruning_ignores_stale_zone_maps(tmp_path):
+    import datetime as dt
+
+    _write_daily_partitions(tmp_path)
+    part = tmp_path / "2024.01.02" / "trades"
+    stale = (part / ".stats").read_text()
+    rewritten = Table(
+        {
+            "sym": Vector(items=["A", "B"], ray_type=Symbol),
+            "qty": Vector(items=[500, 4], ray_type=I64),
+        }
+    )
+    rewritten.set_splayed(f"{part}/", str(tmp_path / "sym"), stats=False)
+    assert not (part / ".stats").exists()
+
+    def count_over_100():
+        lazy = Table.from_parted(f"{tmp_path}/", "trades", lazy=True)
+        return len(lazy.select("qty").where(Column("qty") > 100).execute())
+
+    eager = Table.from_parted(f"{tmp_path}/", "trades").select("qty")
+    assert len(eager.where(Column("qty") > 100).execute()) == count_over_100() == 1
+
+    # A zone map whose row count no longer matches the columns is not used.
+    Table(
+        {
+            "sym": Vector(items=["A", "B", "A"], ray_type=Symbol),
+            "qty": Vector(items=[500, 4, 3], ray_type=I64),
+        }
+    ).set_splayed(f"{part}/", str(tmp_path / "sym"), stats=False)
+    (part / ".stats").write_text(stale)
+    assert count_over_100() == 1
+    assert Table.from_parted(f"{tmp_path}/", "trades", lazy=True).prune(
+        [Column("date") == dt.date(2024, 1, 2), Column("qty") > 100]
+    ) == [1]
+
+
 def test_splayed_table_destructive_operations_raise_error(tmp_path):
     table = Table(
         {
@@ -229,6 +798,37 @@ def test_parted_table_destructive_operations_raise_error(tmp_path):
         loaded_table.upsert(id="001", name="alice_updated", age=30, key_columns=1)
 
 
+def test_dump_and_load_round_trip(tmp_path):
+    import datetime as dt
+
+    table = Table(
+        {
+            "sym": Vector(items=["A", "B", "C"], ray_type=Symbol),
+            "px": Vector(items=[1.5, None, 3.5], ray_type=F64),
+            "day": Vector(items=[dt.date(2024, 1, d) for d in (1, 2, 3)], ray_type=Date),
+        }
+    )
+
+    path = tmp_path / "snap.bin"
+    written = table.dump(str(path))
+
+    assert written == path.stat().st_size
+    assert not (tmp_path / "snap.bin.tmp").exists()
+    loaded = Table.load(str(path))
+    assert loaded.dtypes == table.dtypes
+    assert_column_values(loaded, "sym", ["A", "B", "C"])
+    assert loaded.to_dict()["px"][0] == 1.5
+
+
+def test_load_non_table_snapshot_raises(tmp_path):
+    from rayforce.ffi import FFI
+
+    path = tmp_path / "vec.bin"
+    FFI.dump_obj(Vector(items=[1, 2], ray_type=I64).ptr, str(path))
+    with pytest.raises(errors.RayforceTypeError):
+        Table.load(str(path))
+
+
 def test_concat_two_tables():
     table1 = Table(
         {
@@ -285,6 +885,28 @@ def test_concat_multiple_tables():
     assert_column_values(result, "value", [10, 20, 30])
 
 
+def test_concat_many_tables_preserves_order_and_types():
+    import datetime as dt
+
+    tables = [
+        Table(
+            {
+                "day": Vector(items=[dt.date(2024, 1, i + 1)], ray_type=Date),
+                "sym": Vector(items=[f"s{i}"], ray_type=Symbol),
+                "px": Vector(items=[float(i)], ray_type=F64),
+            }
+        )
+        for i in range(6)
+    ]
+
+    result = tables[0].concat(*tables[1:])
+
+    assert_table_shape(result, rows=6, cols=3)
+    assert result.dtypes == tables[0].dtypes
+    assert_column_values(result, "sym", [f"s{i}" for i in range(6)])
+    assert_column_values(result, "px", [float(i) for i in range(6)])
+
+
 def test_concat_empty_others():
     table = Table(
         {
@@ -423,6 +1045,49 @@ def test_len():
     assert len(table) == 5
 
 
+def test_metadata_tracks_mutations_through_reference(make_table):
+    name, _ = make_table(
+        {
+            "id": Vector(items=["001", "002"], ray_type=Symbol),
+            "age": Vector(items=[29, 34], ray_type=I64),
+        }
+    )
+    table = Table(name)
+    assert table.shape() == (2, 2)
+    assert table.dtypes == {"id": "SYMBOL", "age": "I64"}
+
+    table.insert(id="003", age=41).execute()
+    assert len(table) == 3
+    assert table.shape() == (3, 2)
+
+    table.update(age=0).where(Column("id") == "001").execute()
+    assert table.shape() == (3, 2)
+    assert table.columns() == [Symbol("id"), Symbol("age")]
+
+    Table({"x": Vector(items=[1], ray_type=I64)}).save(name)
+    assert Table(name).shape() == (1, 1)
+
+
+def test_metadata_tracks_rebinding_outside_the_table_api(make_table):
+    name, _ = make_table({"age": Vector(items=[29, 34], ray_type=I64)})
+    table = Table(name)
+    assert table.dtypes == {"age": "I64"}
+
+    eval_str(f"(set {name} (table [x y] (list [1 2 3] [4 5 6])))")
+    assert table.shape() == (3, 2)
+    assert table.dtypes == {"x": "I64", "y": "I64"}
+
+    FFI.binary_set(FFI.init_symbol(name), Table({"z": Vector(items=[1], ray_type=I64)}).ptr)
+    assert table.columns() == [Symbol("z")]
+    assert table.shape() == (1, 1)
+
+
+def test_dtypes_returns_a_copy():
+    table = Table({"age": Vector(items=[29, 34], ray_type=I64)})
+    table.dtypes["age"] = "F64"
+    assert table.dtypes == {"age": "I64"}
+
+
 def test_getitem_single_column():
     table = Table(
         {
@@ -989,6 +1654,35 @@ def test_cast_unknown_column_raises():
         table.cast("unknown", F64)
 
 
+def test_cast_mapping_casts_several_columns():
+    table = Table(
+        {
+            "id": Vector(items=["001", "002", "003"], ray_type=Symbol),
+            "age": Vector(items=[29, 34, 41], ray_type=I64),
+            "price": Vector(items=[10.5, 20.7, 30.9], ray_type=F64),
+        }
+    )
+
+    result = table.cast({"age": F64, "price": I64})
+
+    assert result.dtypes == {"id": "SYMBOL", "age": "F64", "price": "I64"}
+    assert_column_values(result, "id", ["001", "002", "003"])
+    assert_column_values(result, "age", [29.0, 34.0, 41.0])
+    assert_column_values(result, "price", [10, 20, 30])
+    assert table.dtypes["age"] == "I64"
+
+
+def test_cast_mapping_validates_before_casting():
+    table = Table({"age": Vector(items=[29, 34], ray_type=I64)})
+
+    with pytest.raises(errors.RayforceConversionError, match="Column not found"):
+        table.cast({"age": F64, "unknown": F64})
+    with pytest.raises(errors.RayforceConversionError, match="to_type must be omitted"):
+        table.cast({"age": F64}, F64)
+    with pytest.raises(errors.RayforceConversionError, match="needs a target type"):
+        table.cast("age")
+
+
 # ---------------------------------------------------------------------------
 # concat edge cases
 # ---------------------------------------------------------------------------
@@ -1121,6 +1815,103 @@ def test_cast_with_incompatible_types():
 # ---------------------------------------------------------------------------
 
 
+def test_describe_full_statistics():
+    table = Table({"x": Vector.from_numpy(np.array([1.0, 2.0, 3.0, 4.0, np.nan]))})
+
+    stats = table.describe()["x"]
+
+    assert stats["count"] == 4
+    assert stats["null_count"] == 1
+    assert stats["mean"] == 2.5
+    assert stats["std"] == pytest.approx(np.std([1.0, 2.0, 3.0, 4.0], ddof=1))
+    assert stats["min"] == 1.0
+    assert stats["25%"] == 1.75
+    assert stats["50%"] == 2.5
+    assert stats["75%"] == 3.25
+    assert stats["max"] == 4.0
+
+
+def test_describe_temporal_columns():
+    import datetime as dt
+
+    table = Table(
+        {
+            "day": Vector(
+                items=[dt.date(2024, 1, 1), dt.date(2024, 1, 3), dt.date(2024, 1, 5)],
+                ray_type=Date,
+            ),
+        }
+    )
+
+    stats = table.describe(percentiles=[0.5])["day"]
+
+    assert stats["min"] == dt.date(2024, 1, 1)
+    assert stats["50%"] == dt.date(2024, 1, 3)
+    assert stats["max"] == dt.date(2024, 1, 5)
+    assert stats["std"] == dt.timedelta(days=2)
+
+
+def test_describe_sample():
+    table = Table(
+        {
+            "a": Vector(items=list(range(1000)), ray_type=I64),
+            "b": Vector(items=list(range(1000)), ray_type=I64),
+        }
+    )
+
+    stats = table.describe(sample=100, seed=7)
+
+    assert stats["a"]["count"] == 100
+    # Both columns are summarised over the same sampled rows.
+    assert stats["a"]["mean"] == stats["b"]["mean"]
+
+
+def test_sample():
+    table = Table(
+        {
+            "a": Vector(items=list(range(100)), ray_type=I64),
+            "b": Vector(items=[i * 2 for i in range(100)], ray_type=I64),
+        }
+    )
+
+    result = table.sample(10, seed=3)
+    rows = result["a"].to_list()
+
+    assert len(result) == 10
+    assert rows == sorted(set(rows))
+    assert result["b"].to_list() == [i * 2 for i in rows]
+    assert table.sample(10, seed=3)["a"].to_list() == rows
+    assert len(table.sample(frac=0.25)) == 25
+
+
+def test_sample_by_group():
+    table = Table(
+        {
+            "g": Vector(items=["x" if i % 4 else "y" for i in range(100)], ray_type=Symbol),
+            "a": Vector(items=list(range(100)), ray_type=I64),
+        }
+    )
+
+    per_group = table.sample(5, by="g", seed=1)["g"].to_list()
+    assert (per_group.count("x"), per_group.count("y")) == (5, 5)
+
+    stratified = table.sample(frac=0.2, by="g", seed=1)["g"].to_list()
+    assert (stratified.count("x"), stratified.count("y")) == (15, 5)
+
+
+def test_sample_rejects_bad_arguments():
+    table = Table({"a": Vector(items=[1, 2, 3], ray_type=I64)})
+
+    with pytest.raises(errors.RayforceValueError):
+        table.sample()
+    with pytest.raises(errors.RayforceValueError):
+        table.sample(1, frac=0.5)
+    with pytest.raises(errors.RayforceValueError):
+        table.sample(frac=2.0)
+    with pytest.raises(errors.RayforceValueError):
+        table.sample(1, by="missing")
+
+
 def test_describe_on_empty_table():
     """describe() on a table with zero rows returns an empty stats dict."""
     table = Table(
@@ -160,3 +160,17 @@ def test_update_all_rows_with_expression():
 
     assert_table_shape(result, rows=3, cols=2)
     assert_column_values(result, "salary", [200000, 240000, 180000])
+
+
+def test_update_profile(make_table):
+    name, _ = make_table(
+        {
+            "id": Vector(items=["001", "002"], ray_type=Symbol),
+            "age": Vector(items=[29, 34], ray_type=I64),
+        }
+    )
+
+    profile = Table(name).update(age=1).where(Column("id") == "001").profile()
+
+    assert profile.eval > 0
+    assert profile.total >= profile.eval
@@ -0,0 +1,138 @@
+import pytest
+
+from rayforce import errors
+from rayforce.types import Column, Table, Vector
+from rayforce.types.scalars import F64, I64, Symbol
+from tests.helpers.assertions import assert_column_values, assert_contains_columns
+
+
+@pytest.fixture
+def ticks():
+    return Table(
+        {
+            "sym": Vector(items=["a", "b", "a", "b", "a", "a"], ray_type=Symbol),
+            "px": Vector(items=[1.0, 10.0, 2.0, 20.0, 4.0, 8.0], ray_type=F64),
+            "qty": Vector(items=[1, 5, 2, 5, 3, 4], ray_type=I64),
+        }
+    )
+
+
+def test_cumulative(ticks):
+    result = ticks.select("qty", total=Column("qty").cumsum(), high=Column("px").cummax()).execute()
+
+    assert_contains_columns(result, ["qty", "total", "high"])
+    assert_column_values(result, "total", [1, 6, 8, 13, 16, 20])
+    assert_column_values(result, "high", [1.0, 10.0, 10.0, 20.0, 20.0, 20.0])
+
+
+def test_shift_and_diff(ticks):
+    result = ticks.select(
+        prev=Column("qty").shift(), next=Column("px").shift(-1), delta=Column("qty").diff()
+    ).execute()
+
+    assert result["prev"].to_list() == [None, 1, 5, 2, 5, 3]
+    assert result["next"].to_list() == [10.0, 2.0, 20.0, 4.0, 8.0, None]
+    assert result["delta"].to_list() == [None, 4, -3, 3, -2, 1]
+
+
+def test_rolling(ticks):
+    result = ticks.select(
+        avg=Column("px").rolling(2).mean(), hi=Column("qty").rolling(3).max()
+    ).execute()
+
+    assert result["avg"].to_list()[0] == None  # noqa: E711  (Rayforce Null == None is True)
+    assert result["avg"].to_list()[1:] == pytest.approx([5.5, 6.0, 11.0, 12.0, 6.0])
+    assert result["hi"].to_list() == [None, None, 5, 5, 5, 5]
+
+
+def test_window_per_group(ticks):
+    result = (
+        ticks.select(
+            total=Column("qty").cumsum(),
+            prev=Column("px").shift(),
+            avg=Column("px").rolling(2).mean(),
+        )
+        .by("sym")
+        .execute()
+    )
+
+    # Row-wise projections keep one row per input row, keys first.
+    assert_contains_columns(result, ["sym", "total", "prev", "avg"])
+    assert_column_values(result, "sym", ["a", "b", "a", "b", "a", "a"])
+    assert_column_values(result, "total", [1, 5, 3, 10, 6, 10])
+    assert result["prev"].to_list() == [None, None, 1.0, 10.0, 2.0, 4.0]
+    assert result["avg"].to_list()[2:] == pytest.approx([1.5, 15.0, 3.0, 6.0])
+
+
+def test_window_aggregated_per_group(ticks):
+    result = ticks.select(moves=Column("px").diff().sum()).by("sym").order_by("sym").execute()
+
+    assert_column_values(result, "sym", ["a", "b"])
+    assert_column_values(result, "moves", [7.0, 10.0])
+
+
+def test_window_after_where(ticks):
+    result = ticks.select(prev=Column("qty").shift()).where(Column("sym") == "a").execute()
+
+    assert result["prev"].to_list() == [None, 1, 2, 3]
+
+
+def test_window_per_group_after_where_matching_nothing(ticks):
+    result = (
+        ticks.select(total=Column("qty").cumsum(), avg=Column("px").rolling(2).mean())
+        .by("sym")
+        .where(Column("qty") > 100)
+        .execute()
+    )
+
+    assert len(result) == 0
+    assert result.dtypes == {"sym": "SYMBOL", "total": "I64", "avg": "F64"}
+
+    moves = ticks.select(moves=Column("px").diff().sum()).by("sym").where(Column("qty") > 100)
+    assert moves.execute().dtypes == {"sym": "SYMBOL", "moves": "F64"}
+
+
+def test_window_reads_back_only_the_columns_it_needs(ticks, monkeypatch):
+    from rayforce.types.table import SelectQuery
+
+    projections = []
+    run = SelectQuery._run
+
+    def recording(self, *args, **kwargs):
+        projections.append(self._select_cols)
+        return run(self, *args, **kwargs)
+
+    monkeypatch.setattr(SelectQuery, "_run", recording)
+    result = ticks.select(total=Column("qty").cumsum()).by("sym").execute()
+
+    # The filtered read carries the group key and the window input, not `px`.
+    _, (carried, computed), _ = projections
+    assert carried == ("sym",)
+    assert set(computed) == {"__window_src_0", "__window_key_0"}
+    assert_column_values(result, "total", [1, 5, 3, 10, 6, 10])
+
+
+def test_ema(ticks):
+    result = ticks.select(smooth=Column("px").ema(0.5)).by("sym").execute()
+
+    assert result["smooth"].to_list() == pytest.approx([1.0, 10.0, 1.5, 15.0, 2.75, 5.375])
+
+
+def test_nested_windows(ticks):
+    result = ticks.select(x=Column("qty").cumsum().diff()).execute()
+
+    assert result["x"].to_list() == [None, 5, 2, 5, 3, 4]
+
+
+def test_window_rejects_bad_arguments(ticks):
+    with pytest.raises(errors.RayforceValueError):
+        Column("px").rolling(0)
+    with pytest.raises(errors.RayforceValueError):
+        Column("px").ema(1.5)
+    with pytest.raises(errors.RayforceTypeError):
+        ticks.select(x=Column("sym").cumsum()).execute()
+
+
+def test_window_outside_select_does_not_compile(ticks):
+    with pytest.raises(errors.RayforceQueryCompilationError):
+        ticks.update(px=Column("px").cumsum()).execute()
@@ -218,6 +218,12 @@ def test_order_by_desc(sqlglot, sample_table):
     assert_column_sorted(result, "age", desc=True)
 
 
+def test_order_by_mixed_directions(sqlglot, sample_table):
+    result = sample_table.sql("SELECT name, dept, age FROM self ORDER BY dept ASC, age DESC")
+    assert_column_values(result, "dept", ["eng", "eng", "eng", "sales", "sales"])
+    assert_column_values(result, "age", [35, 32, 25, 30, 28])
+
+
 # ---------------------------------------------------------------------------
 # Arithmetic expression tests
 # ---------------------------------------------------------------------------
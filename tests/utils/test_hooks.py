@@ -0,0 +1,116 @@
+"""Tests for rayforce.utils.hooks (eval hooks and the slow-query log)."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from rayforce import (
+    I64,
+    EvalEvent,
+    List,
+    Operation,
+    add_eval_hook,
+    enable_slow_query_log,
+    errors,
+    eval_obj,
+    eval_str,
+    remove_eval_hook,
+)
+from rayforce import _rayforce_c as r
+
+
+@pytest.fixture
+def events():
+    seen: list[EvalEvent] = []
+    hook = add_eval_hook(seen.append)
+    yield seen
+    remove_eval_hook(hook)
+
+
+def test_hook_receives_eval_str(events):
+    assert eval_str("(+ 1 2)") == 3
+
+    [event] = events
+    assert event.expr == "(+ 1 2)"
+    assert event.text == "(+ 1 2)"
+    assert event.duration >= 0
+    assert event.result_type == -r.TYPE_I64
+    assert event.error is None
+
+
+def test_hook_receives_eval_obj(events):
+    eval_obj(List([Operation.TIL, I64(4)]))
+
+    [event] = events
+    assert isinstance(event.expr, r.RayObject)
+    assert event.result_type == r.TYPE_I64
+    assert event.result_size == 4
+    assert "til" in event.text
+
+
+def test_hook_receives_errors(events):
+    with pytest.raises(errors.RayforceError):
+        eval_str("(+ 1 'a)")
+
+    [event] = events
+    assert isinstance(event.error, errors.RayforceError)
+    assert event.result_type is None
+
+
+def test_removed_hook_is_not_called(events):
+    calls = []
+    hook = add_eval_hook(calls.append)
+    remove_eval_hook(hook)
+    eval_str("(+ 1 2)")
+    assert calls == []
+
+
+def test_failing_hook_does_not_break_evaluation():
+    def broken(event):
+        raise RuntimeError("boom")
+
+    add_eval_hook(broken)
+    try:
+        assert eval_str("(+ 1 2)") == 3
+    finally:
+        remove_eval_hook(broken)
+
+
+def test_hook_that_runs_a_query_is_not_reentered(events):
+    nested = []
+
+    def querying(event):
+        nested.append(eval_str("(+ 2 2)"))
+
+    add_eval_hook(querying)
+    try:
+        assert eval_str("(+ 1 2)") == 3
+        assert eval_str("(+ 3 4)") == 7
+    finally:
+        remove_eval_hook(querying)
+
+    assert nested == [4, 4]
+    assert [event.expr for event in events] == ["(+ 1 2)", "(+ 3 4)"]
+
+
+def test_slow_query_log(caplog):
+    hook = enable_slow_query_log(0.0)
+    try:
+        with caplog.at_level(logging.WARNING, logger="rayforce.slow_query"):
+            eval_str("(+ 1 2)")
+    finally:
+        remove_eval_hook(hook)
+    assert "(+ 1 2)" in caplog.text
+
+
+def test_slow_query_log_threshold_and_sampling(caplog):
+    hooks = [enable_slow_query_log(3600.0), enable_slow_query_log(0.0, sample_rate=0.0)]
+    try:
+        with caplog.at_level(logging.WARNING, logger="rayforce.slow_query"):
+            eval_str("(+ 1 2)")
+    finally:
+        for hook in hooks:
+            remove_eval_hook(hook)
+    assert caplog.text == ""
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from rayforce import errors
+from rayforce.utils import HyperLogLog, QuantileSketch
+
+
+def test_hyperloglog_estimate_and_merge():
+    left = HyperLogLog()
+    left.update(np.arange(0, 60_000))
+    right = HyperLogLog()
+    right.update(np.arange(30_000, 90_000))
+
+    assert left.estimate() == pytest.approx(60_000, rel=0.05)
+    assert left.merge(right).estimate() == pytest.approx(90_000, rel=0.05)
+
+
+def test_hyperloglog_small_counts_and_strings():
+    sketch = HyperLogLog()
+    sketch.update(np.array(["a", "b", "c", "a"]))
+
+    assert sketch.estimate() == 3
+    assert HyperLogLog.from_bytes(sketch.to_bytes()).estimate() == 3
+
+
+def test_hyperloglog_grouped():
+    values = np.arange(1000)
+    sketches = HyperLogLog.grouped(values, values % 2, 2)
+
+    assert [s.estimate() for s in sketches] == [pytest.approx(500, rel=0.05)] * 2
+
+
+def test_hyperloglog_rejects_mismatched_precision():
+    with pytest.raises(errors.RayforceValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))
+    with pytest.raises(errors.RayforceValueError):
+        HyperLogLog(30)
+
+
+def test_quantile_sketch_relative_accuracy():
+    values = np.random.default_rng(0).lognormal(size=20_000)
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    sketch.update(values)
+
+    for q in (0.0, 0.5, 0.95, 0.99, 1.0):
+        exact = np.quantile(values, q, method="lower")
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.0101)
+
+
+def test_quantile_sketch_merge_matches_single_pass():
+    values = np.random.default_rng(1).normal(size=10_000)
+    whole = QuantileSketch()
+    whole.update(values)
+    left, right = QuantileSketch(), QuantileSketch()
+    left.update(values[:4000])
+    right.update(values[4000:])
+
+    merged = QuantileSketch.from_bytes(left.merge(right).to_bytes())
+    assert merged.count == whole.count == 10_000
+    assert merged.quantile(0.25) == whole.quantile(0.25)
+
+
+def test_quantile_sketch_empty_and_invalid():
+    assert QuantileSketch().quantile(0.5) is None
+    with pytest.raises(errors.RayforceValueError):
+        QuantileSketch().quantile(1.5)
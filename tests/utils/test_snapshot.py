@@ -0,0 +1,38 @@
+"""Tests for rayforce.utils.snapshot (snapshot_env, restore_env)."""
+
+from __future__ import annotations
+
+import pytest
+
+from rayforce import Table, errors, eval_str, restore_env, snapshot_env
+
+
+def test_snapshot_env_round_trip(tmp_path):
+    Table({"id": [1, 2, 3], "px": [1.5, 2.5, 3.5]}).save("snap_trades")
+    eval_str("(set snap_limit 42)")
+    eval_str("(set snap_double (fn [x] (* x 2)))")
+    eval_str("(set __snap_internal 1)")
+    path = tmp_path / "env.snap"
+
+    saved = snapshot_env(path)
+    assert {"snap_trades", "snap_limit", "snap_double"} <= set(saved)
+    assert not any(name.startswith((".", "__")) for name in saved)
+
+    eval_str("(set snap_limit 0)")
+    eval_str("(set snap_trades 0)")
+    restored = restore_env(path)
+
+    assert set(restored) == set(saved)
+    assert eval_str("snap_limit") == 42
+    assert eval_str("(snap_double 21)") == 42
+    table = Table("snap_trades").select("*").execute()
+    assert [c.value for c in table.columns()] == ["id", "px"]
+    assert [v.value for v in table["id"]] == [1, 2, 3]
+
+
+def test_restore_env_rejects_non_env_snapshot(tmp_path):
+    path = tmp_path / "table.snap"
+    Table({"id": [1]}).dump(str(path))
+
+    with pytest.raises(errors.RayforceTypeError):
+        restore_env(path)